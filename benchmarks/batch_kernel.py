@@ -0,0 +1,52 @@
+"""Compare batched move generation against one BitBoard call per position.
+
+Usage: ``python benchmarks/batch_kernel.py [POSITIONS]``
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from array import array
+
+from othello import kernel
+from othello.board import BitBoard
+
+
+def random_positions(count: int, seed: int = 0) -> list[tuple[int, int]]:
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(count):
+        cells = rng.getrandbits(64)
+        colours = rng.getrandbits(64)
+        positions.append((cells & colours, cells & ~colours))
+    return positions
+
+
+def timed(label: str, count: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s  {count / elapsed / 1e6:7.2f} M positions/s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    positions = random_positions(count)
+    packed = kernel.pack(positions)
+    board = BitBoard(0, 0)
+    print(f"{count} positions, NumPy available: {kernel.HAVE_NUMPY}")
+    timed("BitBoard.legal_moves loop", count, lambda: [board.legal_moves(p, o) for p, o in positions])
+    timed("batch_legal_moves fallback", count, lambda: kernel.batch_legal_moves(packed, False))
+    if kernel.HAVE_NUMPY:
+        timed("batch_legal_moves numpy", count, lambda: kernel.batch_legal_moves(packed, True))
+    legal = kernel.batch_legal_moves(packed)
+    moves = array("Q", [m & -m for m in legal])
+    timed("batch_apply", count, lambda: kernel.batch_apply(packed, moves))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Compare one choose_move call per game with batched AI turns.
+
+Usage: ``python benchmarks/batch_scheduler.py [GAMES] [LEVEL] [BATCH_SIZE] [MAX_WAIT]``
+
+``GAMES`` AI-vs-AI games are played to the end three ways: one
+``choose_move`` call per turn, one :func:`~othello.batching.choose_moves`
+call per round over all games, and a :class:`~othello.batching.BatchScheduler`
+fed either by one thread per game or by future callbacks (as an event-driven
+server would).  The report shows aggregate moves per second.
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello import kernel
+from othello.ai import choose_move
+from othello.batching import BatchScheduler, choose_moves
+from othello.game import Game
+
+
+def finished(game: Game) -> bool:
+    """Pass if needed and return whether neither side can move."""
+    if game.legal_moves():
+        return False
+    game.pass_turn()
+    return not game.legal_moves()
+
+
+def per_call(games: int, level: str) -> int:
+    moves = 0
+    for seed in range(games):
+        game, rng = Game(), random.Random(seed)
+        while not finished(game):
+            game.apply_move(choose_move(game.board, game.black_to_move, level=level, rng=rng))
+            moves += 1
+    return moves
+
+
+def per_round(games: int, level: str) -> int:
+    active = [(Game(), random.Random(seed)) for seed in range(games)]
+    moves = 0
+    while active:
+        active = [(game, rng) for game, rng in active if not finished(game)]
+        batch = [(game.board, game.black_to_move, level, rng) for game, rng in active]
+        for (game, _), move in zip(active, choose_moves(batch)):
+            game.apply_move(move)
+        moves += len(active)
+    return moves
+
+
+def scheduled(games: int, level: str, batch_size: int, max_wait: float) -> tuple[int, float]:
+    counts = [0] * games
+    with BatchScheduler(batch_size, max_wait) as scheduler:
+
+        def play(seed: int) -> None:
+            game, rng = Game(), random.Random(seed)
+            while not finished(game):
+                game.apply_move(scheduler.choose_move(game.board, game.black_to_move, level, rng))
+                counts[seed] += 1
+
+        threads = [threading.Thread(target=play, args=(seed,)) for seed in range(games)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return sum(counts), scheduler.requests / max(scheduler.batches, 1)
+
+
+def callbacks(games: int, level: str, batch_size: int, max_wait: float) -> tuple[int, float]:
+    counts = [0] * games
+    done = threading.Semaphore(0)
+    with BatchScheduler(batch_size, max_wait) as scheduler:
+
+        def turn(seed: int, game: Game, rng: random.Random) -> None:
+            if finished(game):
+                done.release()
+                return
+            future = scheduler.submit(game.board, game.black_to_move, level, rng)
+            future.add_done_callback(lambda f: moved(seed, game, rng, f.result()))
+
+        def moved(seed: int, game: Game, rng: random.Random, move: int) -> None:
+            game.apply_move(move)
+            counts[seed] += 1
+            turn(seed, game, rng)
+
+        for seed in range(games):
+            turn(seed, Game(), random.Random(seed))
+        for _ in range(games):
+            done.acquire()
+    return sum(counts), scheduler.requests / max(scheduler.batches, 1)
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    level = sys.argv[2] if len(sys.argv) > 2 else "expert"
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+    max_wait = float(sys.argv[4]) if len(sys.argv) > 4 else 0.002
+    print(f"{games} games, level {level}, NumPy available: {kernel.HAVE_NUMPY}")
+    for label, run in (
+        ("choose_move per turn", lambda: (per_call(games, level), 1.0)),
+        ("choose_moves per round", lambda: (per_round(games, level), float(games))),
+        ("BatchScheduler threads", lambda: scheduled(games, level, batch_size, max_wait)),
+        ("BatchScheduler callbacks", lambda: callbacks(games, level, batch_size, max_wait)),
+    ):
+        start = time.perf_counter()
+        moves, batch = run()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<26} {moves / elapsed:10,.0f} moves/s  (average batch {batch:.0f})")
+
+
+if __name__ == "__main__":
+    main()
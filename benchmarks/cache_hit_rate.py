@@ -0,0 +1,78 @@
+"""Measure move cache hit rates on recorded self-play games.
+
+Usage: ``python benchmarks/cache_hit_rate.py [GAMES] [LEVEL] [MAX_ENTRIES]``
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import choose_move
+from othello.board import set_move_cache
+from othello.cache import MoveCache
+from othello.game import Game
+
+
+def record_games(count: int, level: str, seed: int = 0) -> list[list[int]]:
+    """Play ``count`` AI self-play games and return their move lists."""
+    random.seed(seed)
+    games = []
+    for _ in range(count):
+        game = Game()
+        moves = []
+        while True:
+            move = choose_move(game.board, game.black_to_move, level=level)
+            if move == 0:
+                game.black_to_move = not game.black_to_move
+                if game.legal_moves() == 0:
+                    break
+                moves.append(0)
+                continue
+            game.apply_move(move)
+            moves.append(move)
+        games.append(moves)
+    return games
+
+
+def replay(games: list[list[int]], level: str) -> None:
+    """Replay ``games`` with the same calls the CLI makes each turn."""
+    for moves in games:
+        game = Game()
+        for move in moves:
+            game.legal_moves()
+            choose_move(game.board, game.black_to_move, level=level)
+            if move == 0:
+                game.black_to_move = not game.black_to_move
+                continue
+            game.apply_move(move)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    level = sys.argv[2] if len(sys.argv) > 2 else "hard"
+    max_entries = int(sys.argv[3]) if len(sys.argv) > 3 else 1 << 16
+    games = record_games(count, level)
+
+    set_move_cache(None)
+    start = time.perf_counter()
+    replay(games, level)
+    uncached = time.perf_counter() - start
+
+    cache = MoveCache(max_entries)
+    set_move_cache(cache)
+    start = time.perf_counter()
+    replay(games, level)
+    cached = time.perf_counter() - start
+    set_move_cache(None)
+
+    print(f"games={count} level={level} max_entries={max_entries}")
+    print(f"uncached {uncached:.3f}s  cached {cached:.3f}s")
+    for key, value in cache.stats().items():
+        print(f"{key}: {value:.3f}" if isinstance(value, float) else f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
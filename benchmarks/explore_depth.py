@@ -0,0 +1,59 @@
+"""Stream the game tree from the initial position and report memory use.
+
+Usage: ``python benchmarks/explore_depth.py [DEPTH] [OUTPUT] [--dedup N] [--workers N]``
+
+Nodes are written as binary records to ``OUTPUT`` (``os.devnull`` by
+default).  The report shows nodes per second and the peak resident memory
+of the process, which should not grow with the depth.
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.explore import export, export_parallel
+
+
+def peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return float("nan")
+    # Linux reports kilobytes, macOS bytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != "darwin" else peak / 1024 / 1024
+
+
+def option(args: list[str], name: str, default: int) -> int:
+    if name not in args:
+        return default
+    i = args.index(name)
+    value = int(args[i + 1])
+    del args[i : i + 2]
+    return value
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    dedup = option(args, "--dedup", 0)
+    workers = option(args, "--workers", 1)
+    depth = int(args[0]) if args else 8
+    output = args[1] if len(args) > 1 else os.devnull
+    start = time.perf_counter()
+    if workers > 1:
+        if output == os.devnull:
+            raise SystemExit("--workers needs an OUTPUT path for the part files")
+        count = sum(n for _, n in export_parallel(output, depth=depth, dedup=dedup, processes=workers))
+    else:
+        count = export(output, depth=depth, dedup=dedup)
+    elapsed = time.perf_counter() - start
+    print(
+        f"depth {depth}: {count:,} nodes in {elapsed:.1f}s ({count / elapsed:,.0f} nodes/s), "
+        f"peak RSS {peak_rss_mb():.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Fit ProbCut parameters from shallow and deep searches of self-play positions.
+
+Usage: ``python benchmarks/fit_probcut.py [POSITIONS] [DEPTH ...]``
+
+Positions are sampled from games with uniformly random moves.  One model is
+fitted per deep ``DEPTH`` (default 4 to 6) against the shallow depth the
+search pairs it with.  The printed mapping can be pasted into
+``DEFAULT_PROBCUT`` in ``othello/search.py``.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import random_playout
+from othello.board import BitBoard
+from othello.search import fit_probcut
+
+
+def sample_positions(count: int, seed: int = 0) -> list[tuple[BitBoard, bool]]:
+    """Return ``count`` positions taken at random plies of random games."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        for board, black in random_playout(rng, plies=rng.randrange(4, 56)):
+            pass
+        player = board.black if black else board.white
+        opponent = board.white if black else board.black
+        if board.legal_moves(player, opponent):
+            positions.append((board, black))
+    return positions
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    depths = [int(arg) for arg in sys.argv[2:]] or [4, 5, 6]
+    positions = sample_positions(count)
+    start = time.perf_counter()
+    fitted = fit_probcut(positions, depths)
+    print(f"# {count} positions, depths {depths}, {time.perf_counter() - start:.1f}s")
+    print("DEFAULT_PROBCUT = {")
+    for pair, by_phase in fitted.items():
+        print(f"    {pair}: {{")
+        for phase, params in by_phase.items():
+            print(f'        "{phase}": {params!r},')
+        print("    },")
+    print("}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Compare journaling with rewriting the save file on every move.
+
+Usage: ``python benchmarks/journal_recovery.py [EVENTS ...] [--dir DIR]``
+
+For each event count a game is played and then kept busy with undo/redo
+pairs until that many events have been recorded.  The report shows the cost
+per event of ``save_state`` after every event (with ``fsync``), of the
+journal, and how long :func:`~othello.journal.recover` takes afterwards.
+Recovery time should stay flat as the event count grows.
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.game import Game, save_state
+from othello.journal import Journal, recover
+
+
+def events(count: int, seed: int = 0):
+    """Yield callables that each perform one game event."""
+    rng = random.Random(seed)
+    game = Game()
+    produced = 0
+    while produced < count:
+        legal = game.legal_moves()
+        if legal and len(game.history) < 40:
+            moves = [1 << i for i in range(64) if legal >> i & 1]
+            yield game, (lambda g, m=rng.choice(moves): g.apply_move(m))
+        elif produced % 2:
+            yield game, Game.redo
+        else:
+            yield game, Game.undo
+        produced += 1
+
+
+def rewrite(directory: str, count: int) -> float:
+    path = os.path.join(directory, "othello.sav")
+    start = time.perf_counter()
+    for game, event in events(count):
+        event(game)
+        save_state(game.board, game.black_to_move, path)
+        with open(path, "rb+") as f:
+            os.fsync(f.fileno())
+    return time.perf_counter() - start
+
+
+def journal(directory: str, count: int) -> tuple[float, float]:
+    path = os.path.join(directory, f"game-{count}")
+    log = Journal(path)
+    start = time.perf_counter()
+    for game, event in events(count):
+        if game.journal is None:
+            log.attach(game)
+        event(game)
+    log.close()
+    elapsed = time.perf_counter() - start
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        recover(path)
+        samples.append(time.perf_counter() - start)
+    return elapsed, statistics.median(samples)
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    directory = None
+    if "--dir" in args:
+        i = args.index("--dir")
+        directory = args[i + 1]
+        del args[i : i + 2]
+    counts = [int(a) for a in args] or [100, 1000, 10000]
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for count in counts:
+            rewritten = rewrite(tmp, count)
+            journaled, recovery = journal(tmp, count)
+            print(
+                f"{count:>7} events  rewrite {rewritten / count * 1e6:8.1f} us/event  "
+                f"journal {journaled / count * 1e6:8.1f} us/event  "
+                f"recover {recovery * 1000:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
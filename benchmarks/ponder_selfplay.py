@@ -0,0 +1,87 @@
+"""Measure search reuse and pondering over self-play games.
+
+Usage: ``python benchmarks/ponder_selfplay.py [GAMES] [DEPTH] [OPPONENT_SECONDS]``
+
+The measured engine plays black, searching each move to ``DEPTH``.  White is
+a depth-3 master search that then idles until ``OPPONENT_SECONDS`` have
+passed, like a human or remote opponent leaving the CPU free.  Three set-ups
+are compared: a fresh ``Searcher`` per move (stateless), one persistent
+``Engine``, and a persistent ``Engine`` that ponders on white's time.  The
+effective depth per second is the searched depth divided by black's own wall
+time per move.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import random_playout
+from othello.board import BitBoard
+from othello.engine import Engine
+from othello.search import Searcher
+
+
+def opening(seed: int, plies: int = 4) -> BitBoard:
+    for board, _ in random_playout(random.Random(seed), plies=plies):
+        pass
+    return board
+
+
+def play(mode: str, seed: int, depth: int, seconds: float, totals: dict) -> None:
+    engine = Engine(depth=depth)
+    white = Engine(depth=3)
+    board, black_to_move = opening(seed), True
+    passes = 0
+    while passes < 2:
+        player = board.black if black_to_move else board.white
+        opponent = board.white if black_to_move else board.black
+        if not board.legal_moves(player, opponent):
+            passes += 1
+            black_to_move = not black_to_move
+            continue
+        passes = 0
+        start = time.perf_counter()
+        if black_to_move:
+            if mode == "stateless":
+                move, _ = Searcher().search(board, True, depth)
+            else:
+                move = engine.choose_move(board, True)
+            totals["wall"] += time.perf_counter() - start
+            totals["depth"] += depth
+            totals["moves"] += 1
+        else:
+            if mode == "ponder":
+                engine.ponder(board, False)
+            move = white.choose_move(board, False)
+            time.sleep(max(0.0, seconds - (time.perf_counter() - start)))
+        board = board.apply_move(move, black_to_move)
+        black_to_move = not black_to_move
+    engine.stop()
+    totals["hits"] += engine.ponder_hits
+    totals["misses"] += engine.ponder_misses
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 0.5
+    print(f"{games} games, depth {depth}, opponent {seconds}s per move")
+    for mode in ("stateless", "persistent", "ponder"):
+        totals = dict(wall=0.0, depth=0, moves=0, hits=0, misses=0)
+        for seed in range(games):
+            play(mode, seed, depth, seconds, totals)
+        line = (
+            f"{mode:<11} {totals['wall'] / totals['moves'] * 1000:7.1f} ms/move  "
+            f"depth/s {totals['depth'] / totals['wall']:7.1f}"
+        )
+        if mode == "ponder":
+            predicted = totals["hits"] + totals["misses"]
+            line += f"  ponder hits {totals['hits']}/{predicted}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
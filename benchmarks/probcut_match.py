@@ -0,0 +1,79 @@
+"""Play a match between search with and without ProbCut at equal time.
+
+Usage: ``python benchmarks/probcut_match.py [PAIRS] [SECONDS_PER_MOVE] [THRESHOLD]``
+
+``THRESHOLD`` overrides the cut threshold of the opening and midgame phases.
+
+Each pair starts from the same random opening and is played twice with
+colours swapped.  The report lists the ProbCut side's results and the
+average depth each side completed per move.
+"""
+
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import random_playout
+from othello.board import BitBoard
+from othello.search import Searcher
+
+
+def random_opening(rng: random.Random, plies: int = 4) -> BitBoard:
+    for board, _ in random_playout(rng, plies=plies):
+        pass
+    return board
+
+
+def play(board: BitBoard, black: Searcher, white: Searcher, seconds: float, depths: dict) -> int:
+    """Play out ``board`` (black to move) and return black's disc margin."""
+    black_to_move = True
+    passed = False
+    while True:
+        searcher = black if black_to_move else white
+        move, _, depth = searcher.best_move(board, black_to_move, seconds)
+        if move == 0:
+            if passed:
+                break
+            passed = True
+        else:
+            passed = False
+            board = board.apply_move(move, black_to_move)
+            depths[searcher.probcut].append(depth)
+        black_to_move = not black_to_move
+    return board.black.bit_count() - board.white.bit_count()
+
+
+def main() -> None:
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    rng = random.Random(0)
+    selective, plain = Searcher(probcut=True), Searcher(probcut=False)
+    if len(sys.argv) > 3:
+        threshold = float(sys.argv[3])
+        selective.thresholds.update(opening=threshold, midgame=threshold)
+    depths = {True: [], False: []}
+    wins = losses = draws = 0
+    for _ in range(pairs):
+        opening = random_opening(rng)
+        for margin in (
+            play(opening, selective, plain, seconds, depths),
+            -play(opening, plain, selective, seconds, depths),
+        ):
+            if margin > 0:
+                wins += 1
+            elif margin < 0:
+                losses += 1
+            else:
+                draws += 1
+    games = wins + losses + draws
+    print(f"{games} games at {seconds}s/move: ProbCut +{wins} -{losses} ={draws}")
+    print(f"score {(wins + draws / 2) / games:.3f}")
+    for enabled, name in ((True, "probcut"), (False, "plain")):
+        samples = depths[enabled]
+        print(f"{name:<8} average depth {sum(samples) / len(samples):.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measure the results store with many recorded games.
+
+Usage: ``python benchmarks/ratings_store.py [GAMES] [PLAYERS] [--db PATH]``
+
+Synthetic results between random players are bulk-inserted, then single
+game inserts, leaderboard and per-player history queries are timed against
+the full database.  Without ``--db`` a temporary file is used.
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ratings import GameResult, RatingStore
+
+
+def results(games: int, players: int, seed: int = 0):
+    rng = random.Random(seed)
+    strength = [rng.gauss(0, 1) for _ in range(players)]
+    for i in range(games):
+        black, white = rng.sample(range(players), 2)
+        margin = int(8 * (strength[black] - strength[white]) + rng.gauss(0, 12))
+        b = max(0, min(64, 32 + margin))
+        yield GameResult(f"player{black}", f"player{white}", b, 64 - b, "", float(i))
+
+
+def timed(fn, repeat: int = 200) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    args = sys.argv[1:]
+    path = None
+    if "--db" in args:
+        i = args.index("--db")
+        path = args[i + 1]
+        del args[i : i + 2]
+    games = int(args[0]) if args else 1_000_000
+    players = int(args[1]) if len(args) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = path or os.path.join(tmp, "results.db")
+        with RatingStore(path) as store:
+            start = time.perf_counter()
+            store.record_games(results(games, players))
+            elapsed = time.perf_counter() - start
+            print(f"bulk insert  {games} games in {elapsed:.1f}s ({games / elapsed:,.0f} games/s)")
+            rng = random.Random(1)
+            names = [f"player{rng.randrange(players)}" for _ in range(200)]
+            print(f"record_game  {timed(lambda: store.record_game(rng.choice(names), rng.choice(names) + 'x', 40, 24), 100):.3f} ms")
+            print(f"top(10)      {timed(lambda: store.top(10)):.3f} ms")
+            print(f"top(100)     {timed(lambda: store.top(100)):.3f} ms")
+            print(f"history(20)  {timed(lambda: store.history(rng.choice(names))):.3f} ms")
+            print(f"player       {timed(lambda: store.player(rng.choice(names))):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
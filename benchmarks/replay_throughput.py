@@ -0,0 +1,55 @@
+"""Measure replay statistics throughput on random self-play records.
+
+Usage: ``python benchmarks/replay_throughput.py [GAMES] [PROCESSES]``
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import choose_move
+from othello.game import Game
+from othello.replay import collect_stats, format_record, game_record
+
+
+def random_records(count: int, seed: int = 0) -> list[str]:
+    """Return ``count`` transcripts of random self-play games."""
+    random.seed(seed)
+    records = []
+    for _ in range(count):
+        game = Game()
+        while True:
+            move = choose_move(game.board, game.black_to_move)
+            if move == 0:
+                game.black_to_move = not game.black_to_move
+                if game.legal_moves() == 0:
+                    break
+                continue
+            game.apply_move(move)
+        records.append(format_record(game_record(game)))
+    return records
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    records = random_records(count)
+    start = time.perf_counter()
+    stats = collect_stats(records, processes=processes)
+    elapsed = time.perf_counter() - start
+    plies = sum(stats.positions)
+    print(f"games={stats.games} plies={plies} processes={processes}")
+    print(f"{elapsed:.3f}s  {stats.games / elapsed:.0f} games/s  {plies / elapsed:.0f} plies/s")
+    for row in stats.summary()[::10]:
+        print(
+            f"ply {row['ply']:>2}: mobility {row['mobility']:5.2f}  "
+            f"discs {row['black_discs']:5.2f}/{row['white_discs']:5.2f}  "
+            f"corners {row['corner_rate']:.3f}  passes {row['pass_rate']:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Load test spectator fan-out with many simulated spectators.
+
+Usage: ``python benchmarks/spectator_load.py [SPECTATORS ...]``
+
+For each spectator count a random game is published move by move.  The
+report shows how long the game thread spent in ``publish`` per move (what
+the players feel) and how long it took until every spectator saw the end.
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.board import format_move
+from othello.broadcast import Broadcaster
+from othello.game import Game
+
+
+def raise_fd_limit() -> None:
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def spectate(host: str, port: int, done: list) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    while True:
+        line = await reader.readline()
+        if not line or line.startswith(b"END"):
+            break
+    done.append(time.perf_counter())
+    writer.close()
+
+
+def run_spectators(address, count: int, connected: threading.Event, done: list) -> None:
+    async def main() -> None:
+        tasks = []
+        for _ in range(count):
+            tasks.append(asyncio.create_task(spectate(*address, done)))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.5)
+        connected.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def measure(count: int, seed: int = 0) -> None:
+    broadcaster = Broadcaster()
+    address = broadcaster.start()
+    connected = threading.Event()
+    done: list = []
+    thread = threading.Thread(target=run_spectators, args=(address, count, connected, done))
+    thread.start()
+    connected.wait()
+
+    rng = random.Random(seed)
+    game = Game()
+    latencies = []
+    while True:
+        legal = game.legal_moves()
+        if not legal:
+            game.black_to_move = not game.black_to_move
+            if not game.legal_moves():
+                break
+            start = time.perf_counter()
+            broadcaster.publish(game, "PASS")
+            latencies.append(time.perf_counter() - start)
+            continue
+        moves = [1 << i for i in range(64) if legal >> i & 1]
+        move = rng.choice(moves)
+        game.apply_move(move)
+        start = time.perf_counter()
+        broadcaster.publish(game, f"MOVE {format_move(move)}")
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    end = time.perf_counter()
+    broadcaster.publish(game, "END 0 0")
+    thread.join(timeout=60)
+    connected_count = broadcaster.spectators
+    broadcaster.stop()
+    delivered = (max(done) - end) * 1000 if done else float("nan")
+    print(
+        f"{count:>6} spectators: publish median {statistics.median(latencies) * 1e6:7.1f}us "
+        f"max {max(latencies) * 1e6:8.1f}us  all ENDs after {delivered:7.1f}ms  "
+        f"finished {len(done)}/{count} resyncs {broadcaster.resyncs} dropped {broadcaster.dropped} "
+        f"(connected at end {connected_count})"
+    )
+
+
+def main() -> None:
+    raise_fd_limit()
+    counts = [int(a) for a in sys.argv[1:]] or [0, 10, 100, 1000, 3000]
+    for count in counts:
+        measure(count)
+
+
+if __name__ == "__main__":
+    main()
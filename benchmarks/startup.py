@@ -0,0 +1,75 @@
+"""Track import time and cold-start latency of the othello entry points.
+
+Usage: ``python benchmarks/startup.py [RUNS]``
+
+The first table lists the slowest modules reported by
+``python -X importtime -c "import othello.cli"``; the second reports the
+median wall time of fresh interpreter runs for each CLI mode.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+ENV = {**os.environ, "PYTHONPATH": SRC}
+
+# Each scenario runs to completion without a human at the keyboard.
+SCENARIOS = {
+    "help": (["--help"], ""),
+    "local-quit": ([], "q\n"),
+    "ai-vs-ai-timeout": (["--ai-vs-ai", "--time-limit", "0"], ""),
+    "ai-quit": (["--ai", "--ai-level", "expert"], "q\n"),
+}
+
+
+def import_times(module: str = "othello.cli", top: int = 10) -> list[tuple[int, str]]:
+    """Return the ``top`` modules by cumulative import time in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=ENV,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        rows.append((int(fields[1]), fields[2].strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def cold_start(args: list[str], stdin: str, runs: int) -> float:
+    """Return the median wall time in seconds of ``runs`` fresh CLI runs."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "othello.cli", *args],
+            input=stdin,
+            capture_output=True,
+            text=True,
+            env=ENV,
+        )
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("cumulative import time (us)")
+    for micros, name in import_times():
+        print(f"{micros:>10}  {name}")
+    print()
+    print(f"cold start, median of {runs} runs")
+    for name, (args, stdin) in SCENARIOS.items():
+        print(f"{name:<18} {cold_start(args, stdin, runs) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Build an endgame tablebase from self-play and time lookups against search.
+
+Usage: ``python benchmarks/tablebase.py [GAMES] [EMPTIES] [WORKERS]``
+
+The corpus is ``GAMES`` seeded self-play games mixing the easy and expert
+levels.  The report shows build throughput, the time to open the table and
+the median time of a lookup compared with solving the same position.
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import choose_move
+from othello.game import Game
+from othello.replay import format_record, game_record, parse_record, replay
+from othello.search import Searcher
+from othello.tablebase import Tablebase, build
+
+
+def corpus(games: int) -> list[str]:
+    records = []
+    for seed in range(games):
+        rng = random.Random(seed)
+        level = "expert" if seed % 2 else "easy"
+        game = Game()
+        while True:
+            move = choose_move(game.board, game.black_to_move, level=level, rng=rng)
+            if move == 0:
+                game.pass_turn()
+                if game.legal_moves() == 0:
+                    break
+                continue
+            game.apply_move(move)
+        records.append(format_record(game_record(game)))
+    return records
+
+
+def main() -> None:
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    empties = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else os.cpu_count() or 1
+    records = corpus(games)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "endgame.tb")
+        stats = build(records, path, empties, workers)
+        print(
+            f"build  {stats.positions} positions from {stats.games} games, {workers} workers: "
+            f"{stats.seconds:.1f}s, {stats.positions_per_second:,.1f} positions/s, "
+            f"{stats.nodes_per_second:,.0f} nodes/s, {os.path.getsize(path):,} bytes"
+        )
+        start = time.perf_counter()
+        table = Tablebase(path)
+        print(f"open   {(time.perf_counter() - start) * 1e6:.0f} us")
+        positions = [
+            (board, black)
+            for record in records
+            for board, black, _, _, _ in replay(parse_record(record))
+            if board.empty().bit_count() <= empties
+        ]
+        lookups, solves = [], []
+        for board, black in positions[:: max(1, len(positions) // 200)]:
+            start = time.perf_counter()
+            table.lookup(board, black)
+            lookups.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            Searcher(probcut=False).search(board, black, board.empty().bit_count())
+            solves.append(time.perf_counter() - start)
+        print(f"lookup {statistics.median(lookups) * 1e6:8.1f} us (median)")
+        print(f"solve  {statistics.median(solves) * 1e6:8.1f} us (median)")
+        table.close()
+
+
+if __name__ == "__main__":
+    main()
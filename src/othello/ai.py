@@ -1,43 +1,15 @@
+from __future__ import annotations
 import random
-from .board import BitBoard
-
-# Positional weights used for the evaluation function. Corners are highly
-# valued while squares adjacent to corners are penalised. The values were
-# chosen heuristically.
-_WEIGHTS = [
-    100, -20, 10, 5, 5, 10, -20, 100,
-    -20, -50, -2, -2, -2, -2, -50, -20,
-    10, -2, 5, 1, 1, 5, -2, 10,
-    5, -2, 1, 0, 0, 1, -2, 5,
-    5, -2, 1, 0, 0, 1, -2, 5,
-    10, -2, 5, 1, 1, 5, -2, 10,
-    -20, -50, -2, -2, -2, -2, -50, -20,
-    100, -20, 10, 5, 5, 10, -20, 100,
-]
-
-
-def _evaluate(board: BitBoard) -> int:
-    """Return a positional evaluation of ``board`` from black's perspective."""
-
-    score = 0
-    bb = board.black
-    while bb:
-        lsb = bb & -bb
-        idx = lsb.bit_length() - 1
-        score += _WEIGHTS[63 - idx]
-        bb ^= lsb
+from typing import Iterator
 
-    bb = board.white
-    while bb:
-        lsb = bb & -bb
-        idx = lsb.bit_length() - 1
-        score -= _WEIGHTS[63 - idx]
-        bb ^= lsb
+from .board import BOARD_SIZE, BitBoard
+from .evaluate import evaluate
 
-    return score
+# Search depth used by the ``"master"`` level.
+MASTER_DEPTH = 4
 
 
-def _random_move(mask: int) -> int:
+def _random_move(mask: int, rng=random) -> int:
     """Return a random set bit from ``mask``."""
     moves = []
     bb = mask
@@ -45,17 +17,57 @@ def _random_move(mask: int) -> int:
         lsb = bb & -bb
         moves.append(lsb)
         bb ^= lsb
-    return random.choice(moves)
+    return rng.choice(moves)
+
 
+def random_playout(
+    rng=random,
+    board: BitBoard | None = None,
+    black_to_move: bool = True,
+    plies: int | None = None,
+) -> Iterator[tuple[BitBoard, bool]]:
+    """Yield the positions of a game played with uniformly random moves.
 
-def choose_move(board: BitBoard, black_to_move: bool, level: str = "easy") -> int:
+    The first position is ``board`` itself.  A pass counts as a ply; the
+    playout ends after ``plies`` plies or when neither side can move.
+    """
+    if board is None:
+        board = BitBoard.initial(BOARD_SIZE)
+    yield board, black_to_move
+    ply = 0
+    while plies is None or ply < plies:
+        player = board.black if black_to_move else board.white
+        opponent = board.white if black_to_move else board.black
+        legal = board.legal_moves(player, opponent)
+        if legal:
+            board = board.apply_move(_random_move(legal, rng), black_to_move)
+        elif not board.legal_moves(opponent, player):
+            return
+        black_to_move = not black_to_move
+        ply += 1
+        yield board, black_to_move
+
+
+def choose_move(
+    board: BitBoard,
+    black_to_move: bool,
+    level: str = "easy",
+    rng: random.Random | None = None,
+) -> int:
     """Return a legal move for the current player.
 
     ``level`` controls the difficulty:
     ``"easy"`` picks a random move,
-    ``"hard"`` chooses the move that flips the most discs, and
-    ``"expert"`` uses a positional evaluation (breaking ties randomly).
+    ``"hard"`` chooses the move that flips the most discs,
+    ``"expert"`` uses a positional evaluation (breaking ties randomly), and
+    ``"master"`` runs an alpha-beta search, unless the position
+    is in the tablebase registered with :func:`othello.tablebase.set_tablebase`.
+
+    Random choices are drawn from ``rng`` so that games can be reproduced;
+    without it the global :mod:`random` state is used.
     """
+    if rng is None:
+        rng = random
 
     player = board.black if black_to_move else board.white
     opponent = board.white if black_to_move else board.black
@@ -77,7 +89,7 @@ def choose_move(board: BitBoard, black_to_move: bool, level: str = "easy") -> in
             elif count == max_flips:
                 best_moves.append(lsb)
             bb ^= lsb
-        return random.choice(best_moves)
+        return rng.choice(best_moves)
 
     if level == "expert":
         best_score = None
@@ -86,7 +98,7 @@ def choose_move(board: BitBoard, black_to_move: bool, level: str = "easy") -> in
         while bb:
             lsb = bb & -bb
             next_board = board.apply_move(lsb, black_to_move)
-            score = _evaluate(next_board)
+            score = evaluate(next_board)
             if not black_to_move:
                 score = -score
             if best_score is None or score > best_score:
@@ -95,6 +107,17 @@ def choose_move(board: BitBoard, black_to_move: bool, level: str = "easy") -> in
             elif score == best_score:
                 best_moves.append(lsb)
             bb ^= lsb
-        return random.choice(best_moves)
+        return rng.choice(best_moves)
+
+    if level == "master":
+        from .search import Searcher
+        from .tablebase import lookup
+
+        solved = lookup(board, black_to_move)
+        if solved is not None:
+            return solved[1]
+
+        move, _ = Searcher().search(board, black_to_move, MASTER_DEPTH)
+        return move
 
-    return _random_move(legal)
+    return _random_move(legal, rng)
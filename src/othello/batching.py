@@ -0,0 +1,230 @@
+"""Answer AI turns from many games in batches.
+
+A server running many games calls :func:`~othello.ai.choose_move` once per
+AI turn, and for the cheap levels most of that time is interpreter overhead.
+:func:`choose_moves` answers a whole list of turns at once with the batched
+kernel: one pass generates every position's legal moves, one pass expands
+them into candidate moves and one pass scores all candidates (flip counts
+for ``"hard"``, positional evaluation after the move for ``"expert"``).
+
+:class:`BatchScheduler` collects turns submitted from any number of game
+threads and hands them to :func:`choose_moves` once ``batch_size`` turns are
+waiting or the oldest has waited ``max_wait`` seconds.
+
+Moves are the same as :func:`~othello.ai.choose_move` would return with the
+same ``rng``: candidates are considered in the same order and ties are
+broken with one ``rng.choice`` call.  ``"master"`` and boards other than
+8x8 are passed on to :func:`~othello.ai.choose_move` unchanged.
+"""
+
+from __future__ import annotations
+import random
+import threading
+import time
+from array import array
+from concurrent.futures import Future
+from typing import Optional, Sequence, Tuple
+
+from . import kernel
+from .ai import _random_move, choose_move
+from .board import BOARD_SIZE, BitBoard
+
+BATCH_LEVELS = ("easy", "hard", "expert")
+
+Request = Tuple[BitBoard, bool, str, Optional[random.Random]]
+
+
+def choose_moves(requests: Sequence[Request], use_numpy: bool | None = None) -> list[int]:
+    """Return a move for every ``(board, black_to_move, level, rng)`` request."""
+    results = [0] * len(requests)
+    batched = []
+    for i, (board, black_to_move, level, rng) in enumerate(requests):
+        if board.size != BOARD_SIZE or level not in BATCH_LEVELS:
+            results[i] = choose_move(board, black_to_move, level=level, rng=rng)
+        else:
+            batched.append(i)
+    if not batched:
+        return results
+
+    packed = kernel.pack(
+        (board.black, board.white) if black_to_move else (board.white, board.black)
+        for board, black_to_move, _, _ in (requests[i] for i in batched)
+    )
+    legal = kernel.batch_legal_moves(packed, use_numpy)
+    scored = [k for k, i in enumerate(batched) if legal[k] and requests[i][2] != "easy"]
+    best = _best_moves(packed, legal, scored, [requests[batched[k]][2] for k in scored], use_numpy)
+
+    for k, i in enumerate(batched):
+        mask = legal[k]
+        if not mask:
+            continue
+        rng = requests[i][3] or random
+        moves = best.get(k)
+        results[i] = rng.choice(moves) if moves is not None else _random_move(mask, rng)
+    return results
+
+
+def _best_moves(
+    packed, legal, scored: list[int], levels: list[str], use_numpy: bool | None
+) -> dict[int, list[int]]:
+    """Return the best-scoring candidate moves of every position in ``scored``."""
+    if not scored:
+        return {}
+    sub_packed = array("Q")
+    sub_legal = array("Q")
+    for k in scored:
+        sub_packed.append(packed[2 * k])
+        sub_packed.append(packed[2 * k + 1])
+        sub_legal.append(legal[k])
+    index, positions, moves = kernel.batch_expand(sub_packed, sub_legal, use_numpy)
+
+    hard = [level == "hard" for level in levels]
+    if all(hard):
+        scores = _flip_counts(positions, moves, use_numpy)
+    elif not any(hard):
+        scores = _positional_scores(positions, moves, use_numpy)
+    else:
+        flip_counts = _flip_counts(positions, moves, use_numpy)
+        positional_scores = _positional_scores(positions, moves, use_numpy)
+        scores = [
+            flip_counts[j] if hard[index[j]] else positional_scores[j]
+            for j in range(len(moves))
+        ]
+
+    # Candidates of one position are contiguous; their count is its mobility.
+    best: dict[int, list[int]] = {}
+    start = 0
+    for k, count in zip(scored, kernel.batch_popcount(sub_legal, use_numpy)):
+        end = start + count
+        segment = scores[start:end]
+        top = max(segment)
+        best[k] = [move for move, score in zip(moves[start:end], segment) if score == top]
+        start = end
+    return best
+
+
+def _flip_counts(positions, moves, use_numpy: bool | None):
+    return kernel.batch_popcount(kernel.batch_flips(positions, moves, use_numpy), use_numpy)
+
+
+def _positional_scores(positions, moves, use_numpy: bool | None):
+    after = kernel.batch_apply(positions, moves, use_numpy)
+    # ``after`` is seen from the opponent, so the mover is the second entry.
+    mover = kernel.batch_positional(after[1::2], use_numpy)
+    other = kernel.batch_positional(after[0::2], use_numpy)
+    return [a - b for a, b in zip(mover, other)]
+
+
+class BatchScheduler:
+    """Collect AI turns from many games and answer them in batches.
+
+    :meth:`submit` may be called from any thread and returns a
+    :class:`~concurrent.futures.Future` for the move.  A batch is processed
+    as soon as ``batch_size`` turns are waiting or the oldest waiting turn
+    is ``max_wait`` seconds old.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        max_wait: float = 0.002,
+        use_numpy: bool | None = None,
+    ) -> None:
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.use_numpy = use_numpy
+        self.batches = 0
+        self.requests = 0
+        self._pending: list[tuple[float, Request, Future]] = []
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="othello-batch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Answer the turns still waiting and stop the worker thread."""
+        thread = self._thread
+        if thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "BatchScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def submit(
+        self,
+        board: BitBoard,
+        black_to_move: bool,
+        level: str = "easy",
+        rng: random.Random | None = None,
+    ) -> Future:
+        """Queue one AI turn and return a future resolving to its move.
+
+        Raises ``RuntimeError`` if the scheduler is not running or stopping.
+        """
+        future: Future = Future()
+        with self._cond:
+            # Once stopping, the worker may already have taken its last batch.
+            if self._thread is None or self._stopping:
+                raise RuntimeError("BatchScheduler is not running")
+            self._pending.append((time.monotonic(), (board, black_to_move, level, rng), future))
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._cond.notify()
+        return future
+
+    def choose_move(
+        self,
+        board: BitBoard,
+        black_to_move: bool,
+        level: str = "easy",
+        rng: random.Random | None = None,
+    ) -> int:
+        """Submit one turn and wait for its move."""
+        return self.submit(board, black_to_move, level, rng).result()
+
+    def _next_batch(self) -> list[tuple[float, Request, Future]] | None:
+        with self._cond:
+            while not self._pending:
+                if self._stopping:
+                    return None
+                self._cond.wait()
+            deadline = self._pending[0][0] + self.max_wait
+            while len(self._pending) < self.batch_size and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._pending[: self.batch_size]
+            del self._pending[: self.batch_size]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                moves = choose_moves([request for _, request, _ in batch], self.use_numpy)
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.requests += len(batch)
+            for (_, _, future), move in zip(batch, moves):
+                future.set_result(move)
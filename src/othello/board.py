@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
+
+from .cache import MoveCache
 
 # Board constants
 BOARD_SIZE = 8
 TOTAL_SQUARES = BOARD_SIZE * BOARD_SIZE
+MIN_BOARD_SIZE = 4
+MAX_BOARD_SIZE = 16
 
 # Direction shifts for bitboard operations
 DIRS = {
@@ -19,47 +24,143 @@ DIRS = {
     'SW': -7,
 }
 
-# Masks to handle wrapping on edges
-NOT_A_FILE = int(0xfefefefefefefefe)
-NOT_H_FILE = int(0x7f7f7f7f7f7f7f7f)
+# Masks to handle wrapping on edges. Square a1 is the most significant bit,
+# so the A file occupies bit 7 of every byte and the H file bit 0.
+NOT_A_FILE = int(0x7f7f7f7f7f7f7f7f)
+NOT_H_FILE = int(0xfefefefefefefefe)
+
+
+@dataclass(frozen=True)
+class Geometry:
+    """Precomputed shift amounts and wrap masks for a square board.
+
+    ``directions`` holds one ``(shift, mask)`` pair per compass direction.
+    Positive shifts move bits left (towards a1), negative shifts move them
+    right, and ``mask`` removes bits that wrapped around an edge or fell off
+    the board.
+    """
+
+    size: int
+    total: int
+    full: int
+    directions: tuple[tuple[int, int], ...]
+
+    @property
+    def runs(self) -> int:
+        """Return how many extra fill steps cover the longest flippable line."""
+        return self.size - 3
+
+
+@lru_cache(maxsize=None)
+def board_geometry(size: int = BOARD_SIZE) -> Geometry:
+    """Return the :class:`Geometry` for a ``size`` x ``size`` board."""
+    if size % 2 or not MIN_BOARD_SIZE <= size <= MAX_BOARD_SIZE:
+        raise ValueError(
+            f"Board size must be even and between {MIN_BOARD_SIZE} and {MAX_BOARD_SIZE}"
+        )
+    total = size * size
+    full = (1 << total) - 1
+    a_file = h_file = 0
+    for row in range(size):
+        a_file |= 1 << (total - 1 - row * size)
+        h_file |= 1 << (total - size - row * size)
+    not_a = full & ~a_file
+    not_h = full & ~h_file
+    directions = (
+        (size, full),  # N
+        (-size, full),  # S
+        (-1, not_a),  # E
+        (1, not_h),  # W
+        (size - 1, not_a),  # NE
+        (size + 1, not_h),  # NW
+        (-size - 1, not_a),  # SE
+        (-size + 1, not_h),  # SW
+    )
+    return Geometry(size, total, full, directions)
+
+
+# Optional memo cache shared by all boards, see ``set_move_cache``.
+_move_cache: MoveCache | None = None
+
+
+def set_move_cache(cache: MoveCache | None) -> MoveCache | None:
+    """Install ``cache`` for legal-move and flip lookups.
+
+    Passing ``None`` disables caching.  The previously installed cache is
+    returned so callers can restore it afterwards.
+    """
+    global _move_cache
+    previous = _move_cache
+    _move_cache = cache
+    return previous
+
+
+def get_move_cache() -> MoveCache | None:
+    """Return the currently installed move cache, if any."""
+    return _move_cache
 
 @dataclass(frozen=True)
 class BitBoard:
-    """Othello board encoded as two 64-bit integers for black and white."""
+    """Othello board encoded as two integers for black and white.
+
+    The standard board is 8x8 and fits in 64 bits; other even sizes up to
+    16x16 use the same layout with ``size * size`` bits.
+    """
 
     black: int
     white: int
+    size: int = BOARD_SIZE
 
     @staticmethod
-    def initial() -> "BitBoard":
+    def initial(size: int = BOARD_SIZE) -> "BitBoard":
         """Return a board in the standard initial Othello setup."""
-        black = 0x0000000810000000
-        white = 0x0000001008000000
-        return BitBoard(black, white)
+        if size == BOARD_SIZE:
+            black = 0x0000000810000000
+            white = 0x0000001008000000
+            return BitBoard(black, white)
+        total = board_geometry(size).total
+        mid = size // 2
+
+        def bit(r: int, c: int) -> int:
+            return 1 << (total - 1 - (r * size + c))
+
+        black = bit(mid - 1, mid) | bit(mid, mid - 1)
+        white = bit(mid - 1, mid - 1) | bit(mid, mid)
+        return BitBoard(black, white, size)
 
     @staticmethod
     def from_ascii(board_str: str) -> "BitBoard":
         """Create a board from an ASCII diagram.
 
-        The diagram should consist of 8 lines of 8 characters using
+        The diagram should consist of N lines of N characters using
         ``B`` for black, ``W`` for white and ``.`` for empty squares.
+        The board size is taken from the number of lines.
         """
         lines = [line.strip() for line in board_str.strip().splitlines()]
-        if len(lines) != BOARD_SIZE:
-            raise ValueError("Board diagram must have 8 lines")
+        size = len(lines)
+        total = board_geometry(size).total
         black = white = 0
         for r, line in enumerate(lines):
-            if len(line) != BOARD_SIZE:
-                raise ValueError("Each line in board diagram must have 8 characters")
+            if len(line) != size:
+                raise ValueError(
+                    f"Each line in board diagram must have {size} characters"
+                )
             for c, ch in enumerate(line):
-                bit = 1 << (TOTAL_SQUARES - 1 - (r * BOARD_SIZE + c))
+                bit = 1 << (total - 1 - (r * size + c))
                 if ch == "B":
                     black |= bit
                 elif ch == "W":
                     white |= bit
                 elif ch != ".":
                     raise ValueError(f"Invalid character '{ch}' in board diagram")
-        return BitBoard(black, white)
+        return BitBoard(black, white, size)
+
+    @property
+    def geometry(self) -> Geometry:
+        """Return the precomputed geometry for this board's size."""
+        if self.size == BOARD_SIZE:
+            return _GEOMETRY_8
+        return board_geometry(self.size)
 
     def occupied(self) -> int:
         """Return a bitboard with all occupied squares."""
@@ -67,48 +168,69 @@ class BitBoard:
 
     def empty(self) -> int:
         """Return a bitboard with all empty squares."""
-        return ~self.occupied() & ((1 << TOTAL_SQUARES) - 1)
-
-    @staticmethod
-    def _shift(bitboard: int, direction: str) -> int:
-        shift = DIRS[direction]
-        if shift > 0:
-            bb = bitboard << shift
-        else:
-            bb = bitboard >> -shift
-        if direction in ('E', 'NE', 'SE'):
-            bb &= NOT_A_FILE
-        if direction in ('W', 'NW', 'SW'):
-            bb &= NOT_H_FILE
-        return bb
+        return ~self.occupied() & self.geometry.full
 
     def legal_moves(self, player: int, opponent: int) -> int:
         """Return bitboard of legal moves for ``player`` against ``opponent``."""
-        empty = self.empty()
+        cache = _move_cache
+        if cache is None:
+            return self._legal_moves(player, opponent)
+        key = (player, opponent, self.size)
+        moves = cache.get(key)
+        if moves is None:
+            moves = self._legal_moves(player, opponent)
+            cache.put(key, moves)
+        return moves
+
+    def _legal_moves(self, player: int, opponent: int) -> int:
+        geom = self.geometry
+        empty = ~(player | opponent) & geom.full
+        runs = range(geom.runs)
         moves = 0
-        for d in DIRS:
-            mask = self._shift(player, d) & opponent
-            while mask:
-                mask = self._shift(mask, d)
-                if mask & player:
-                    break
-                if mask & empty:
-                    moves |= mask & empty
-                    break
-                mask &= opponent
+        for shift, mask in geom.directions:
+            inner = opponent & mask
+            if shift > 0:
+                line = (player << shift) & inner
+                for _ in runs:
+                    line |= (line << shift) & inner
+                moves |= (line << shift) & mask & empty
+            else:
+                shift = -shift
+                line = (player >> shift) & inner
+                for _ in runs:
+                    line |= (line >> shift) & inner
+                moves |= (line >> shift) & mask & empty
         return moves
 
     def flips(self, move: int, player: int, opponent: int) -> int:
         """Return the stones that would be flipped by ``move``."""
+        cache = _move_cache
+        if cache is None:
+            return self._flips(move, player, opponent)
+        key = (player, opponent, move, self.size)
+        flips = cache.get(key)
+        if flips is None:
+            flips = self._flips(move, player, opponent)
+            cache.put(key, flips)
+        return flips
+
+    def _flips(self, move: int, player: int, opponent: int) -> int:
         flips = 0
-        for d in DIRS:
-            mask = 0
-            bb = self._shift(move, d)
-            while bb & opponent:
-                mask |= bb
-                bb = self._shift(bb, d)
+        for shift, mask in self.geometry.directions:
+            line = 0
+            if shift > 0:
+                bb = (move << shift) & mask
+                while bb & opponent:
+                    line |= bb
+                    bb = (bb << shift) & mask
+            else:
+                shift = -shift
+                bb = (move >> shift) & mask
+                while bb & opponent:
+                    line |= bb
+                    bb = (bb >> shift) & mask
             if bb & player:
-                flips |= mask
+                flips |= line
         return flips
 
     def apply_move(self, move: int, black_to_move: bool) -> "BitBoard":
@@ -121,30 +243,48 @@ class BitBoard:
         player |= move | flips
         opponent &= ~flips
         if black_to_move:
-            return BitBoard(player, opponent)
+            return BitBoard(player, opponent, self.size)
         else:
-            return BitBoard(opponent, player)
+            return BitBoard(opponent, player, self.size)
 
     def __str__(self) -> str:
         """Return an ASCII representation of the board."""
+        size = self.size
+        total = size * size
         s = ""
-        for i in range(TOTAL_SQUARES):
-            bit = 1 << (TOTAL_SQUARES - 1 - i)
+        for i in range(total):
+            bit = 1 << (total - 1 - i)
             if self.black & bit:
                 s += "B"
             elif self.white & bit:
                 s += "W"
             else:
                 s += "."
-            if (i + 1) % BOARD_SIZE == 0:
+            if (i + 1) % size == 0:
                 s += "\n"
         return s
 
 
-def parse_move(move_str: str) -> int:
-    """Return bit mask corresponding to ``move_str`` such as 'd3'."""
+_GEOMETRY_8 = board_geometry(BOARD_SIZE)
+
+
+def parse_move(move_str: str, size: int = BOARD_SIZE) -> int:
+    """Return bit mask corresponding to ``move_str`` such as 'd3'.
+
+    Rows above 9 are written with two digits, e.g. 'j10' on a 10x10 board.
+    """
+    if len(move_str) < 2 or not move_str[1:].isdigit():
+        raise ValueError(f"Invalid move '{move_str}'")
     col = ord(move_str[0].lower()) - ord('a')
-    row = int(move_str[1]) - 1
-    pos = row * BOARD_SIZE + col
-    return 1 << (TOTAL_SQUARES - 1 - pos)
+    row = int(move_str[1:]) - 1
+    if not (0 <= col < size and 0 <= row < size):
+        raise ValueError(f"Move '{move_str}' is off the board")
+    pos = row * size + col
+    return 1 << (size * size - 1 - pos)
+
 
+def format_move(move: int, size: int = BOARD_SIZE) -> str:
+    """Return the coordinate string such as 'd3' for the bit ``move``."""
+    pos = size * size - move.bit_length()
+    row, col = divmod(pos, size)
+    return f"{chr(ord('a') + col)}{row + 1}"
@@ -0,0 +1,217 @@
+"""Fan-out of network game events to read-only spectators.
+
+The game itself keeps running on its own thread with blocking sockets.  A
+:class:`Broadcaster` runs an asyncio server on a background thread; the game
+thread hands it every event with :meth:`Broadcaster.publish`, which encodes the
+line once and schedules the fan-out on the event loop, so publishing never
+waits for a spectator.
+
+Each spectator has a bounded send queue.  When a queue overflows its backlog
+is discarded and replaced with a snapshot of the current position; a
+spectator that needs more than ``max_resyncs`` snapshots is disconnected
+at once, discarding whatever is still buffered for it.
+
+Lines sent to spectators::
+
+    SNAPSHOT <black hex> <white hex> <B|W to move> <size> <moves or ->
+    MOVE <square>
+    PASS
+    END <black discs> <white discs>
+"""
+
+from __future__ import annotations
+import asyncio
+import threading
+
+from .board import BitBoard
+from .game import Game
+from .replay import format_record, game_record, parse_record
+
+
+def encode_snapshot(game: Game) -> bytes:
+    """Return the ``SNAPSHOT`` line describing ``game`` for late joiners."""
+    board = game.board
+    moves = format_record(game_record(game), board.size) or "-"
+    side = "B" if game.black_to_move else "W"
+    return (
+        f"SNAPSHOT {board.black:x} {board.white:x} {side} {board.size} {moves}\n"
+    ).encode()
+
+
+def decode_snapshot(line: str) -> tuple[BitBoard, bool, list[int]]:
+    """Return ``(board, black_to_move, moves)`` from a ``SNAPSHOT`` line."""
+    parts = line.split()
+    if len(parts) != 6 or parts[0] != "SNAPSHOT":
+        raise ValueError(f"Invalid snapshot: {line!r}")
+    size = int(parts[4])
+    board = BitBoard(int(parts[1], 16), int(parts[2], 16), size)
+    moves = [] if parts[5] == "-" else parse_record(parts[5], size)
+    return board, parts[3] == "B", moves
+
+
+class _Spectator:
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue(queue_size)
+        self.resyncs = 0
+        self.task: asyncio.Task | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+
+class Broadcaster:
+    """Serve game events to any number of spectators.
+
+    ``queue_size`` bounds the lines buffered per spectator and
+    ``max_resyncs`` how many snapshot resyncs a slow spectator may need
+    before it is dropped.
+    """
+
+    def __init__(self, queue_size: int = 64, max_resyncs: int = 3) -> None:
+        self.queue_size = queue_size
+        self.max_resyncs = max_resyncs
+        self.resyncs = 0
+        self.dropped = 0
+        self._spectators: set[_Spectator] = set()
+        # Every spectator whose handler is still running, including dropped
+        # ones that have not finished closing.
+        self._connections: set[_Spectator] = set()
+        self._snapshot = encode_snapshot(Game())
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def spectators(self) -> int:
+        """Return the number of connected spectators."""
+        return len(self._spectators)
+
+    def start(self, host: str = "localhost", port: int = 0) -> tuple[str, int]:
+        """Start serving on a background thread and return the bound address."""
+        ready = threading.Event()
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                self._server = loop.run_until_complete(
+                    asyncio.start_server(self._handle, host, port)
+                )
+            except BaseException as e:
+                errors.append(e)
+                ready.set()
+                loop.close()
+                return
+            self._loop = loop
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name="othello-broadcast", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self._server.sockets[0].getsockname()[:2]
+
+    def stop(self) -> None:
+        """Close every spectator connection and stop the server thread."""
+        loop = self._loop
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._loop = self._server = self._thread = None
+
+    def publish(self, game: Game, event: str) -> None:
+        """Send ``event`` to all spectators; ``game`` is the state after it.
+
+        Safe to call from the game thread.  Both the event line and the
+        snapshot for later resyncs are encoded here, once per event.
+        """
+        line = (event + "\n").encode()
+        snapshot = encode_snapshot(game)
+        loop = self._loop
+        if loop is None:
+            self._snapshot = snapshot
+            return
+        loop.call_soon_threadsafe(self._fan_out, line, snapshot)
+
+    def _fan_out(self, line: bytes, snapshot: bytes) -> None:
+        self._snapshot = snapshot
+        for spectator in list(self._spectators):
+            self._offer(spectator, line)
+
+    def _offer(self, spectator: _Spectator, line: bytes) -> None:
+        try:
+            spectator.queue.put_nowait(line)
+            return
+        except asyncio.QueueFull:
+            pass
+        spectator.resyncs += 1
+        if spectator.resyncs > self.max_resyncs:
+            self.dropped += 1
+            self._close(spectator, abort=True)
+            return
+        self.resyncs += 1
+        self._clear(spectator)
+        # The snapshot already includes ``line``.
+        spectator.queue.put_nowait(self._snapshot)
+
+    @staticmethod
+    def _clear(spectator: _Spectator) -> None:
+        while not spectator.queue.empty():
+            spectator.queue.get_nowait()
+
+    def _close(self, spectator: _Spectator, abort: bool = False) -> None:
+        """Ask the handler of ``spectator`` to finish.
+
+        With ``abort`` the connection is also reset right away, so a handler
+        stalled in ``drain()`` on a spectator that stopped reading wakes up
+        and its buffered data is released.
+        """
+        self._spectators.discard(spectator)
+        self._clear(spectator)
+        spectator.queue.put_nowait(None)
+        if abort and spectator.writer is not None:
+            spectator.writer.transport.abort()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        spectator = _Spectator(self.queue_size)
+        spectator.task = asyncio.current_task()
+        spectator.writer = writer
+        spectator.queue.put_nowait(self._snapshot)
+        self._spectators.add(spectator)
+        self._connections.add(spectator)
+        try:
+            while True:
+                line = await spectator.queue.get()
+                if line is None:
+                    break
+                writer.write(line)
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._spectators.discard(spectator)
+            self._connections.discard(spectator)
+            writer.close()
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        for spectator in list(self._spectators):
+            self._close(spectator)
+        connections = {s.task: s for s in self._connections if s.task is not None}
+        if not connections:
+            return
+        # Give connected spectators a moment to receive what is queued, then
+        # reset the ones that are not reading.
+        _, pending = await asyncio.wait(connections, timeout=1)
+        for task in pending:
+            self._close(connections[task], abort=True)
+        if pending:
+            await asyncio.wait(pending, timeout=1)
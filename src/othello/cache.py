@@ -0,0 +1,82 @@
+"""Bounded memo cache for legal-move and flip masks."""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+
+
+class MoveCache:
+    """Least-recently-used cache of move generation results.
+
+    Entries are keyed by the position seen from the side to move
+    (``player``, ``opponent``) and, for flips, the square played.  The
+    number of stored entries never exceeds ``max_entries``; since every key
+    and value is made of board-sized integers this is also a hard cap on
+    the memory used by the cache.
+
+    The cache is safe to share between threads: lookups and insertions
+    hold a lock, since installing it with
+    :func:`~othello.board.set_move_cache` makes it visible to pondering and
+    batching worker threads as well.
+
+    Nothing installs a cache by default.  Generating moves takes a few
+    bitwise operations, which costs no more than building the key and
+    updating the LRU order, so the cache has not paid off in the AI levels
+    (see MEMO.md, 2025-08-02).  It remains useful for bounded
+    de-duplication, as in :mod:`othello.explore`.
+    """
+
+    def __init__(self, max_entries: int = 1 << 16) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> int | None:
+        """Return the cached value for ``key`` or ``None`` if absent."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value: int) -> None:
+        """Store ``value`` for ``key``, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Return a snapshot of the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -1,31 +1,126 @@
 """Command line interface for playing Othello."""
 
-from .board import BitBoard, parse_move
-from .ai import choose_move
-from . import network
+from .board import (
+    BOARD_SIZE,
+    MAX_BOARD_SIZE,
+    MIN_BOARD_SIZE,
+    BitBoard,
+    format_move,
+    parse_move,
+)
 from .game import Game, save_state, load_state
-import argparse
-import socket
 import time
 
+# ``ai``, ``network`` and ``argparse`` are imported on first use so that
+# starting a game only pays for the modules that game actually needs.
 
 
+def choose_move(board: BitBoard, black_to_move: bool, *args, **kwargs) -> int:
+    """Load the AI on first use and delegate to :func:`othello.ai.choose_move`."""
+    from .ai import choose_move as ai_choose_move
+
+    return ai_choose_move(board, black_to_move, *args, **kwargs)
+
+
+def record_result(path: str, players: tuple[str, str], game: Game) -> None:
+    """Add the finished ``game`` between ``players`` to the results store.
+
+    Only games played from the initial position are recorded, since the
+    stored transcript is replayed from there.
+    """
+    from .ratings import RatingStore
+    from .replay import format_record, game_record
+
+    board = game.board
+    if game.history[0] != (BitBoard.initial(board.size), True):
+        print("Result not recorded: the game did not start from the initial position")
+        return
+    if players[0] == players[1]:
+        print(f"Result not recorded: '{players[0]}' played both colours")
+        return
+    with RatingStore(path) as store:
+        store.record_game(
+            players[0],
+            players[1],
+            board.black.bit_count(),
+            board.white.bit_count(),
+            format_record(game_record(game), board.size),
+        )
+
+
+def start_game(size: int = BOARD_SIZE, journal: str | None = None) -> Game:
+    """Return a new game, or the one journaled at ``journal`` if it exists.
+
+    With ``journal`` set the game is recorded there as it is played.  A
+    resumed game keeps its own board size; a different ``size`` is
+    reported and ignored.
+    """
+    game = Game(board=BitBoard.initial(size), black_to_move=True)
+    if journal is None:
+        return game
+    from . import journal as journaling
+
+    if journaling.exists(journal):
+        game = journaling.recover(journal)
+        print("Resumed game from journal")
+        if game.board.size != size:
+            n = game.board.size
+            print(f"Warning: the journal holds a {n}x{n} game; ignoring size {size}")
+    journaling.Journal(journal).attach(game)
+    return game
+
+
+def close_journal(game: Game, over: bool) -> None:
+    """Close the journal of ``game``, deleting it if the game is ``over``."""
+    if game.journal is None:
+        return
+    if over:
+        game.journal.discard()
+    else:
+        game.journal.close()
+    game.journal = None
+
 
 def run_game(
     vs_ai: bool = False,
     ai_vs_ai: bool = False,
     ai_level: str = "easy",
     time_limit: float | None = None,
+    size: int = BOARD_SIZE,
+    seed: int | None = None,
+    journal: str | None = None,
+    results: str | None = None,
+    players: tuple[str, str] = ("black", "white"),
 ) -> BitBoard:
     """Run an interactive game in the terminal and return the final board.
 
     ``vs_ai``  enables human vs computer play (human as black, AI as white).
     ``ai_vs_ai`` runs an automatic game between two AIs.
     ``ai_vs_ai`` takes precedence over ``vs_ai``.
-    ``ai_level`` specifies the AI difficulty (``"easy"``, ``"hard`` or ``"expert"``).
+    ``ai_level`` specifies the AI difficulty (``"easy"``, ``"hard"``, ``"expert"`` or ``"master"``).
+    ``size`` selects the board size (an even number from 4 to 16).
+    ``seed`` makes the AI's random choices reproducible.
+    ``journal`` names a journal that records the game as it is played; if
+    it already exists the game resumes from it.  The journal is deleted
+    once the game is over and kept if the game is quit.
+    ``results`` is a results database where a finished game between
+    ``players`` (black, white) is recorded and rated.
+    Against a human the AI keeps its search between moves and thinks
+    during the human's turn.
     """
-    game = Game(board=BitBoard.initial(), black_to_move=True)
+    game = start_game(size, journal)
+    rng = None
+    if seed is not None:
+        import random
+
+        rng = random.Random(seed)
+    engine = None
+    if vs_ai and not ai_vs_ai:
+        from .engine import Engine
+
+        engine = Engine(ai_level, rng=rng)
     time_left = {True: time_limit, False: time_limit} if time_limit is not None else None
+    finished = False
 
     def deduct(player: bool, start: float) -> bool:
         if time_left is None:
@@ -49,28 +144,37 @@ def run_game(
         legal = game.legal_moves()
         if legal == 0:
             print(f"{player} has no moves. Pass.")
-            game.black_to_move = not game.black_to_move
+            game.pass_turn()
             if deduct(acting_player, start):
                 break
             if game.legal_moves() == 0:
                 print("No moves for both players. Game over.")
+                finished = True
                 break
             continue
         if ai_vs_ai or (vs_ai and not game.black_to_move):
-            move = choose_move(game.board, game.black_to_move, level=ai_level)
+            if engine is not None:
+                move = engine.choose_move(game.board, game.black_to_move)
+            else:
+                move = choose_move(
+                    game.board, game.black_to_move, level=ai_level, rng=rng
+                )
             if move == 0:  # AI has no legal moves
                 print(f"{player} (AI) has no moves. Pass.")
-                game.black_to_move = not game.black_to_move
+                game.pass_turn()
                 if deduct(acting_player, start):
                     break
                 if game.legal_moves() == 0:
                     print("No moves for both players. Game over.")
+                    finished = True
                     break
                 continue
             game.apply_move(move)
             if deduct(acting_player, start):
                 break
             continue
+        if engine is not None:
+            engine.ponder(game.board, game.black_to_move)
         move_str = input(
             f"{player} move (e.g., d3), 'u' to undo, 'r' to redo, 's' to save, 'l' to load, or 'q' to quit: "
         )
@@ -99,9 +203,7 @@ def run_game(
         if move_str.lower() == "l":
             try:
                 board, black = load_state()
-                game.board, game.black_to_move = board, black
-                game.history[:] = [(board, black)]
-                game.future.clear()
+                game.reset(board, black)
                 print("Game loaded")
             except Exception as e:
                 print(f"Load failed: {e}")
@@ -109,7 +211,7 @@ def run_game(
                 break
             continue
         try:
-            move = parse_move(move_str)
+            move = parse_move(move_str, game.board.size)
             game.apply_move(move)
         except ValueError as e:
             print(f"Illegal move: {e}. Please try again.")
@@ -118,14 +220,38 @@ def run_game(
             continue
         if deduct(acting_player, start):
             break
+    if engine is not None:
+        engine.stop()
+    timed_out = time_left is not None and min(time_left.values()) <= 0
+    close_journal(game, finished or timed_out)
+    if results is not None and finished:
+        record_result(results, players, game)
     b_count = bin(game.board.black).count("1")
     w_count = bin(game.board.white).count("1")
     print(f"Final score - Black: {b_count}, White: {w_count}")
     return game.board
 
 
-def run_network_game(host: str | None = None, connect: str | None = None) -> BitBoard:
-    """Play a game against a remote opponent."""
+def run_network_game(
+    host: str | None = None,
+    connect: str | None = None,
+    spectators: str | None = None,
+    ai_level: str | None = None,
+    results: str | None = None,
+    players: tuple[str, str] = ("black", "white"),
+    seed: int | None = None,
+    journal: str | None = None,
+) -> BitBoard:
+    """Play a game against a remote opponent.
+
+    ``spectators`` is a ``host:port`` address at which read-only spectators
+    can watch the game.  With ``ai_level`` set the local side is played by
+    the AI, which thinks while waiting for the remote move.  ``results``,
+    ``players``, ``seed`` and ``journal`` work as in :func:`run_game`; to
+    resume a journaled game both sides must resume from their journals.
+    """
+    from . import network
+
     if host:
         h, p = host.split(":")
         sock = network.host_game(h, int(p))
@@ -137,52 +263,127 @@ def run_network_game(host: str | None = None, connect: str | None = None) -> Bit
     else:
         raise ValueError("host or connect must be provided")
 
-    game = Game(board=BitBoard.initial(), black_to_move=True)
+    game = start_game(journal=journal)
+    engine = None
+    if ai_level is not None:
+        from .engine import Engine
 
-    while True:
-        print(game.board)
-        player = "Black" if game.black_to_move else "White"
-        legal = game.legal_moves()
-        if legal == 0:
-            print(f"{player} has no moves. Pass.")
-            if game.black_to_move == my_black:
-                network.send_line(sock, "PASS")
+        rng = None
+        if seed is not None:
+            import random
+
+            rng = random.Random(seed)
+        engine = Engine(ai_level, rng=rng)
+    broadcaster = None
+    if spectators:
+        from .broadcast import Broadcaster
+
+        h, p = spectators.split(":")
+        broadcaster = Broadcaster()
+        broadcaster.start(h, int(p))
+
+    def publish(event: str) -> None:
+        if broadcaster is not None:
+            broadcaster.publish(game, event)
+
+    finished = False
+    try:
+        while True:
+            print(game.board)
+            player = "Black" if game.black_to_move else "White"
+            legal = game.legal_moves()
+            if legal == 0:
+                print(f"{player} has no moves. Pass.")
+                if game.black_to_move == my_black:
+                    network.send_line(sock, "PASS")
+                else:
+                    msg = network.recv_line(sock)
+                    if msg != "PASS":
+                        raise ValueError("Expected PASS")
+                game.pass_turn()
+                publish("PASS")
+                if game.legal_moves() == 0:
+                    print("No moves for both players. Game over.")
+                    finished = True
+                    break
+                continue
+            if game.black_to_move == my_black and engine is not None:
+                move = engine.choose_move(game.board, game.black_to_move)
+                network.send_line(sock, format_move(move))
+            elif game.black_to_move == my_black:
+                move_str = input(f"{player} move (e.g., d3) or 'q' to quit: ")
+                if move_str.lower() == "q":
+                    network.send_line(sock, "QUIT")
+                    break
+                move = parse_move(move_str)
+                network.send_line(sock, move_str)
             else:
+                print("Waiting for opponent...")
+                if engine is not None:
+                    engine.ponder(game.board, game.black_to_move)
                 msg = network.recv_line(sock)
-                if msg != "PASS":
-                    raise ValueError("Expected PASS")
-            game.black_to_move = not game.black_to_move
-            if game.legal_moves() == 0:
-                print("No moves for both players. Game over.")
-                break
-            continue
-        if game.black_to_move == my_black:
-            move_str = input(f"{player} move (e.g., d3) or 'q' to quit: ")
-            if move_str.lower() == "q":
-                network.send_line(sock, "QUIT")
-                break
-            move = parse_move(move_str)
-            network.send_line(sock, move_str)
-        else:
-            print("Waiting for opponent...")
-            msg = network.recv_line(sock)
-            if msg == "QUIT":
-                print("Opponent quit.")
-                break
-            move = parse_move(msg)
-        game.apply_move(move)
+                if msg == "QUIT":
+                    print("Opponent quit.")
+                    break
+                move = parse_move(msg)
+            game.apply_move(move)
+            publish(f"MOVE {format_move(move)}")
 
-    b_count = bin(game.board.black).count("1")
-    w_count = bin(game.board.white).count("1")
+        b_count = bin(game.board.black).count("1")
+        w_count = bin(game.board.white).count("1")
+        publish(f"END {b_count} {w_count}")
+    finally:
+        if engine is not None:
+            engine.stop()
+        if broadcaster is not None:
+            broadcaster.stop()
+        close_journal(game, finished)
+    if results is not None and finished:
+        record_result(results, players, game)
     print(f"Final score - Black: {b_count}, White: {w_count}")
     return game.board
 
 
+def watch_game(address: str) -> BitBoard:
+    """Follow a game as a spectator and return the final board."""
+    from . import network
+    from .broadcast import decode_snapshot
+
+    h, p = address.split(":")
+    sock = network.join_game(h, int(p))
+    try:
+        board, black_to_move, moves = decode_snapshot(network.recv_line(sock))
+        print(f"Joined after {len(moves)} moves.")
+        print(board)
+        while True:
+            msg = network.recv_line(sock)
+            if msg.startswith("SNAPSHOT"):
+                board, black_to_move, _ = decode_snapshot(msg)
+                print("Resynchronised.")
+            elif msg == "PASS":
+                black_to_move = not black_to_move
+                continue
+            elif msg.startswith("MOVE "):
+                board = board.apply_move(parse_move(msg[5:], board.size), black_to_move)
+                black_to_move = not black_to_move
+            elif msg.startswith("END "):
+                _, b_count, w_count = msg.split()
+                print(f"Final score - Black: {b_count}, White: {w_count}")
+                return board
+            print(board)
+    finally:
+        sock.close()
+
+
 def main() -> None:
     """Entry point used by ``python -m othello.cli``."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Play Othello")
     parser.add_argument(
-        "--ai", action="store_true", help="Play against the computer (as white)"
+        "--ai",
+        action="store_true",
+        help="Play against the computer (as white); in network games the computer plays your side",
     )
     parser.add_argument(
         "--ai-vs-ai",
@@ -191,7 +392,7 @@ def main() -> None:
     )
     parser.add_argument(
         "--ai-level",
-        choices=["easy", "hard", "expert"],
+        choices=["easy", "hard", "expert", "master"],
         default="easy",
         help="AI difficulty level",
     )
@@ -200,18 +401,96 @@ def main() -> None:
         type=float,
         help="Total time per player in seconds",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for the AI's random choices to make games reproducible",
+    )
+    parser.add_argument(
+        "--tablebase",
+        metavar="PATH",
+        help="Endgame tablebase consulted by the master AI",
+    )
+    parser.add_argument(
+        "--journal",
+        metavar="PATH",
+        help="Record the game to a crash-safe journal and resume from it",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        choices=range(MIN_BOARD_SIZE, MAX_BOARD_SIZE + 1, 2),
+        default=BOARD_SIZE,
+        metavar="N",
+        help="Board size for local games (even, 4-16)",
+    )
     parser.add_argument("--host", help="Host a network game at host:port")
     parser.add_argument("--connect", help="Connect to a network game at host:port")
+    parser.add_argument(
+        "--spectators",
+        help="Let spectators watch the network game at host:port",
+    )
+    parser.add_argument("--watch", help="Watch a network game at host:port")
+    parser.add_argument(
+        "--results",
+        metavar="DB",
+        help="Record finished games and ratings in this results database",
+    )
+    parser.add_argument("--black", metavar="NAME", help="Player name for black")
+    parser.add_argument("--white", metavar="NAME", help="Player name for white")
+    parser.add_argument(
+        "--scoreboard",
+        type=int,
+        nargs="?",
+        const=10,
+        metavar="N",
+        help="Show the top N players from the results database and exit",
+    )
     args = parser.parse_args()
-    if args.host or args.connect:
-        run_network_game(host=args.host, connect=args.connect)
+    if args.tablebase:
+        from .tablebase import Tablebase, set_tablebase
+
+        set_tablebase(Tablebase(args.tablebase))
+    players = (args.black or "black", args.white or "white")
+    if args.scoreboard is not None:
+        from .ratings import RatingStore, format_leaderboard
+
+        with RatingStore(args.results or "othello-results.db") as store:
+            print(format_leaderboard(store.top(args.scoreboard)))
+    elif args.watch:
+        watch_game(args.watch)
+    elif args.host or args.connect:
+        run_network_game(
+            host=args.host,
+            connect=args.connect,
+            spectators=args.spectators,
+            ai_level=args.ai_level if args.ai else None,
+            results=args.results,
+            players=players,
+            seed=args.seed,
+            journal=args.journal,
+        )
     else:
+        ai_name = f"ai-{args.ai_level}"
+        if args.ai_vs_ai:
+            players = (args.black or f"{ai_name}-black", args.white or f"{ai_name}-white")
+        elif args.ai:
+            players = (players[0], args.white or ai_name)
         run_game(
             vs_ai=args.ai,
             ai_vs_ai=args.ai_vs_ai,
             ai_level=args.ai_level,
             time_limit=args.time_limit,
+            size=args.size,
+            seed=args.seed,
+            journal=args.journal,
+            results=args.results,
+            players=players,
         )
 
 # Backward compatible entry point
 play = main
+
+
+if __name__ == "__main__":
+    main()
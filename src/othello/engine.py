@@ -0,0 +1,139 @@
+"""Persistent AI player that keeps its search state between moves."""
+
+from __future__ import annotations
+import random
+import threading
+
+from .ai import MASTER_DEPTH, choose_move
+from .board import BitBoard
+from .search import DISC_SCORE, Searcher, SearchStopped
+from .tablebase import lookup
+
+
+class Engine:
+    """AI player object used instead of calling :func:`choose_move` each turn.
+
+    For the ``"master"`` level the engine owns one :class:`Searcher`, so the
+    transposition table and principal variation survive from one move to the
+    next.  :meth:`ponder` keeps searching on a background thread while the
+    opponent thinks, assuming the reply the previous search predicted; if
+    that reply is played, :meth:`choose_move` answers from the finished
+    search immediately.  With ``time_limit`` set it does so once pondering
+    has reached the depth the previous timed search did, and otherwise
+    keeps deepening from the pondered result.  Other levels are cheap and
+    simply delegate to :func:`choose_move`.
+
+    ``time_limit`` switches the master level from a fixed ``depth`` to
+    iterative deepening for that many seconds per move; positions in the
+    registered endgame tablebase are answered without searching.  ``rng``
+    is passed on to :func:`choose_move` for the levels that pick moves at
+    random.
+    """
+
+    def __init__(
+        self,
+        level: str = "master",
+        depth: int = MASTER_DEPTH,
+        time_limit: float | None = None,
+        tt_size: int = 1 << 18,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.level = level
+        self.rng = rng
+        self.depth = depth
+        self.time_limit = time_limit
+        self.searcher = Searcher(tt_size=tt_size)
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self.last_depth = 0
+        # Depth the time budget reached on the last timed search.
+        self._timed_depth = 0
+        self._thread: threading.Thread | None = None
+        self._ponder_position: tuple[BitBoard, bool] | None = None
+        self._ponder_result: tuple[int, int] = (0, 0)
+
+    def choose_move(self, board: BitBoard, black_to_move: bool) -> int:
+        """Return the move to play in this position (``0`` to pass)."""
+        if self.level != "master":
+            return choose_move(board, black_to_move, level=self.level, rng=self.rng)
+        pondered = self._ponder_position
+        move, depth = self.stop()
+        start = (0, 0, 0)
+        if pondered is not None:
+            if pondered == (board, black_to_move):
+                self.ponder_hits += 1
+                target = self.depth if self.time_limit is None else self._timed_depth
+                if move and target and depth >= target:
+                    self.last_depth = depth
+                    return move
+                if move:
+                    start = (move, 0, depth)
+            else:
+                self.ponder_misses += 1
+        solved = lookup(board, black_to_move)
+        if solved is not None:
+            self.last_depth = board.empty().bit_count()
+            return solved[1]
+        if self.time_limit is None:
+            move, _ = self.searcher.search(board, black_to_move, self.depth)
+            self.last_depth = self.depth
+            return move
+        move, _, depth = self.searcher.best_move(
+            board, black_to_move, self.time_limit, start=start
+        )
+        self.last_depth = self._timed_depth = depth
+        return move
+
+    def ponder(self, board: BitBoard, black_to_move: bool) -> None:
+        """Think on the opponent's time; the opponent is to move on ``board``.
+
+        The predicted reply is taken from the transposition table.  Without a
+        prediction the opponent's position itself is searched, which still
+        fills the table for whichever reply is played.
+        """
+        if self.level != "master":
+            return
+        self.stop()
+        player = board.black if black_to_move else board.white
+        opponent = board.white if black_to_move else board.black
+        legal = board.legal_moves(player, opponent)
+        predicted = self.searcher.tt_move(board, black_to_move)
+        if predicted & legal:
+            target = (board.apply_move(predicted, black_to_move), not black_to_move)
+        else:
+            target = (board, black_to_move)
+        self._ponder_position = target
+        self._ponder_result = (0, 0)
+        self._thread = threading.Thread(
+            target=self._ponder, args=target, name="othello-ponder", daemon=True
+        )
+        self._thread.start()
+
+    def _ponder(self, board: BitBoard, black_to_move: bool) -> None:
+        empties = board.empty().bit_count()
+        try:
+            for depth in range(1, empties + 1):
+                move, score = self.searcher.search(board, black_to_move, depth)
+                self._ponder_result = (move, depth)
+                if abs(score) >= DISC_SCORE:
+                    break
+        except SearchStopped:
+            pass
+
+    @property
+    def ponder_depth(self) -> int:
+        """Return the depth pondering has completed so far."""
+        return self._ponder_result[1]
+
+    def stop(self) -> tuple[int, int]:
+        """Stop pondering and return its ``(move, depth)`` result."""
+        thread = self._thread
+        if thread is not None:
+            self.searcher.stop()
+            thread.join()
+            self.searcher.clear_stop()
+            self._thread = None
+        self._ponder_position = None
+        result = self._ponder_result
+        self._ponder_result = (0, 0)
+        return result
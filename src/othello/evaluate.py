@@ -0,0 +1,109 @@
+"""Positional evaluation shared by the AI levels and the search."""
+
+from __future__ import annotations
+from functools import lru_cache
+
+from .board import BOARD_SIZE, BitBoard
+from .tables import load_table
+
+# Boards up to this size use per-row lookup tables (2**size entries per row);
+# larger boards fall back to summing the weights bit by bit.
+_ROW_TABLE_LIMIT = 10
+# Row tables for boards at least this size are cached on disk with
+# :func:`othello.tables.load_table`; smaller ones are quicker to rebuild.
+_CACHED_ROW_TABLE_SIZE = 10
+# Bump whenever ``weights`` or ``_build_row_tables`` change.
+ROW_TABLE_VERSION = 1
+
+# Positional weights used for the evaluation function. Corners are highly
+# valued while squares adjacent to corners are penalised. The values were
+# chosen heuristically.
+_WEIGHTS = [
+    100, -20, 10, 5, 5, 10, -20, 100,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    10, -2, 5, 1, 1, 5, -2, 10,
+    5, -2, 1, 0, 0, 1, -2, 5,
+    5, -2, 1, 0, 0, 1, -2, 5,
+    10, -2, 5, 1, 1, 5, -2, 10,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    100, -20, 10, 5, 5, 10, -20, 100,
+]
+
+
+@lru_cache(maxsize=None)
+def weights(size: int) -> tuple[int, ...]:
+    """Return positional weights for a ``size`` x ``size`` board.
+
+    The 8x8 table is hand tuned; other sizes reuse its corner, edge and
+    corner-adjacent values on a generated layout.
+    """
+    if size == BOARD_SIZE:
+        return tuple(_WEIGHTS)
+    last = size - 1
+    weights = []
+    for r in range(size):
+        for c in range(size):
+            edge_r = r in (0, last)
+            edge_c = c in (0, last)
+            near_r = r in (1, last - 1)
+            near_c = c in (1, last - 1)
+            if edge_r and edge_c:
+                weights.append(100)
+            elif near_r and near_c:
+                weights.append(-50)
+            elif (edge_r and near_c) or (near_r and edge_c):
+                weights.append(-20)
+            elif edge_r or edge_c:
+                weights.append(10)
+            elif near_r or near_c:
+                weights.append(-2)
+            else:
+                weights.append(1)
+    return tuple(weights)
+
+
+@lru_cache(maxsize=None)
+def _row_tables(size: int) -> tuple[tuple[int, ...], ...]:
+    """Return, for every row, the weight sum of each possible row pattern."""
+    if size >= _CACHED_ROW_TABLE_SIZE:
+        return load_table(
+            f"row-weights-{size}", ROW_TABLE_VERSION, lambda: _build_row_tables(size)
+        )
+    return _build_row_tables(size)
+
+
+def _build_row_tables(size: int) -> tuple[tuple[int, ...], ...]:
+    table = weights(size)
+    rows = []
+    for r in range(size):
+        row_weights = [table[r * size + size - 1 - j] for j in range(size)]
+        sums = [0] * (1 << size)
+        for pattern in range(1, 1 << size):
+            low = pattern & -pattern
+            sums[pattern] = sums[pattern ^ low] + row_weights[low.bit_length() - 1]
+        rows.append(tuple(sums))
+    return tuple(rows)
+
+
+def positional(bb: int, size: int = BOARD_SIZE) -> int:
+    """Return the sum of positional weights of the squares set in ``bb``."""
+    if size > _ROW_TABLE_LIMIT:
+        table = weights(size)
+        last = size * size - 1
+        score = 0
+        while bb:
+            lsb = bb & -bb
+            score += table[last - (lsb.bit_length() - 1)]
+            bb ^= lsb
+        return score
+    row_mask = (1 << size) - 1
+    score = 0
+    for sums in reversed(_row_tables(size)):
+        score += sums[bb & row_mask]
+        bb >>= size
+    return score
+
+
+def evaluate(board: BitBoard) -> int:
+    """Return a positional evaluation of ``board`` from black's perspective."""
+    return positional(board.black, board.size) - positional(board.white, board.size)
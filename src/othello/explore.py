@@ -0,0 +1,249 @@
+"""Stream the game tree below a position without keeping it in memory.
+
+:func:`walk` is a depth-first generator over raw bitboards.  Its memory use
+is one stack entry per ply, so trees far too large for memory (depth 10
+and beyond from the initial position) can be enumerated.  Every node is
+yielded as a tuple::
+
+    (depth, black, white, black_to_move, move, legal)
+
+``move`` is the move that led to the node (``0`` for the root and for a
+pass) and ``legal`` the number of legal moves of the side to move.  A pass
+counts as one ply, and a node where neither side can move has no children.
+
+Nodes can be written with :func:`export` as CSV or as fixed 20-byte binary
+records (8x8 boards only)::
+
+    B depth, Q black, Q white, B black_to_move, B move square, B legal
+
+where the square is the bit index of the move, or 255 for none.
+:func:`export_parallel` splits the tree by root move over worker processes,
+each writing its own part file.
+"""
+
+from __future__ import annotations
+import struct
+from typing import Iterator, Tuple
+
+from .board import BOARD_SIZE, BitBoard, format_move
+from .cache import MoveCache
+
+NO_MOVE = 255
+_PASS = -1
+_RECORD = struct.Struct(">BQQBBB")
+
+Node = Tuple[int, int, int, bool, int, int]
+
+
+def walk(
+    board: BitBoard | None = None,
+    black_to_move: bool = True,
+    depth: int = 1,
+    dedup: int = 0,
+    root_moves: int | None = None,
+) -> Iterator[Node]:
+    """Yield every node of the tree below ``board`` down to ``depth`` plies.
+
+    With ``dedup`` above zero, a position reached again while it is still
+    among the ``dedup`` most recently seen ones is skipped together with its
+    subtree, so memory stays bounded while most transpositions are removed;
+    each remembered position costs roughly 300 bytes.
+    ``root_moves`` restricts the first ply to the moves in that mask.
+    """
+    if board is None:
+        board = BitBoard.initial()
+    legal_moves = board.legal_moves
+    flips_of = board.flips
+    seen = MoveCache(dedup) if dedup > 0 else None
+
+    black_to_move = bool(black_to_move)
+    player = board.black if black_to_move else board.white
+    opponent = board.white if black_to_move else board.black
+    legal = legal_moves(player, opponent)
+    yield (0, board.black, board.white, black_to_move, 0, legal.bit_count())
+    if depth <= 0:
+        return
+    if root_moves is not None:
+        legal &= root_moves
+    elif not legal and legal_moves(opponent, player):
+        legal = _PASS
+    if not legal:
+        return
+
+    # Each entry holds a position and the moves from it still to visit.
+    stack = [(player, opponent, black_to_move, legal)]
+    while stack:
+        player, opponent, black, pending = stack[-1]
+        if not pending:
+            stack.pop()
+            continue
+        if pending == _PASS:
+            stack[-1] = (player, opponent, black, 0)
+            move = 0
+            child_player, child_opponent = opponent, player
+        else:
+            move = pending & -pending
+            stack[-1] = (player, opponent, black, pending ^ move)
+            flips = flips_of(move, player, opponent)
+            child_player, child_opponent = opponent ^ flips, player | move | flips
+        black = not black
+        if seen is not None:
+            key = (child_player, child_opponent, black)
+            if seen.get(key) is not None:
+                continue
+            seen.put(key, 1)
+        child_legal = legal_moves(child_player, child_opponent)
+        child_depth = len(stack)
+        if black:
+            yield (child_depth, child_player, child_opponent, True, move, child_legal.bit_count())
+        else:
+            yield (child_depth, child_opponent, child_player, False, move, child_legal.bit_count())
+        if child_depth < depth:
+            if child_legal:
+                stack.append((child_player, child_opponent, black, child_legal))
+            elif legal_moves(child_opponent, child_player):
+                stack.append((child_player, child_opponent, black, _PASS))
+
+
+def write_binary(nodes: Iterator[Node], f) -> int:
+    """Write ``nodes`` as binary records to the file object ``f``."""
+    pack = _RECORD.pack
+    write = f.write
+    count = 0
+    for depth, black, white, black_to_move, move, legal in nodes:
+        square = move.bit_length() - 1 if move else NO_MOVE
+        write(pack(depth, black, white, black_to_move, square, legal))
+        count += 1
+    return count
+
+
+def write_csv(nodes: Iterator[Node], f, size: int = BOARD_SIZE) -> int:
+    """Write ``nodes`` as CSV lines to the text file object ``f``."""
+    write = f.write
+    write("depth,black,white,to_move,move,legal\n")
+    count = 0
+    for depth, black, white, black_to_move, move, legal in nodes:
+        name = format_move(move, size) if move else "-"
+        write(f"{depth},{black:x},{white:x},{'B' if black_to_move else 'W'},{name},{legal}\n")
+        count += 1
+    return count
+
+
+def read_binary(path: str) -> Iterator[Node]:
+    """Yield the nodes stored in a binary export."""
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(_RECORD.size * 4096)
+            if not data:
+                return
+            for depth, black, white, side, square, legal in _RECORD.iter_unpack(data):
+                move = 0 if square == NO_MOVE else 1 << square
+                yield depth, black, white, bool(side), move, legal
+
+
+def export(
+    path: str,
+    board: BitBoard | None = None,
+    black_to_move: bool = True,
+    depth: int = 1,
+    fmt: str = "binary",
+    dedup: int = 0,
+    root_moves: int | None = None,
+) -> int:
+    """Write the tree below ``board`` to ``path`` and return the node count."""
+    if board is None:
+        board = BitBoard.initial()
+    nodes = walk(board, black_to_move, depth, dedup, root_moves)
+    if fmt == "csv":
+        with open(path, "w", buffering=1 << 20) as f:
+            return write_csv(nodes, f, board.size)
+    if fmt != "binary":
+        raise ValueError(f"Unknown format '{fmt}'")
+    if board.size != BOARD_SIZE:
+        raise ValueError("Binary export supports 8x8 boards only")
+    with open(path, "wb", buffering=1 << 20) as f:
+        return write_binary(nodes, f)
+
+
+def _export_part(args: tuple) -> int:
+    return export(*args)
+
+
+def export_parallel(
+    path: str,
+    board: BitBoard | None = None,
+    black_to_move: bool = True,
+    depth: int = 1,
+    fmt: str = "binary",
+    dedup: int = 0,
+    processes: int | None = None,
+) -> list[tuple[str, int]]:
+    """Export one part file per root move using a process pool.
+
+    Part ``i`` is written to ``<path>.<i>``; the root node is repeated in
+    every part.  Returns ``(part path, node count)`` pairs.  Transpositions
+    are only removed within a part.
+    """
+    if board is None:
+        board = BitBoard.initial()
+    player = board.black if black_to_move else board.white
+    opponent = board.white if black_to_move else board.black
+    legal = board.legal_moves(player, opponent)
+    roots = []
+    while legal:
+        move = legal & -legal
+        roots.append(move)
+        legal ^= move
+    jobs = [
+        (f"{path}.{i}", board, black_to_move, depth, fmt, dedup, move)
+        for i, move in enumerate(roots)
+    ]
+    import multiprocessing
+
+    with multiprocessing.Pool(processes) as pool:
+        counts = pool.map(_export_part, jobs, chunksize=1)
+    return [(job[0], count) for job, count in zip(jobs, counts)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point used by ``python -m othello.explore``."""
+    import argparse
+    import time
+
+    from .replay import final_position, parse_record
+
+    parser = argparse.ArgumentParser(description="Export the game tree below a position")
+    parser.add_argument("depth", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--format", choices=["binary", "csv"], default="binary")
+    parser.add_argument("--moves", default="", help="Transcript leading to the start position")
+    parser.add_argument(
+        "--dedup",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Skip transpositions among the last N positions",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Split the tree by root move over this many processes",
+    )
+    args = parser.parse_args(argv)
+
+    board, black_to_move = final_position(parse_record(args.moves))
+    start = time.perf_counter()
+    if args.workers > 1:
+        parts = export_parallel(
+            args.output, board, black_to_move, args.depth, args.format, args.dedup, args.workers
+        )
+        count = sum(n for _, n in parts)
+    else:
+        count = export(args.output, board, black_to_move, args.depth, args.format, args.dedup)
+    elapsed = time.perf_counter() - start
+    print(f"{count} nodes in {elapsed:.1f}s ({count / elapsed:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
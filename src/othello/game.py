@@ -1,17 +1,26 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from .board import BitBoard
+from .board import BOARD_SIZE, BitBoard
+
+if TYPE_CHECKING:
+    from .journal import Journal
 
 
 @dataclass
 class Game:
-    """Game state holding the board and turn information."""
+    """Game state holding the board and turn information.
+
+    When ``journal`` is set every move, undo, redo and pass is appended to
+    it; see :mod:`othello.journal`.
+    """
 
     board: BitBoard = field(default_factory=BitBoard.initial)
     black_to_move: bool = True
     history: list[tuple[BitBoard, bool]] = field(default_factory=list)
     future: list[tuple[BitBoard, bool]] = field(default_factory=list)
+    journal: Journal | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.history:
@@ -27,12 +36,30 @@ class Game:
         self.black_to_move = not self.black_to_move
         self.history.append((self.board, self.black_to_move))
         self.future.clear()
+        if self.journal is not None:
+            self.journal.record(self, "move", move)
+
+    def pass_turn(self) -> None:
+        """Give the turn to the other player without moving."""
+        self.black_to_move = not self.black_to_move
+        if self.journal is not None:
+            self.journal.record(self, "pass")
+
+    def reset(self, board: BitBoard, black_to_move: bool) -> None:
+        """Start over from ``board``, discarding the undo and redo history."""
+        self.board, self.black_to_move = board, black_to_move
+        self.history[:] = [(board, black_to_move)]
+        self.future.clear()
+        if self.journal is not None:
+            self.journal.snapshot(self)
 
     def undo(self) -> bool:
         if len(self.history) <= 1:
             return False
         self.future.append(self.history.pop())
         self.board, self.black_to_move = self.history[-1]
+        if self.journal is not None:
+            self.journal.record(self, "undo")
         return True
 
     def redo(self) -> bool:
@@ -40,21 +67,29 @@ class Game:
             return False
         self.board, self.black_to_move = self.future.pop()
         self.history.append((self.board, self.black_to_move))
+        if self.journal is not None:
+            self.journal.record(self, "redo")
         return True
 
 
 def save_state(board: BitBoard, black_to_move: bool, path: str = "othello.sav") -> None:
-    """Save ``board`` and turn information to ``path``."""
+    """Save ``board`` and turn information to ``path``.
+
+    Boards other than 8x8 get a fourth line holding the board size.
+    """
     with open(path, "w") as f:
         f.write(f"{board.black}\n{board.white}\n{1 if black_to_move else 0}\n")
+        if board.size != BOARD_SIZE:
+            f.write(f"{board.size}\n")
 
 
 def load_state(path: str = "othello.sav") -> tuple[BitBoard, bool]:
     """Load board and turn information from ``path``."""
     with open(path) as f:
         lines = f.read().splitlines()
-    if len(lines) != 3:
+    if len(lines) not in (3, 4):
         raise ValueError("Invalid save file")
-    board = BitBoard(int(lines[0]), int(lines[1]))
+    size = int(lines[3]) if len(lines) == 4 else BOARD_SIZE
+    board = BitBoard(int(lines[0]), int(lines[1]), size)
     black_to_move = bool(int(lines[2]))
     return board, black_to_move
@@ -1,15 +1,18 @@
 """Simple Tkinter based GUI for playing Othello."""
 
+from __future__ import annotations
+import random
 import tkinter as tk
-from .board import BitBoard
+from .board import BOARD_SIZE, BitBoard
 from .ai import choose_move
 
 SIZE = 50
 
 class OthelloGUI:
-    def __init__(self, vs_ai: bool = False, ai_level: str = "easy") -> None:
+    def __init__(self, vs_ai: bool = False, ai_level: str = "easy", seed: int | None = None) -> None:
         self.vs_ai = vs_ai
         self.ai_level = ai_level
+        self.rng = random.Random(seed) if seed is not None else None
         self.board = BitBoard.initial()
         self.black_to_move = True
         self.root = tk.Tk()
@@ -57,7 +60,9 @@ class OthelloGUI:
 
     def after_move(self) -> None:
         if self.vs_ai and not self.black_to_move:
-            move = choose_move(self.board, self.black_to_move, level=self.ai_level)
+            move = choose_move(
+                self.board, self.black_to_move, level=self.ai_level, rng=self.rng
+            )
             if move:
                 self.board = self.board.apply_move(move, self.black_to_move)
             self.black_to_move = not self.black_to_move
@@ -91,9 +96,12 @@ class OthelloGUI:
         self.root.mainloop()
 
 
-def play_gui(vs_ai: bool = False, ai_level: str = "easy") -> None:
-    """Entry point for playing the GUI version."""
-    OthelloGUI(vs_ai, ai_level).run()
+def play_gui(vs_ai: bool = False, ai_level: str = "easy", seed: int | None = None) -> None:
+    """Entry point for playing the GUI version.
+
+    ``seed`` makes the AI's random choices reproducible.
+    """
+    OthelloGUI(vs_ai, ai_level, seed).run()
 
 if __name__ == "__main__":
     play_gui(vs_ai=True)
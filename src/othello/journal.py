@@ -0,0 +1,183 @@
+"""Crash-safe game persistence with an append-only journal.
+
+A :class:`Journal` keeps two files next to each other:
+
+``<path>.log``
+    Two bytes per event: the operation code and, for moves, the square
+    index (``move.bit_length() - 1``).  Records are buffered and flushed
+    with :func:`os.fsync` every ``sync_every`` events.
+``<path>.snap``
+    The full :class:`~othello.game.Game` state plus the log offset it
+    covers, rewritten atomically every ``snapshot_every`` events.
+
+:func:`recover` loads the snapshot and replays only the log records written
+after it, so recovery reads at most ``snapshot_every`` records however long
+the game has been running.  A torn final record is ignored.
+"""
+
+from __future__ import annotations
+import json
+import os
+
+from .board import BitBoard
+from .game import Game
+
+MOVE = 1
+UNDO = 2
+REDO = 3
+PASS = 4
+
+RECORD_SIZE = 2
+
+_CODES = {"move": MOVE, "undo": UNDO, "redo": REDO, "pass": PASS}
+
+
+def _encode_position(board: BitBoard, black_to_move: bool) -> list:
+    return [f"{board.black:x}", f"{board.white:x}", black_to_move]
+
+
+def _decode_position(entry: list, size: int) -> tuple[BitBoard, bool]:
+    return BitBoard(int(entry[0], 16), int(entry[1], 16), size), bool(entry[2])
+
+
+class Journal:
+    """Append-only event log with periodic snapshots for one game.
+
+    ``sync_every`` is the number of records written between ``fsync`` calls;
+    up to that many of the latest events can be lost on a power failure.
+    ``snapshot_every`` bounds how many records :func:`recover` has to replay.
+    """
+
+    def __init__(self, path: str, sync_every: int = 16, snapshot_every: int = 64) -> None:
+        self.path = path
+        self.sync_every = sync_every
+        self.snapshot_every = snapshot_every
+        self.syncs = 0
+        self.snapshots = 0
+        self._log = open(self.log_path, "ab")
+        self._offset = self._log.tell()
+        self._unsynced = 0
+        self._since_snapshot = 0
+
+    @property
+    def log_path(self) -> str:
+        return f"{self.path}.log"
+
+    @property
+    def snapshot_path(self) -> str:
+        return f"{self.path}.snap"
+
+    def attach(self, game: Game) -> Game:
+        """Start journaling ``game`` and return it.
+
+        A snapshot is written immediately so the journal never depends on
+        records from an earlier run.
+        """
+        game.journal = self
+        self.snapshot(game)
+        return game
+
+    def record(self, game: Game, event: str, move: int = 0) -> None:
+        """Append ``event`` (``"move"``, ``"undo"``, ``"redo"`` or ``"pass"``).
+
+        ``game`` is the state after the event.
+        """
+        square = move.bit_length() - 1 if move else 0
+        self._log.write(bytes((_CODES[event], square)))
+        self._offset += RECORD_SIZE
+        self._unsynced += 1
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot(game)
+        elif self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffered records and ``fsync`` the log."""
+        if not self._unsynced:
+            return
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        self._unsynced = 0
+        self.syncs += 1
+
+    def snapshot(self, game: Game) -> None:
+        """Write the full state of ``game`` covering every record so far."""
+        self.sync()
+        state = {
+            "size": game.board.size,
+            "offset": self._offset,
+            "board": _encode_position(game.board, game.black_to_move),
+            "history": [_encode_position(*entry) for entry in game.history],
+            "future": [_encode_position(*entry) for entry in game.future],
+        }
+        tmp = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        self._since_snapshot = 0
+        self.snapshots += 1
+
+    def close(self) -> None:
+        """Sync outstanding records and close the log."""
+        if self._log.closed:
+            return
+        self.sync()
+        self._log.close()
+
+    def discard(self) -> None:
+        """Close the journal and delete its files, e.g. once the game is over."""
+        self._log.close()
+        for path in (self.log_path, self.snapshot_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def exists(path: str) -> bool:
+    """Return whether a journal snapshot exists for ``path``."""
+    return os.path.exists(f"{path}.snap")
+
+
+def recover(path: str) -> Game:
+    """Rebuild the game journaled at ``path``.
+
+    The returned game has no journal attached; pass it to
+    :meth:`Journal.attach` to continue journaling.  Raises ``OSError`` if
+    there is no snapshot and ``ValueError`` if the log does not replay.
+    """
+    with open(f"{path}.snap") as f:
+        state = json.load(f)
+    size = state["size"]
+    board, black_to_move = _decode_position(state["board"], size)
+    game = Game(
+        board=board,
+        black_to_move=black_to_move,
+        history=[_decode_position(entry, size) for entry in state["history"]],
+        future=[_decode_position(entry, size) for entry in state["future"]],
+    )
+    try:
+        with open(f"{path}.log", "rb") as f:
+            f.seek(state["offset"])
+            tail = f.read()
+    except FileNotFoundError:
+        tail = b""
+    total = size * size
+    for i in range(0, len(tail) - RECORD_SIZE + 1, RECORD_SIZE):
+        op, square = tail[i], tail[i + 1]
+        if op == MOVE:
+            if square >= total:
+                raise ValueError(f"Invalid square {square} in journal")
+            game.apply_move(1 << square)
+        elif op == UNDO:
+            game.undo()
+        elif op == REDO:
+            game.redo()
+        elif op == PASS:
+            game.pass_turn()
+        else:
+            raise ValueError(f"Unknown journal record {op}")
+    return game
@@ -0,0 +1,218 @@
+"""Batched move generation over many 8x8 positions at once.
+
+Positions are packed into an ``array('Q')`` as consecutive
+``(player, opponent)`` pairs, each seen from the side to move.  When NumPy is
+installed the buffer is viewed through a ``memoryview`` as a ``uint64`` array
+and every direction is processed for the whole batch with a single vector
+operation.  Without NumPy the functions fall back to the pure-Python
+:class:`~othello.board.BitBoard` one position at a time, so callers never need
+to check which implementation is active.
+"""
+
+from __future__ import annotations
+import sys
+from array import array
+from functools import lru_cache
+from typing import Iterable
+
+from .board import BitBoard, board_geometry
+from .evaluate import _row_tables, positional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+HAVE_NUMPY = np is not None
+
+_BOARD = BitBoard(0, 0)
+_DIRECTIONS = board_geometry(8).directions
+
+
+def pack(positions: Iterable[tuple[int, int]]) -> array:
+    """Return ``positions`` as a flat ``array('Q')`` of player/opponent pairs."""
+    packed = array("Q")
+    for player, opponent in positions:
+        packed.append(player)
+        packed.append(opponent)
+    return packed
+
+
+def unpack(packed: array) -> list[tuple[int, int]]:
+    """Return the ``(player, opponent)`` pairs stored in ``packed``."""
+    return list(zip(packed[::2], packed[1::2]))
+
+
+def _use_numpy(use_numpy: bool | None) -> bool:
+    if use_numpy is None:
+        return HAVE_NUMPY
+    if use_numpy and not HAVE_NUMPY:
+        raise RuntimeError("NumPy is not installed")
+    return use_numpy
+
+
+def _view(packed: array):
+    return np.frombuffer(memoryview(packed), dtype=np.uint64).reshape(-1, 2)
+
+
+def _to_array(values) -> array:
+    result = array("Q")
+    result.frombytes(np.ascontiguousarray(values, dtype=np.uint64).tobytes())
+    return result
+
+
+def _np_shift(bb, shift: int, mask):
+    if shift > 0:
+        return (bb << np.uint64(shift)) & mask
+    return (bb >> np.uint64(-shift)) & mask
+
+
+def _np_legal_moves(player, opponent):
+    empty = ~(player | opponent)
+    moves = np.zeros_like(player)
+    for shift, mask in _DIRECTIONS:
+        mask = np.uint64(mask)
+        inner = opponent & mask
+        line = _np_shift(player, shift, inner)
+        for _ in range(5):
+            line |= _np_shift(line, shift, inner)
+        moves |= _np_shift(line, shift, mask) & empty
+    return moves
+
+
+def _np_flips(moves, player, opponent):
+    flips = np.zeros_like(player)
+    zero = np.uint64(0)
+    for shift, mask in _DIRECTIONS:
+        mask = np.uint64(mask)
+        inner = opponent & mask
+        line = _np_shift(moves, shift, inner)
+        for _ in range(5):
+            line |= _np_shift(line, shift, inner)
+        closed = (_np_shift(line, shift, mask) & player) != zero
+        flips |= np.where(closed, line, zero)
+    return flips
+
+
+def batch_legal_moves(packed: array, use_numpy: bool | None = None) -> array:
+    """Return the legal-move mask of every position in ``packed``.
+
+    ``use_numpy`` forces (``True``) or disables (``False``) the NumPy kernel;
+    by default it is used whenever NumPy is available.
+    """
+    if _use_numpy(use_numpy):
+        pos = _view(packed)
+        return _to_array(_np_legal_moves(pos[:, 0], pos[:, 1]))
+    legal_moves = _BOARD.legal_moves
+    return array(
+        "Q", [legal_moves(p, o) for p, o in zip(packed[::2], packed[1::2])]
+    )
+
+
+def batch_flips(packed: array, moves: array, use_numpy: bool | None = None) -> array:
+    """Return the discs flipped by ``moves[i]`` in the ``i``-th position."""
+    if len(moves) * 2 != len(packed):
+        raise ValueError("moves and positions differ in length")
+    if _use_numpy(use_numpy):
+        pos = _view(packed)
+        move_view = np.frombuffer(memoryview(moves), dtype=np.uint64)
+        return _to_array(_np_flips(move_view, pos[:, 0], pos[:, 1]))
+    flips = _BOARD.flips
+    return array(
+        "Q",
+        [flips(m, p, o) for m, p, o in zip(moves, packed[::2], packed[1::2])],
+    )
+
+
+def batch_apply(packed: array, moves: array, use_numpy: bool | None = None) -> array:
+    """Return the positions after playing ``moves``, seen from the next mover.
+
+    Each ``(player, opponent)`` pair becomes ``(opponent', player')`` so the
+    result can be fed straight back into :func:`batch_legal_moves`.  Moves
+    are not validated; a move that flips nothing just places a disc.
+    """
+    flips = batch_flips(packed, moves, use_numpy)
+    if _use_numpy(use_numpy):
+        pos = _view(packed)
+        move_view = np.frombuffer(memoryview(moves), dtype=np.uint64)
+        flip_view = np.frombuffer(memoryview(flips), dtype=np.uint64)
+        result = np.empty_like(pos)
+        result[:, 0] = pos[:, 1] ^ flip_view
+        result[:, 1] = pos[:, 0] | move_view | flip_view
+        return _to_array(result)
+    result = array("Q", bytes(len(packed) * packed.itemsize))
+    for i, (move, flip) in enumerate(zip(moves, flips)):
+        player, opponent = packed[2 * i], packed[2 * i + 1]
+        result[2 * i] = opponent ^ flip
+        result[2 * i + 1] = player | move | flip
+    return result
+
+
+def batch_expand(packed: array, legal: array, use_numpy: bool | None = None) -> tuple[array, array, array]:
+    """Return one entry per legal move of every position in ``packed``.
+
+    The result is ``(index, positions, moves)``: ``index[j]`` is the position
+    the ``j``-th candidate belongs to, ``positions`` holds that position's
+    player/opponent pair again and ``moves[j]`` the move itself.  Candidates
+    are grouped by position, with moves in ascending bit order.
+    """
+    if _use_numpy(use_numpy):
+        pos = _view(packed)
+        legal_view = np.frombuffer(memoryview(legal), dtype=np.uint64)
+        index_parts = []
+        move_parts = []
+        for bit in range(64):
+            move = np.uint64(1 << bit)
+            (hits,) = np.nonzero(legal_view & move)
+            index_parts.append(hits)
+            move_parts.append(np.full(len(hits), move, dtype=np.uint64))
+        index = np.concatenate(index_parts)
+        order = np.argsort(index, kind="stable")
+        index = index[order]
+        return (
+            _to_array(index),
+            _to_array(pos[index]),
+            _to_array(np.concatenate(move_parts)[order]),
+        )
+    index = array("Q")
+    positions = array("Q")
+    moves = array("Q")
+    for i, mask in enumerate(legal):
+        player, opponent = packed[2 * i], packed[2 * i + 1]
+        while mask:
+            lsb = mask & -mask
+            index.append(i)
+            positions.append(player)
+            positions.append(opponent)
+            moves.append(lsb)
+            mask ^= lsb
+    return index, positions, moves
+
+
+@lru_cache(maxsize=None)
+def _np_tables():
+    popcount = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+    # Byte ``k`` of a little-endian uint64 holds row ``7 - k``.
+    tables = _row_tables(8)
+    rows = np.array(tables[::-1] if sys.byteorder == "little" else tables, dtype=np.int64)
+    return popcount, rows
+
+
+def _bytes(values: array):
+    return np.frombuffer(memoryview(values), dtype=np.uint8).reshape(-1, 8)
+
+
+def batch_popcount(values: array, use_numpy: bool | None = None) -> array:
+    """Return the number of set bits of every value."""
+    if _use_numpy(use_numpy):
+        popcount, _ = _np_tables()
+        return array("q", popcount[_bytes(values)].sum(axis=1).tobytes())
+    return array("q", [value.bit_count() for value in values])
+
+
+def batch_positional(values: array, use_numpy: bool | None = None) -> array:
+    """Return :func:`~othello.evaluate.positional` of every 8x8 bitboard."""
+    if _use_numpy(use_numpy):
+        _, rows = _np_tables()
+        return array("q", rows[np.arange(8), _bytes(values)].sum(axis=1).tobytes())
+    return array("q", [positional(value) for value in values])
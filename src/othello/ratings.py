@@ -0,0 +1,380 @@
+"""Persistent results store with Glicko ratings and a leaderboard.
+
+Finished games are kept in an SQLite database (WAL mode) together with one
+row per player and game in ``results``, so a player's history is a single
+index range scan and the leaderboard reads the ``rating`` index from the
+top.  Ratings are updated incrementally with Glicko-1, treating every game
+as its own rating period.
+
+Historic logs can be imported with :meth:`RatingStore.import_logs`.  A log
+has one game per line::
+
+    <unix time>\\t<black>\\t<white>\\t<transcript>
+
+The final score is taken from replaying the transcript.
+"""
+
+from __future__ import annotations
+import math
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from .replay import _chunks, final_position, parse_record
+
+INITIAL_RATING = 1500.0
+INITIAL_RD = 350.0
+MIN_RD = 30.0
+RD_GROWTH = 10.0
+
+_Q = math.log(10) / 400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    rating REAL NOT NULL,
+    rd REAL NOT NULL,
+    games INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS players_rating ON players (rating DESC);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played REAL NOT NULL,
+    black INTEGER NOT NULL REFERENCES players (id),
+    white INTEGER NOT NULL REFERENCES players (id),
+    black_discs INTEGER NOT NULL,
+    white_discs INTEGER NOT NULL,
+    moves TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    player INTEGER NOT NULL,
+    game INTEGER NOT NULL,
+    opponent INTEGER NOT NULL,
+    black INTEGER NOT NULL,
+    score REAL NOT NULL,
+    rating REAL NOT NULL,
+    PRIMARY KEY (player, game)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(frozen=True)
+class GameResult:
+    """A finished game to be recorded."""
+
+    black: str
+    white: str
+    black_discs: int
+    white_discs: int
+    moves: str = ""
+    played: float | None = None
+
+
+@dataclass
+class Player:
+    """A player's current rating and record."""
+
+    name: str
+    rating: float
+    rd: float
+    games: int
+    wins: int
+    losses: int
+    draws: int
+
+
+def _g(rd: float) -> float:
+    return 1 / math.sqrt(1 + 3 * (_Q * rd) ** 2 / math.pi**2)
+
+
+def expected_score(rating: float, opponent: float, opponent_rd: float = 0.0) -> float:
+    """Return the expected score against ``opponent``."""
+    return 1 / (1 + 10 ** (-_g(opponent_rd) * (rating - opponent) / 400))
+
+
+def glicko_update(
+    rating: float, rd: float, opponent: float, opponent_rd: float, score: float
+) -> tuple[float, float]:
+    """Return the new ``(rating, rd)`` after one game scoring ``score``.
+
+    ``rd`` first grows by :data:`RD_GROWTH` to account for the time since
+    the previous game and never drops below :data:`MIN_RD`, so established
+    ratings keep moving.
+    """
+    rd = min(math.sqrt(rd * rd + RD_GROWTH * RD_GROWTH), INITIAL_RD)
+    g = _g(opponent_rd)
+    e = expected_score(rating, opponent, opponent_rd)
+    inverse = 1 / (rd * rd) + _Q * _Q * g * g * e * (1 - e)
+    rating += _Q / inverse * g * (score - e)
+    return rating, max(math.sqrt(1 / inverse), MIN_RD)
+
+
+def _tally(player: list, rating: float, rd: float, score: float) -> None:
+    player[1] = rating
+    player[2] = rd
+    player[3] += 1
+    if score == 1:
+        player[4] += 1
+    elif score == 0:
+        player[5] += 1
+    else:
+        player[6] += 1
+
+
+def parse_log_line(line: str) -> GameResult | None:
+    """Return the game on one log line, or ``None`` for blanks and comments.
+
+    Raises ``ValueError`` for a malformed line or an illegal transcript.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    played, black, white, moves = line.split("\t")
+    board, _ = final_position(parse_record(moves))
+    return GameResult(
+        black,
+        white,
+        board.black.bit_count(),
+        board.white.bit_count(),
+        moves,
+        float(played),
+    )
+
+
+def _parse_chunk(lines: list[str]) -> tuple[list[GameResult], int]:
+    """Return the games of ``lines`` and how many were skipped as unratable."""
+    games = []
+    skipped = 0
+    for line in lines:
+        try:
+            game = parse_log_line(line)
+        except ValueError:
+            skipped += 1
+            continue
+        if game is None:
+            continue
+        if game.black == game.white:
+            skipped += 1
+            continue
+        games.append(game)
+    return games, skipped
+
+
+class RatingStore:
+    """Record finished games and query ratings stored at ``path``.
+
+    Writes are grouped into one transaction per batch; readers in other
+    processes are not blocked thanks to WAL mode.  ``skipped`` counts the
+    log lines :meth:`import_logs` could not parse or rate.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self.skipped = 0
+        self._db = sqlite3.connect(path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "RatingStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record_game(
+        self,
+        black: str,
+        white: str,
+        black_discs: int,
+        white_discs: int,
+        moves: str = "",
+        played: float | None = None,
+    ) -> int:
+        """Record one game, update both ratings and return the game id.
+
+        Raises ``ValueError`` if ``black`` and ``white`` are the same player.
+        """
+        return self._record_batch(
+            [GameResult(black, white, black_discs, white_discs, moves, played)]
+        )
+
+    def record_games(self, games: Iterable[GameResult], batch_size: int = 10000) -> int:
+        """Record ``games`` in order and return how many were recorded.
+
+        Each batch of ``batch_size`` games is written in one transaction with
+        ``executemany``; a player's row is updated once per batch.  A game
+        between a player and themself raises ``ValueError`` and its batch is
+        not written.
+        """
+        count = 0
+        for batch in _chunks(games, batch_size):
+            self._record_batch(batch)
+            count += len(batch)
+        return count
+
+    def _record_batch(self, batch: list[GameResult]) -> int:
+        for game in batch:
+            if game.black == game.white:
+                raise ValueError(f"Player '{game.black}' cannot play both colours")
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            players = self._load_players({name for g in batch for name in (g.black, g.white)})
+            next_id = db.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM games").fetchone()[0]
+            now = time.time()
+            game_rows = []
+            result_rows = []
+            for game_id, game in enumerate(batch, next_id):
+                black = players[game.black]
+                white = players[game.white]
+                if game.black_discs > game.white_discs:
+                    score = 1.0
+                elif game.black_discs < game.white_discs:
+                    score = 0.0
+                else:
+                    score = 0.5
+                black_rating, black_rd = glicko_update(
+                    black[1], black[2], white[1], white[2], score
+                )
+                white_rating, white_rd = glicko_update(
+                    white[1], white[2], black[1], black[2], 1 - score
+                )
+                _tally(black, black_rating, black_rd, score)
+                _tally(white, white_rating, white_rd, 1 - score)
+                game_rows.append(
+                    (
+                        game_id,
+                        game.played if game.played is not None else now,
+                        black[0],
+                        white[0],
+                        game.black_discs,
+                        game.white_discs,
+                        game.moves,
+                    )
+                )
+                result_rows.append((black[0], game_id, white[0], 1, score, black_rating))
+                result_rows.append((white[0], game_id, black[0], 0, 1 - score, white_rating))
+            db.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?)", game_rows)
+            db.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)", result_rows)
+            db.executemany(
+                "UPDATE players SET rating = ?, rd = ?, games = ?, wins = ?, losses = ?,"
+                " draws = ? WHERE id = ?",
+                [(*row[1:], row[0]) for row in players.values()],
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return next_id
+
+    def _load_players(self, names: set[str]) -> dict[str, list]:
+        """Return ``[id, rating, rd, games, wins, losses, draws]`` per name."""
+        db = self._db
+        db.executemany(
+            "INSERT OR IGNORE INTO players (name, rating, rd) VALUES (?, ?, ?)",
+            [(name, INITIAL_RATING, INITIAL_RD) for name in names],
+        )
+        players = {}
+        names = list(names)
+        # Stay below SQLite's default limit on bound parameters.
+        for start in range(0, len(names), 500):
+            chunk = names[start : start + 500]
+            marks = ",".join("?" * len(chunk))
+            for row in db.execute(
+                "SELECT name, id, rating, rd, games, wins, losses, draws"
+                f" FROM players WHERE name IN ({marks})",
+                chunk,
+            ):
+                players[row[0]] = list(row[1:])
+        return players
+
+    def import_logs(
+        self, lines: Iterable[str], processes: int = 1, batch_size: int = 10000
+    ) -> int:
+        """Import historic log ``lines`` and return the number of games.
+
+        With ``processes`` above one the transcripts are replayed in a
+        :mod:`multiprocessing` pool; games are still rated in log order.
+        Malformed lines, illegal transcripts and games where one name plays
+        both colours cannot be rated; they are skipped and counted in
+        :attr:`skipped` so one bad line does not abort a long import.
+        """
+        if processes <= 1:
+            parsed = map(_parse_chunk, _chunks(lines, batch_size))
+            return self._import_parsed(parsed, batch_size)
+
+        import multiprocessing
+
+        with multiprocessing.Pool(processes) as pool:
+            chunk_size = max(1, batch_size // processes)
+            parsed = pool.imap(_parse_chunk, _chunks(lines, chunk_size))
+            return self._import_parsed(parsed, batch_size)
+
+    def _import_parsed(
+        self, parsed: Iterable[tuple[list[GameResult], int]], batch_size: int
+    ) -> int:
+        count = 0
+        for games, skipped in parsed:
+            self.skipped += skipped
+            count += self.record_games(games, batch_size)
+        return count
+
+    def player(self, name: str) -> Player | None:
+        """Return the rating and record of ``name``."""
+        row = self._db.execute(
+            "SELECT name, rating, rd, games, wins, losses, draws FROM players WHERE name = ?",
+            (name,),
+        ).fetchone()
+        return Player(*row) if row else None
+
+    def top(self, n: int = 10, min_games: int = 0) -> list[Player]:
+        """Return the ``n`` highest rated players with at least ``min_games``."""
+        rows = self._db.execute(
+            "SELECT name, rating, rd, games, wins, losses, draws FROM players"
+            " INDEXED BY players_rating WHERE games >= ? ORDER BY rating DESC LIMIT ?",
+            (min_games, n),
+        )
+        return [Player(*row) for row in rows]
+
+    def history(self, name: str, limit: int = 20) -> list[dict]:
+        """Return the latest ``limit`` games of ``name``, newest first."""
+        rows = self._db.execute(
+            "SELECT r.game, g.played, o.name, r.black, r.score, r.rating,"
+            " g.black_discs, g.white_discs"
+            " FROM players p"
+            " JOIN results r ON r.player = p.id"
+            " JOIN games g ON g.id = r.game"
+            " JOIN players o ON o.id = r.opponent"
+            " WHERE p.name = ? ORDER BY r.game DESC LIMIT ?",
+            (name, limit),
+        )
+        return [
+            {
+                "game": game,
+                "played": played,
+                "opponent": opponent,
+                "color": "B" if black else "W",
+                "score": score,
+                "rating": rating,
+                "discs": (b, w) if black else (w, b),
+            }
+            for game, played, opponent, black, score, rating, b, w in rows
+        ]
+
+
+def format_leaderboard(players: list[Player]) -> str:
+    """Return ``players`` as a printable table."""
+    lines = [f"{'#':>3} {'player':<20} {'rating':>7} {'±':>4} {'W-L-D':>14}"]
+    for rank, p in enumerate(players, 1):
+        record = f"{p.wins}-{p.losses}-{p.draws}"
+        lines.append(f"{rank:>3} {p.name:<20} {p.rating:7.0f} {p.rd:4.0f} {record:>14}")
+    return "\n".join(lines)
@@ -0,0 +1,241 @@
+"""Replay recorded games and collect per-ply statistics.
+
+A game record is a sequence of moves given either as bit masks or as a
+transcript string such as ``"f5d6c3"``.  Passes are not written in the
+record; they are inferred when the side to move has no legal move.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Sequence
+
+from .board import BOARD_SIZE, BitBoard, format_move, parse_move
+from .game import Game
+
+
+def parse_record(record: str, size: int = BOARD_SIZE) -> list[int]:
+    """Return the moves of a transcript like ``"f5d6c3"`` as bit masks."""
+    moves = []
+    i = 0
+    text = record.strip()
+    while i < len(text):
+        j = i + 1
+        while j < len(text) and text[j].isdigit():
+            j += 1
+        moves.append(parse_move(text[i:j], size))
+        i = j
+    return moves
+
+
+def format_record(moves: Iterable[int], size: int = BOARD_SIZE) -> str:
+    """Return the transcript string for ``moves``."""
+    return "".join(format_move(move, size) for move in moves)
+
+
+def game_record(game: Game) -> list[int]:
+    """Return the moves that lead from the first to the last history entry."""
+    moves = []
+    for (before, _), (after, _) in zip(game.history, game.history[1:]):
+        moves.append(before.occupied() ^ after.occupied())
+    return moves
+
+
+def corner_mask(size: int = BOARD_SIZE) -> int:
+    """Return a mask of the four corner squares."""
+    total = size * size
+    return (1 << (total - 1)) | (1 << (total - size)) | (1 << (size - 1)) | 1
+
+
+def replay(
+    moves: Sequence[int], board: BitBoard | None = None
+) -> Iterator[tuple[BitBoard, bool, int, int, bool]]:
+    """Yield every position of a game record.
+
+    For each move this yields ``(board, black_to_move, legal, move, passed)``
+    describing the position before ``move`` is played; ``passed`` is true when
+    the previous player had to pass to reach it.  Boards are built directly
+    from the flip masks instead of going through :meth:`BitBoard.apply_move`.
+    Raises ``ValueError`` if a move in the record is not legal.
+    """
+    if board is None:
+        board = BitBoard.initial()
+    size = board.size
+    black, white = board.black, board.white
+    black_to_move = True
+    for ply, move in enumerate(moves):
+        player, opponent = (black, white) if black_to_move else (white, black)
+        legal = board.legal_moves(player, opponent)
+        passed = False
+        if not legal:
+            black_to_move = not black_to_move
+            player, opponent = opponent, player
+            legal = board.legal_moves(player, opponent)
+            passed = True
+        if not move & legal:
+            raise ValueError(f"Illegal move {format_move(move, size)} at ply {ply}")
+        yield board, black_to_move, legal, move, passed
+        flips = board.flips(move, player, opponent)
+        player |= move | flips
+        opponent ^= flips
+        black, white = (player, opponent) if black_to_move else (opponent, player)
+        board = BitBoard(black, white, size)
+        black_to_move = not black_to_move
+
+
+def final_position(
+    moves: Sequence[int], board: BitBoard | None = None
+) -> tuple[BitBoard, bool]:
+    """Return the board and side to move after playing all of ``moves``.
+
+    Like :func:`replay` this builds each board from the flip masks and
+    raises ``ValueError`` if a move in the record is not legal.
+    """
+    if board is None:
+        board = BitBoard.initial()
+    size = board.size
+    player, opponent = board.black, board.white
+    black_to_move = True
+    for ply, move in enumerate(moves):
+        legal = board.legal_moves(player, opponent)
+        if not legal:
+            black_to_move = not black_to_move
+            player, opponent = opponent, player
+            legal = board.legal_moves(player, opponent)
+        if not move & legal:
+            raise ValueError(f"Illegal move {format_move(move, size)} at ply {ply}")
+        flips = board.flips(move, player, opponent)
+        player, opponent = opponent ^ flips, player | move | flips
+        black_to_move = not black_to_move
+    black, white = (player, opponent) if black_to_move else (opponent, player)
+    return BitBoard(black, white, size), black_to_move
+
+
+@dataclass
+class ReplayStats:
+    """Per-ply totals accumulated over many games.
+
+    Index ``i`` of every list refers to the position before the ``i``-th move
+    of a game.  Totals are kept instead of averages so that partial results
+    from several workers can be merged with :meth:`merge`.
+    """
+
+    games: int = 0
+    positions: list[int] = field(default_factory=list)
+    mobility: list[int] = field(default_factory=list)
+    black_discs: list[int] = field(default_factory=list)
+    white_discs: list[int] = field(default_factory=list)
+    corner_captures: list[int] = field(default_factory=list)
+    passes: list[int] = field(default_factory=list)
+
+    def _grow(self, length: int) -> None:
+        missing = length - len(self.positions)
+        if missing > 0:
+            for column in self._columns():
+                column.extend([0] * missing)
+
+    def _columns(self) -> tuple[list[int], ...]:
+        return (
+            self.positions,
+            self.mobility,
+            self.black_discs,
+            self.white_discs,
+            self.corner_captures,
+            self.passes,
+        )
+
+    def add_game(self, moves: Sequence[int], board: BitBoard | None = None) -> None:
+        """Replay ``moves`` and add every position to the totals."""
+        self._grow(len(moves))
+        corners = corner_mask(board.size if board is not None else BOARD_SIZE)
+        positions = self.positions
+        mobility = self.mobility
+        black_discs = self.black_discs
+        white_discs = self.white_discs
+        corner_captures = self.corner_captures
+        passes = self.passes
+        ply = 0
+        for position, _, legal, move, passed in replay(moves, board):
+            positions[ply] += 1
+            mobility[ply] += legal.bit_count()
+            black_discs[ply] += position.black.bit_count()
+            white_discs[ply] += position.white.bit_count()
+            if move & corners:
+                corner_captures[ply] += 1
+            if passed:
+                passes[ply] += 1
+            ply += 1
+        self.games += 1
+
+    def merge(self, other: "ReplayStats") -> None:
+        """Add the totals of ``other`` to this instance."""
+        self._grow(len(other.positions))
+        for mine, theirs in zip(self._columns(), other._columns()):
+            for i, value in enumerate(theirs):
+                mine[i] += value
+        self.games += other.games
+
+    def summary(self) -> list[dict[str, float]]:
+        """Return per-ply averages of every statistic."""
+        rows = []
+        for ply, count in enumerate(self.positions):
+            if not count:
+                continue
+            rows.append(
+                {
+                    "ply": ply,
+                    "positions": count,
+                    "mobility": self.mobility[ply] / count,
+                    "black_discs": self.black_discs[ply] / count,
+                    "white_discs": self.white_discs[ply] / count,
+                    "corner_rate": self.corner_captures[ply] / count,
+                    "pass_rate": self.passes[ply] / count,
+                }
+            )
+        return rows
+
+
+def _stats_for_chunk(chunk: list[Sequence[int] | str]) -> ReplayStats:
+    stats = ReplayStats()
+    for record in chunk:
+        moves = parse_record(record) if isinstance(record, str) else record
+        stats.add_game(moves)
+    return stats
+
+
+def _chunks(records: Iterable, chunk_size: int) -> Iterator[list]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def collect_stats(
+    records: Iterable[Sequence[int] | str],
+    processes: int = 1,
+    chunk_size: int = 1000,
+) -> ReplayStats:
+    """Return statistics over standard 8x8 game ``records``.
+
+    ``records`` may be any iterable (for example lines read lazily from a
+    file), so memory use depends on ``chunk_size`` rather than the number of
+    games.  With ``processes`` above one, chunks are replayed in a
+    :mod:`multiprocessing` pool and the partial results merged.
+    """
+    total = ReplayStats()
+    if processes <= 1:
+        for chunk in _chunks(records, chunk_size):
+            total.merge(_stats_for_chunk(chunk))
+        return total
+
+    import multiprocessing
+
+    with multiprocessing.Pool(processes) as pool:
+        for partial in pool.imap_unordered(
+            _stats_for_chunk, _chunks(records, chunk_size)
+        ):
+            total.merge(partial)
+    return total
@@ -0,0 +1,198 @@
+"""Reproducible benchmark scenarios for comparing two builds.
+
+A scenario file is JSON::
+
+    {
+        "seed": 1,
+        "repeat": 5,
+        "scenarios": [
+            {"id": "opening-easy", "level": "easy", "moves": "f5d6c3", "seed": 42},
+            {"id": "corner", "level": "expert", "board": ["........", ...], "to_move": "W"}
+        ]
+    }
+
+Every scenario pins a position (``moves`` played from the initial board, or
+an ASCII ``board`` with ``to_move``), an AI ``level`` and a ``seed``.
+Scenarios without a seed get one derived from the file seed and their id,
+so results do not depend on how scenarios are spread over workers.
+
+Run a file with ``python -m othello.scenario run FILE -o RESULT.json`` on
+each build, then ``python -m othello.scenario compare BASE.json NEW.json``
+to report timing ratios and moves that differ.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+from .ai import choose_move
+from .board import BOARD_SIZE, BitBoard, format_move
+from .replay import final_position, parse_record
+
+
+def derive_seed(base: int, *keys: object) -> int:
+    """Return a 64-bit seed derived from ``base`` and ``keys``.
+
+    The result is stable across processes and Python versions, unlike
+    :func:`hash` on strings.
+    """
+    text = ":".join(str(k) for k in (base, *keys)).encode()
+    return int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(), "big")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A pinned position, AI level and seed."""
+
+    id: str
+    level: str
+    board: BitBoard
+    black_to_move: bool
+    seed: int
+
+
+def parse_scenarios(data: dict) -> list[Scenario]:
+    """Return the scenarios described by a decoded scenario file."""
+    base = data.get("seed", 0)
+    scenarios = []
+    seen = set()
+    for entry in data["scenarios"]:
+        scenario_id = entry["id"]
+        if scenario_id in seen:
+            raise ValueError(f"Duplicate scenario id '{scenario_id}'")
+        seen.add(scenario_id)
+        if "board" in entry:
+            board = BitBoard.from_ascii("\n".join(entry["board"]))
+            black_to_move = entry.get("to_move", "B") == "B"
+        else:
+            size = entry.get("size", BOARD_SIZE)
+            moves = parse_record(entry.get("moves", ""), size)
+            board, black_to_move = final_position(moves, BitBoard.initial(size))
+        seed = entry.get("seed", derive_seed(base, scenario_id))
+        scenarios.append(
+            Scenario(scenario_id, entry.get("level", "easy"), board, black_to_move, seed)
+        )
+    return scenarios
+
+
+def load_scenarios(path: str) -> tuple[list[Scenario], int]:
+    """Return the scenarios and repeat count stored in ``path``."""
+    with open(path) as f:
+        data = json.load(f)
+    return parse_scenarios(data), data.get("repeat", 5)
+
+
+def run_scenario(scenario: Scenario, repeat: int = 5) -> dict:
+    """Run ``scenario`` ``repeat`` times and return its move and median time.
+
+    Each repetition starts from a fresh generator seeded with the scenario
+    seed, so every run sees the same random choices.
+    """
+    times = []
+    moves = set()
+    for _ in range(repeat):
+        rng = random.Random(scenario.seed)
+        start = time.perf_counter()
+        move = choose_move(
+            scenario.board, scenario.black_to_move, level=scenario.level, rng=rng
+        )
+        times.append(time.perf_counter() - start)
+        moves.add(move)
+    move = moves.pop()
+    return {
+        "move": format_move(move, scenario.board.size) if move else "pass",
+        "seconds": statistics.median(times),
+        "deterministic": not moves,
+    }
+
+
+def _run(args: tuple[Scenario, int]) -> tuple[str, dict]:
+    scenario, repeat = args
+    return scenario.id, run_scenario(scenario, repeat)
+
+
+def run_scenarios(scenarios: list[Scenario], repeat: int = 5, workers: int = 1) -> dict:
+    """Return results for ``scenarios`` keyed by scenario id.
+
+    With ``workers`` above one the scenarios run in a process pool; chosen
+    moves are unaffected but timings then include contention.
+    """
+    jobs = [(scenario, repeat) for scenario in scenarios]
+    if workers <= 1:
+        results = dict(map(_run, jobs))
+    else:
+        import multiprocessing
+
+        with multiprocessing.Pool(workers) as pool:
+            results = dict(pool.map(_run, jobs))
+    return {"python": sys.version.split()[0], "repeat": repeat, "scenarios": results}
+
+
+def compare(base: dict, other: dict) -> list[str]:
+    """Return report lines comparing two result dictionaries."""
+    lines = []
+    ratios = []
+    differences = 0
+    for scenario_id, old in base["scenarios"].items():
+        new = other["scenarios"].get(scenario_id)
+        if new is None:
+            lines.append(f"{scenario_id:<24} missing from second run")
+            continue
+        ratio = new["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        ratios.append(ratio)
+        note = ""
+        if new["move"] != old["move"]:
+            differences += 1
+            note = f"  MOVE {old['move']} -> {new['move']}"
+        lines.append(
+            f"{scenario_id:<24} {old['seconds'] * 1000:9.3f}ms {new['seconds'] * 1000:9.3f}ms "
+            f"x{ratio:6.2f}{note}"
+        )
+    if ratios:
+        lines.append(
+            f"geometric mean time ratio x{statistics.geometric_mean(ratios):.3f}, "
+            f"{differences} move difference(s)"
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point used by ``python -m othello.scenario``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run or compare benchmark scenarios")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="Run a scenario file")
+    run.add_argument("file")
+    run.add_argument("-o", "--output", help="Write results as JSON to this file")
+    run.add_argument("--workers", type=int, default=1)
+    run.add_argument("--repeat", type=int, help="Override the file's repeat count")
+    cmp = sub.add_parser("compare", help="Compare two result files")
+    cmp.add_argument("base")
+    cmp.add_argument("other")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        scenarios, repeat = load_scenarios(args.file)
+        results = run_scenarios(scenarios, args.repeat or repeat, args.workers)
+        text = json.dumps(results, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+    else:
+        with open(args.base) as f:
+            base = json.load(f)
+        with open(args.other) as f:
+            other = json.load(f)
+        print("\n".join(compare(base, other)))
+
+
+if __name__ == "__main__":
+    main()
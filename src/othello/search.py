@@ -0,0 +1,374 @@
+"""Alpha-beta search with an optional ProbCut selective layer.
+
+ProbCut assumes that the score of a deep search can be predicted from a
+shallow one as ``deep ~= a * shallow + b`` with normally distributed error
+``sigma``.  Before searching a node deeply, a cheap null-window search at the
+shallow depth checks whether the predicted deep score is outside the
+``[alpha, beta]`` window by more than ``threshold * sigma``; if so the node is
+cut without a deep search.  The shallow depth is half the deep one and the
+model parameters are fitted offline with :func:`fit_probcut` for every
+``(shallow, deep)`` pair the search uses; depths without a fitted pair are
+searched normally.  The thresholds can be tuned per game phase.
+"""
+
+from __future__ import annotations
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .board import BitBoard
+from .evaluate import positional, weights
+
+INF = 1 << 30
+# Exact final results dominate any heuristic score.
+DISC_SCORE = 10000
+MOBILITY_WEIGHT = 10
+# ProbCut is only tried at nodes at least this deep.  At depth 3 the depth-1
+# probe costs about as many nodes as its cuts save.
+PROBCUT_MIN_DEPTH = 4
+PHASES = ("opening", "midgame", "endgame")
+# Transposition table entry bounds.
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class ProbCutParams:
+    """Linear model ``deep ~= a * shallow + b`` with residual deviation ``sigma``."""
+
+    a: float
+    b: float
+    sigma: float
+
+
+# Fitted with ``python benchmarks/fit_probcut.py 900``: 900 positions from
+# random games, one model per ``(shallow, deep)`` pair used at depths 4 to 6.
+# Deeper nodes have no fitted pair and are searched without ProbCut.
+DEFAULT_PROBCUT: dict[tuple[int, int], dict[str, ProbCutParams]] = {
+    (2, 4): {
+        "opening": ProbCutParams(a=0.969, b=0.0, sigma=13.44),
+        "midgame": ProbCutParams(a=1.003, b=2.13, sigma=18.57),
+        "endgame": ProbCutParams(a=1.014, b=14.7, sigma=43.21),
+    },
+    (2, 5): {
+        "opening": ProbCutParams(a=0.93, b=29.54, sigma=15.77),
+        "midgame": ProbCutParams(a=0.999, b=18.3, sigma=24.43),
+        "endgame": ProbCutParams(a=1.018, b=13.18, sigma=46.59),
+    },
+    (3, 6): {
+        "opening": ProbCutParams(a=1.022, b=-30.5, sigma=16.56),
+        "midgame": ProbCutParams(a=1.025, b=-16.67, sigma=26.44),
+        "endgame": ProbCutParams(a=1.045, b=11.76, sigma=54.44),
+    },
+}
+
+# Cut thresholds in units of ``sigma``.  ``None`` disables ProbCut in that
+# phase; near the end of the game exact search is cheap enough.  In
+# benchmarks/probcut_match.py at 0.1s per move, 1.5 and 2.0 scored below
+# 50% against plain alpha-beta (24 games each).  3.0 scored exactly 50% over
+# 300 colour-swapped games (+148 -148 =4, ``probcut_match.py 150 0.1 3.0``),
+# reaching 4.67 plies per move against 4.58, so ``Searcher`` leaves ProbCut
+# off unless asked for.
+DEFAULT_THRESHOLDS: dict[str, float | None] = {
+    "opening": 3.0,
+    "midgame": 3.0,
+    "endgame": None,
+}
+
+
+def probcut_pair(depth: int) -> tuple[int, int]:
+    """Return the ``(shallow, deep)`` search depths ProbCut uses at ``depth``."""
+    return depth // 2, depth
+
+
+def phase_of(empties: int, total: int = 64) -> str:
+    """Return the game phase name for a position with ``empties`` empty squares."""
+    if empties * 8 >= total * 5:
+        return "opening"
+    if empties * 4 >= total:
+        return "midgame"
+    return "endgame"
+
+
+class SearchStopped(Exception):
+    """Raised out of a search that ran out of time or was stopped."""
+
+
+@dataclass
+class Searcher:
+    """Negamax alpha-beta search over raw ``(player, opponent)`` bitboards.
+
+    ``probcut`` enables the selective layer; it is off by default because
+    it has not shown a significant gain at equal time.  ``thresholds`` and ``params``
+    override the defaults per phase; phases missing from either mapping do
+    not use ProbCut.  The transposition table is kept between searches and
+    holds at most ``tt_size`` positions, dropping the oldest entries first.
+    """
+
+    probcut: bool = False
+    thresholds: dict[str, float | None] = field(
+        default_factory=lambda: dict(DEFAULT_THRESHOLDS)
+    )
+    params: dict[tuple[int, int], dict[str, ProbCutParams]] = field(
+        default_factory=lambda: {pair: dict(p) for pair, p in DEFAULT_PROBCUT.items()}
+    )
+    tt_size: int = 1 << 18
+    nodes: int = field(default=0, init=False)
+    probcut_cuts: int = field(default=0, init=False)
+    tt: dict[tuple[int, int], tuple[int, int, int, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _board: BitBoard = field(default_factory=BitBoard.initial, init=False, repr=False)
+    _deadline: float | None = field(default=None, init=False, repr=False)
+    _stop: bool = field(default=False, init=False, repr=False)
+
+    def evaluate(self, player: int, opponent: int) -> int:
+        """Return a heuristic score of the position for ``player``."""
+        board = self._board
+        size = board.size
+        mobility = (
+            board.legal_moves(player, opponent).bit_count()
+            - board.legal_moves(opponent, player).bit_count()
+        )
+        return (
+            positional(player, size)
+            - positional(opponent, size)
+            + MOBILITY_WEIGHT * mobility
+        )
+
+    def _ordered(self, legal: int, first: int = 0) -> list[int]:
+        table = weights(self._board.size)
+        last = self._board.geometry.total - 1
+        moves = []
+        while legal:
+            move = legal & -legal
+            moves.append(move)
+            legal ^= move
+        moves.sort(key=lambda m: -table[last - (m.bit_length() - 1)])
+        if first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def _store(self, key: tuple[int, int], depth: int, bound: int, score: int, move: int) -> None:
+        tt = self.tt
+        if key not in tt and len(tt) >= self.tt_size:
+            del tt[next(iter(tt))]
+        tt[key] = (depth, bound, score, move)
+
+    def tt_move(self, board: BitBoard, black_to_move: bool) -> int:
+        """Return the best move stored for this position, or ``0``."""
+        player = board.black if black_to_move else board.white
+        opponent = board.white if black_to_move else board.black
+        entry = self.tt.get((player, opponent))
+        return entry[3] if entry else 0
+
+    def principal_variation(self, board: BitBoard, black_to_move: bool, length: int = 8) -> list[int]:
+        """Return the expected line of play found in the transposition table."""
+        line = []
+        for _ in range(length):
+            move = self.tt_move(board, black_to_move)
+            player = board.black if black_to_move else board.white
+            opponent = board.white if black_to_move else board.black
+            if not move & board.legal_moves(player, opponent):
+                break
+            line.append(move)
+            board = board.apply_move(move, black_to_move)
+            black_to_move = not black_to_move
+        return line
+
+    def stop(self) -> None:
+        """Ask a search running on another thread to stop as soon as possible."""
+        self._stop = True
+
+    def clear_stop(self) -> None:
+        """Allow searching again after :meth:`stop`."""
+        self._stop = False
+
+    def negamax(
+        self,
+        player: int,
+        opponent: int,
+        depth: int,
+        alpha: int,
+        beta: int,
+        passed: bool = False,
+    ) -> int:
+        """Return the score of the position for ``player`` searched to ``depth``."""
+        self.nodes += 1
+        if not self.nodes & 1023:
+            if self._stop or (
+                self._deadline is not None and time.perf_counter() > self._deadline
+            ):
+                raise SearchStopped
+        board = self._board
+        legal = board.legal_moves(player, opponent)
+        if not legal:
+            if passed:
+                return (player.bit_count() - opponent.bit_count()) * DISC_SCORE
+            return -self.negamax(opponent, player, depth, -beta, -alpha, True)
+        if depth == 0:
+            return self.evaluate(player, opponent)
+        key = (player, opponent)
+        entry = self.tt.get(key)
+        tt_move = 0
+        if entry is not None:
+            entry_depth, bound, score, tt_move = entry
+            if entry_depth >= depth and (
+                bound == EXACT
+                or (bound == LOWER and score >= beta)
+                or (bound == UPPER and score <= alpha)
+            ):
+                return score
+        if self.probcut and depth >= PROBCUT_MIN_DEPTH:
+            cut = self._probcut(player, opponent, depth, alpha, beta)
+            if cut is not None:
+                return cut
+        best, best_move = -INF, 0
+        for move in self._ordered(legal, tt_move):
+            flips = board.flips(move, player, opponent)
+            score = -self.negamax(
+                opponent ^ flips,
+                player | move | flips,
+                depth - 1,
+                -beta,
+                -max(alpha, best),
+            )
+            if score > best:
+                best, best_move = score, move
+                if best >= beta:
+                    break
+        if best >= beta:
+            bound = LOWER
+        elif best <= alpha:
+            bound = UPPER
+        else:
+            bound = EXACT
+        self._store(key, depth, bound, best, best_move)
+        return best
+
+    def _probcut(
+        self, player: int, opponent: int, depth: int, alpha: int, beta: int
+    ) -> int | None:
+        geom = self._board.geometry
+        empties = geom.total - (player | opponent).bit_count()
+        phase = phase_of(empties, geom.total)
+        threshold = self.thresholds.get(phase)
+        shallow, _ = pair = probcut_pair(depth)
+        params = self.params.get(pair, {}).get(phase)
+        if threshold is None or params is None:
+            return None
+        margin = threshold * params.sigma
+        bound = round((beta + margin - params.b) / params.a)
+        if bound < INF and self.negamax(player, opponent, shallow, bound - 1, bound) >= bound:
+            self.probcut_cuts += 1
+            return beta
+        bound = round((alpha - margin - params.b) / params.a)
+        if bound > -INF and self.negamax(player, opponent, shallow, bound, bound + 1) <= bound:
+            self.probcut_cuts += 1
+            return alpha
+        return None
+
+    def search(self, board: BitBoard, black_to_move: bool, depth: int) -> tuple[int, int]:
+        """Return ``(move, score)`` for the side to move searched to ``depth``.
+
+        ``move`` is ``0`` when the side to move has to pass.
+        """
+        self._board = board
+        player = board.black if black_to_move else board.white
+        opponent = board.white if black_to_move else board.black
+        legal = board.legal_moves(player, opponent)
+        if not legal:
+            return 0, -self.negamax(opponent, player, depth, -INF, INF, True)
+        key = (player, opponent)
+        entry = self.tt.get(key)
+        best_move, best = 0, -INF
+        for move in self._ordered(legal, entry[3] if entry else 0):
+            flips = board.flips(move, player, opponent)
+            score = -self.negamax(
+                opponent ^ flips, player | move | flips, depth - 1, -INF, -best
+            )
+            if score > best:
+                best_move, best = move, score
+        self._store(key, depth, EXACT, best, best_move)
+        return best_move, best
+
+    def best_move(
+        self,
+        board: BitBoard,
+        black_to_move: bool,
+        time_limit: float,
+        max_depth: int = 60,
+        start: tuple[int, int, int] = (0, 0, 0),
+    ) -> tuple[int, int, int]:
+        """Search with iterative deepening until ``time_limit`` seconds pass.
+
+        Returns ``(move, score, depth)`` from the deepest completed iteration.
+        ``start`` is a ``(move, score, depth)`` result already known for this
+        position, such as one from pondering; deepening resumes after its
+        depth and it is returned if no deeper iteration completes.
+        """
+        self._deadline = time.perf_counter() + time_limit
+        result = start
+        try:
+            for depth in range(start[2] + 1, max_depth + 1):
+                move, score = self.search(board, black_to_move, depth)
+                result = (move, score, depth)
+                if abs(score) >= DISC_SCORE or depth >= board.empty().bit_count():
+                    break
+        except SearchStopped:
+            pass
+        finally:
+            self._deadline = None
+        if result[0] == 0 and result[2] == 0:
+            player = board.black if black_to_move else board.white
+            opponent = board.white if black_to_move else board.black
+            legal = board.legal_moves(player, opponent)
+            result = (legal & -legal, 0, 0)
+        return result
+
+
+def fit_probcut(
+    positions: Iterable[tuple[BitBoard, bool]], depths: Iterable[int] = (4,)
+) -> dict[tuple[int, int], dict[str, ProbCutParams]]:
+    """Fit ProbCut parameters per phase for the depth pairs of ``depths``.
+
+    ``positions`` are ``(board, black_to_move)`` pairs, typically sampled from
+    self-play.  For every deep depth in ``depths`` each position is searched
+    without ProbCut at the :func:`probcut_pair` depths, and a least squares
+    line is fitted to the score pairs of every phase.  Returns the
+    parameters keyed by ``(shallow, deep)`` as in :data:`DEFAULT_PROBCUT`.
+    """
+    pairs = [probcut_pair(depth) for depth in depths]
+    searched = sorted({d for pair in pairs for d in pair})
+    searcher = Searcher(probcut=False)
+    samples: dict[tuple[int, int], dict[str, list[tuple[int, int]]]] = {
+        pair: {phase: [] for phase in PHASES} for pair in pairs
+    }
+    for board, black_to_move in positions:
+        scores = {d: searcher.search(board, black_to_move, d)[1] for d in searched}
+        phase = phase_of(board.empty().bit_count(), board.geometry.total)
+        for shallow, deep in pairs:
+            low, high = scores[shallow], scores[deep]
+            if abs(low) >= DISC_SCORE or abs(high) >= DISC_SCORE:
+                continue
+            samples[shallow, deep][phase].append((low, high))
+    return {pair: _fit_phases(by_phase) for pair, by_phase in samples.items()}
+
+
+def _fit_phases(samples: dict[str, list[tuple[int, int]]]) -> dict[str, ProbCutParams]:
+    fitted = {}
+    for phase, pairs in samples.items():
+        if len(pairs) < 2:
+            continue
+        n = len(pairs)
+        mean_x = sum(x for x, _ in pairs) / n
+        mean_y = sum(y for _, y in pairs) / n
+        var_x = sum((x - mean_x) ** 2 for x, _ in pairs)
+        if not var_x:
+            continue
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+        a = cov / var_x
+        b = mean_y - a * mean_x
+        sigma = (sum((y - a * x - b) ** 2 for x, y in pairs) / n) ** 0.5
+        fitted[phase] = ProbCutParams(round(a, 3), round(b, 2), round(sigma, 2))
+    return fitted
@@ -0,0 +1,328 @@
+"""Endgame tablebase of exactly solved late positions.
+
+:func:`build` collects every position with at most ``empties`` empty squares
+from a corpus of game records, solves each one exactly with a full-depth
+:class:`~othello.search.Searcher` in a process pool, and writes the results
+to a file of fixed-size records sorted by canonical key::
+
+    header   4s magic, I version, I empties, Q count       (big-endian)
+    record   Q player, Q opponent, b score, B square        (18 bytes)
+
+Positions are stored from the side to move and canonicalised over the eight
+board symmetries, so mirrored and rotated positions share one record.
+``score`` is the final disc difference with perfect play and ``square`` the
+bit index of the best move in the canonical orientation (255 to pass).
+
+:class:`Tablebase` memory-maps the file and answers lookups by binary search,
+so opening it costs nothing regardless of size.  Register one with
+:func:`set_tablebase` and the ``"master"`` AI plays from it instead of
+searching whenever the position is in the table.  Only 8x8 boards are
+supported.
+"""
+
+from __future__ import annotations
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Sequence
+
+from .board import BOARD_SIZE, BitBoard
+from .replay import parse_record, replay
+from .search import DISC_SCORE, Searcher
+
+MAGIC = b"OTBB"
+VERSION = 1
+PASS_SQUARE = 255
+
+_HEADER = struct.Struct(">4sIIQ")
+_RECORD = struct.Struct(">QQbB")
+
+_K1 = 0x5500550055005500
+_K2 = 0x3333000033330000
+_K4 = 0x0F0F0F0F00000000
+_M1 = 0x5555555555555555
+_M2 = 0x3333333333333333
+_M4 = 0x0F0F0F0F0F0F0F0F
+
+
+def _flip_diagonal(x: int) -> int:
+    t = _K4 & (x ^ (x << 28))
+    x ^= t ^ (t >> 28)
+    t = _K2 & (x ^ (x << 14))
+    x ^= t ^ (t >> 14)
+    t = _K1 & (x ^ (x << 7))
+    return x ^ t ^ (t >> 7)
+
+
+def _flip_vertical(x: int) -> int:
+    return int.from_bytes(x.to_bytes(8, "big"), "little")
+
+
+def _mirror_horizontal(x: int) -> int:
+    x = ((x >> 1) & _M1) | ((x & _M1) << 1)
+    x = ((x >> 2) & _M2) | ((x & _M2) << 2)
+    return ((x >> 4) & _M4) | ((x & _M4) << 4)
+
+
+def transform(x: int, symmetry: int) -> int:
+    """Return bitboard ``x`` under ``symmetry`` (0-7) of the square."""
+    if symmetry & 1:
+        x = _flip_diagonal(x)
+    if symmetry & 2:
+        x = _flip_vertical(x)
+    if symmetry & 4:
+        x = _mirror_horizontal(x)
+    return x
+
+
+def untransform(x: int, symmetry: int) -> int:
+    """Undo :func:`transform` with the same ``symmetry``."""
+    if symmetry & 4:
+        x = _mirror_horizontal(x)
+    if symmetry & 2:
+        x = _flip_vertical(x)
+    if symmetry & 1:
+        x = _flip_diagonal(x)
+    return x
+
+
+def canonical(player: int, opponent: int) -> tuple[int, int, int]:
+    """Return ``(player, opponent, symmetry)`` with the smallest key."""
+    best = (player, opponent, 0)
+    for symmetry in range(1, 8):
+        key = (transform(player, symmetry), transform(opponent, symmetry), symmetry)
+        if key < best:
+            best = key
+    return best
+
+
+@dataclass(frozen=True)
+class BuildStats:
+    """Throughput of one :func:`build` run."""
+
+    games: int
+    positions: int
+    nodes: int
+    seconds: float
+
+    @property
+    def positions_per_second(self) -> float:
+        return self.positions / self.seconds if self.seconds else 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+def corpus_positions(
+    records: Iterable[Sequence | str], empties: int
+) -> tuple[dict[tuple[int, int], tuple[int, int]], int]:
+    """Return the positions with at most ``empties`` empty squares.
+
+    The result maps each canonical key to the first ``(player, opponent)``
+    seen for it, in corpus order.  ``records`` are transcripts or move lists
+    as for :mod:`othello.replay`; for tab-separated lines (such as results
+    logs) the last field is used.  Also returns the number of games read.
+    """
+    positions = {}
+    games = 0
+    for record in records:
+        if isinstance(record, str):
+            record = record.strip().rsplit("\t", 1)[-1]
+            if not record or record.startswith("#"):
+                continue
+            record = parse_record(record)
+        games += 1
+        for board, black_to_move, _, _, _ in replay(record):
+            if board.empty().bit_count() > empties:
+                continue
+            player = board.black if black_to_move else board.white
+            opponent = board.white if black_to_move else board.black
+            positions.setdefault(canonical(player, opponent)[:2], (player, opponent))
+    return positions, games
+
+
+def _solve_chunk(chunk: list[tuple[int, int]]) -> tuple[list[tuple[int, int, int, int]], int]:
+    searcher = Searcher(probcut=False)
+    results = []
+    for player, opponent in chunk:
+        board = BitBoard(player, opponent)
+        move, score = searcher.search(board, True, board.empty().bit_count())
+        key_player, key_opponent, symmetry = canonical(player, opponent)
+        move = transform(move, symmetry)
+        square = move.bit_length() - 1 if move else PASS_SQUARE
+        results.append((key_player, key_opponent, score // DISC_SCORE, square))
+    return results, searcher.nodes
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def build(
+    records: Iterable[Sequence | str],
+    path: str,
+    empties: int = 10,
+    processes: int = 1,
+    chunk_size: int = 16,
+) -> BuildStats:
+    """Solve the late positions of ``records`` and write a tablebase to ``path``.
+
+    Positions are solved as they were played and in corpus order, so the
+    later positions of a game usually land in the same worker as the
+    earlier ones and are found in its transposition table.
+    """
+    start = time.perf_counter()
+    positions, games = corpus_positions(records, empties)
+    ordered = list(positions.values())
+    results = []
+    nodes = 0
+    if processes <= 1:
+        solved = map(_solve_chunk, _chunks(ordered, chunk_size))
+        for chunk_results, chunk_nodes in solved:
+            results.extend(chunk_results)
+            nodes += chunk_nodes
+    else:
+        import multiprocessing
+
+        with multiprocessing.Pool(processes) as pool:
+            for chunk_results, chunk_nodes in pool.imap_unordered(
+                _solve_chunk, _chunks(ordered, chunk_size)
+            ):
+                results.extend(chunk_results)
+                nodes += chunk_nodes
+    results.sort()
+    write(path, results, empties)
+    return BuildStats(games, len(results), nodes, time.perf_counter() - start)
+
+
+def write(path: str, records: list[tuple[int, int, int, int]], empties: int) -> None:
+    """Write sorted ``(player, opponent, score, square)`` records to ``path``."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, empties, len(records)))
+        pack = _RECORD.pack
+        for record in records:
+            f.write(pack(*record))
+    os.replace(tmp, path)
+
+
+class Tablebase:
+    """Read-only view of a tablebase file written by :func:`build`."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{path} is not a tablebase")
+        magic, version, self.empties, self.count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} tablebase")
+        if len(self._map) != _HEADER.size + self.count * _RECORD.size:
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def _find(self, player: int, opponent: int) -> tuple[int, int] | None:
+        key = (player, opponent)
+        unpack = _RECORD.unpack_from
+        data = self._map
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            p, o, score, square = unpack(data, _HEADER.size + mid * _RECORD.size)
+            if (p, o) < key:
+                lo = mid + 1
+            elif (p, o) > key:
+                hi = mid
+            else:
+                return score, square
+        return None
+
+    def probe(self, player: int, opponent: int) -> tuple[int, int] | None:
+        """Return ``(score, move)`` for the side to move, or ``None``.
+
+        ``move`` is ``0`` when the side to move has to pass.
+        """
+        if 64 - (player | opponent).bit_count() > self.empties:
+            return None
+        key_player, key_opponent, symmetry = canonical(player, opponent)
+        found = self._find(key_player, key_opponent)
+        if found is None:
+            return None
+        score, square = found
+        if square == PASS_SQUARE:
+            return score, 0
+        return score, untransform(1 << square, symmetry)
+
+    def lookup(self, board: BitBoard, black_to_move: bool) -> tuple[int, int] | None:
+        """Return ``(score, move)`` for the side to move on ``board``, or ``None``."""
+        if board.size != BOARD_SIZE:
+            return None
+        if black_to_move:
+            return self.probe(board.black, board.white)
+        return self.probe(board.white, board.black)
+
+
+_tablebase: Tablebase | None = None
+
+
+def set_tablebase(tablebase: Tablebase | None) -> None:
+    """Make the ``"master"`` AI consult ``tablebase`` (``None`` disables it)."""
+    global _tablebase
+    _tablebase = tablebase
+
+
+def get_tablebase() -> Tablebase | None:
+    """Return the tablebase used by the AI, if any."""
+    return _tablebase
+
+
+def lookup(board: BitBoard, black_to_move: bool) -> tuple[int, int] | None:
+    """Return ``(score, move)`` from the registered tablebase, or ``None``."""
+    if _tablebase is None:
+        return None
+    return _tablebase.lookup(board, black_to_move)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point used by ``python -m othello.tablebase``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or inspect an endgame tablebase")
+    sub = parser.add_subparsers(dest="command", required=True)
+    make = sub.add_parser("build", help="Solve the late positions of a corpus")
+    make.add_argument("corpus", help="File with one game transcript per line")
+    make.add_argument("output")
+    make.add_argument("--empties", type=int, default=10)
+    make.add_argument("--workers", type=int, default=1)
+    info = sub.add_parser("info", help="Show the size of a tablebase")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        with open(args.corpus) as f:
+            stats = build(f, args.output, args.empties, args.workers)
+        print(
+            f"{stats.games} games, {stats.positions} positions in {stats.seconds:.1f}s: "
+            f"{stats.positions_per_second:,.1f} positions/s, "
+            f"{stats.nodes_per_second:,.0f} nodes/s"
+        )
+    else:
+        table = Tablebase(args.path)
+        print(f"{len(table)} positions with up to {table.empties} empties")
+        table.close()
+
+
+if __name__ == "__main__":
+    main()
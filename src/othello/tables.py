@@ -0,0 +1,65 @@
+"""Precomputed lookup tables cached on disk between runs.
+
+Tables are built on first use and written to a cache directory with
+:mod:`marshal`, so later processes load them instead of rebuilding.  The
+directory defaults to ``~/.cache/othello`` and can be overridden with the
+``OTHELLO_CACHE_DIR`` environment variable.  Tables must consist of plain
+Python values (ints, floats, strings, tuples, lists and dicts).
+"""
+
+from __future__ import annotations
+import marshal
+import os
+from typing import Any, Callable
+
+CACHE_ENV = "OTHELLO_CACHE_DIR"
+
+_loaded: dict[tuple[str, int], Any] = {}
+
+
+def cache_dir() -> str:
+    """Return the directory used for cached tables."""
+    path = os.environ.get(CACHE_ENV)
+    if path:
+        return path
+    return os.path.join(os.path.expanduser("~"), ".cache", "othello")
+
+
+def table_path(name: str, version: int) -> str:
+    """Return the cache file used for table ``name`` at ``version``."""
+    return os.path.join(cache_dir(), f"{name}-v{version}.marshal")
+
+
+def load_table(name: str, version: int, build: Callable[[], Any]) -> Any:
+    """Return table ``name``, building and caching it if needed.
+
+    ``version`` must be bumped whenever ``build`` changes so stale cache
+    files are ignored.  Failing to read or write the cache is not an error;
+    the table is simply rebuilt.
+    """
+    key = (name, version)
+    if key in _loaded:
+        return _loaded[key]
+    path = table_path(name, version)
+    try:
+        # Reading the whole file first is several times faster than
+        # ``marshal.load``, which reads the file object piecemeal.
+        with open(path, "rb") as f:
+            table = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        table = build()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                marshal.dump(table, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    _loaded[key] = table
+    return table
+
+
+def clear_loaded() -> None:
+    """Forget tables loaded in this process (the disk cache is kept)."""
+    _loaded.clear()
@@ -0,0 +1,53 @@
+"""Game and position generators shared by the tests."""
+
+import random
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import choose_move, random_playout
+from othello.board import BitBoard
+from othello.game import Game
+
+
+def sample_positions(count: int, seed: int = 0) -> list[tuple[BitBoard, bool]]:
+    """Return ``count`` consecutive positions of random games."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        for position in random_playout(rng):
+            positions.append(position)
+            if len(positions) == count:
+                break
+    return positions
+
+
+def random_position(seed: int, plies: int) -> tuple[BitBoard, bool]:
+    """Return the position after ``plies`` random plies from the start."""
+    for position in random_playout(random.Random(seed), plies=plies):
+        pass
+    return position
+
+
+def self_play(seed: int) -> Game:
+    """Return a finished game between two ``"easy"`` AIs."""
+    rng = random.Random(seed)
+    game = Game()
+    while True:
+        move = choose_move(game.board, game.black_to_move, rng=rng)
+        if move == 0:
+            game.pass_turn()
+            if game.legal_moves() == 0:
+                return game
+            continue
+        game.apply_move(move)
+
+
+def play_random(game: Game, plies: int, rng: random.Random) -> None:
+    """Play ``plies`` random moves or passes on ``game``."""
+    for _ in range(plies):
+        move = choose_move(game.board, game.black_to_move, rng=rng)
+        if move == 0:
+            game.pass_turn()
+        else:
+            game.apply_move(move)
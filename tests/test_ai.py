@@ -81,13 +81,13 @@ def test_ai_vs_ai_respects_difficulty(monkeypatch):
     rows = list(reversed(str(start_board).splitlines()))
     mirrored = BitBoard.from_ascii("\n".join(rows))
 
-    def fake_initial():
+    def fake_initial(size=8):
         return mirrored
 
     moves = []
 
-    def capture_move(board, black_to_move, level="easy"):
-        move = choose_move(board, black_to_move, level=level)
+    def capture_move(board, black_to_move, level="easy", rng=None):
+        move = choose_move(board, black_to_move, level=level, rng=rng)
         moves.append((level, move))
         raise StopIteration
 
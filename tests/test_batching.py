@@ -0,0 +1,127 @@
+import random
+import sys, os
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello import kernel
+from othello.ai import choose_move
+from othello.batching import BatchScheduler, choose_moves
+from othello.board import BitBoard
+
+from conftest import sample_positions
+
+
+def requests(positions, levels):
+    return [
+        (board, black, levels[i % len(levels)], random.Random(i))
+        for i, (board, black) in enumerate(positions)
+    ]
+
+
+@pytest.mark.parametrize(
+    "use_numpy",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not kernel.HAVE_NUMPY, reason="NumPy not installed"),
+        ),
+    ],
+)
+@pytest.mark.parametrize("levels", [["easy"], ["hard"], ["expert"], ["easy", "hard", "expert"]])
+def test_choose_moves_matches_choose_move(use_numpy, levels):
+    positions = sample_positions(300)
+    expected = [
+        choose_move(board, black, level=level, rng=rng)
+        for board, black, level, rng in requests(positions, levels)
+    ]
+    assert choose_moves(requests(positions, levels), use_numpy) == expected
+
+
+def test_choose_moves_passes_other_boards_through():
+    no_moves = BitBoard.from_ascii("\n".join(["B" * 8] * 8))
+    small = BitBoard.initial(6)
+    batch = [
+        (BitBoard.initial(), True, "master", None),
+        (small, True, "hard", random.Random(1)),
+        (no_moves, False, "expert", None),
+    ]
+    moves = choose_moves(batch)
+    assert moves[0] == choose_move(BitBoard.initial(), True, level="master")
+    assert moves[1] == choose_move(small, True, level="hard", rng=random.Random(1))
+    assert moves[2] == 0
+
+
+def test_scheduler_batches_turns_from_many_threads():
+    positions = sample_positions(64)
+    expected = [
+        choose_move(board, black, level="expert", rng=random.Random(i))
+        for i, (board, black) in enumerate(positions)
+    ]
+    results = [None] * len(positions)
+    with BatchScheduler(batch_size=16, max_wait=0.05) as scheduler:
+
+        def play(i: int) -> None:
+            board, black = positions[i]
+            results[i] = scheduler.choose_move(board, black, "expert", random.Random(i))
+
+        threads = [threading.Thread(target=play, args=(i,)) for i in range(len(positions))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert results == expected
+    assert scheduler.requests == len(positions)
+    assert scheduler.batches < len(positions)
+
+
+def test_scheduler_flushes_partial_batches_after_max_wait():
+    with BatchScheduler(batch_size=1000, max_wait=0.01) as scheduler:
+        future = scheduler.submit(BitBoard.initial(), True, "hard", random.Random(0))
+        assert future.result(timeout=5) == choose_move(
+            BitBoard.initial(), True, level="hard", rng=random.Random(0)
+        )
+
+
+def test_stop_answers_waiting_turns():
+    scheduler = BatchScheduler(batch_size=1000, max_wait=60)
+    scheduler.start()
+    futures = [scheduler.submit(BitBoard.initial(), True) for _ in range(3)]
+    scheduler.stop()
+    assert all(f.done() for f in futures)
+    with pytest.raises(RuntimeError):
+        scheduler.submit(BitBoard.initial(), True)
+
+
+def test_submit_during_stop_is_rejected(monkeypatch):
+    import time
+
+    from othello import batching
+
+    release = threading.Event()
+    real = batching.choose_moves
+
+    def slow_choose_moves(requests, use_numpy=None):
+        release.wait(5)
+        return real(requests, use_numpy)
+
+    monkeypatch.setattr(batching, "choose_moves", slow_choose_moves)
+    scheduler = BatchScheduler(batch_size=1, max_wait=0)
+    scheduler.start()
+    busy = scheduler.submit(BitBoard.initial(), True)
+    stopper = threading.Thread(target=scheduler.stop)
+    stopper.start()
+    deadline = time.time() + 5
+    while not scheduler._stopping and time.time() < deadline:
+        time.sleep(0.001)
+    try:
+        with pytest.raises(RuntimeError):
+            scheduler.submit(BitBoard.initial(), True)
+    finally:
+        release.set()
+        stopper.join(5)
+    assert busy.result(timeout=5)
+    assert not stopper.is_alive()
@@ -0,0 +1,120 @@
+import socket
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello import network
+from othello.board import format_move, parse_move
+from othello.broadcast import Broadcaster, decode_snapshot, encode_snapshot
+from othello.game import Game
+
+
+def connect(address) -> socket.socket:
+    sock = socket.create_connection(address, timeout=5)
+    return sock
+
+
+def play(game: Game, broadcaster: Broadcaster, squares: str) -> None:
+    for square in squares.split():
+        game.apply_move(parse_move(square))
+        broadcaster.publish(game, f"MOVE {square}")
+
+
+def test_snapshot_round_trip():
+    game = Game()
+    game.apply_move(parse_move("f5"))
+    game.apply_move(parse_move("d6"))
+    board, black_to_move, moves = decode_snapshot(encode_snapshot(game).decode())
+    assert board == game.board
+    assert black_to_move is True
+    assert [format_move(m) for m in moves] == ["f5", "d6"]
+
+
+def test_spectators_receive_moves_and_late_joiner_gets_snapshot():
+    broadcaster = Broadcaster()
+    address = broadcaster.start()
+    try:
+        early = connect(address)
+        assert network.recv_line(early).startswith("SNAPSHOT")
+        game = Game()
+        play(game, broadcaster, "f5 d6")
+        assert network.recv_line(early) == "MOVE f5"
+        assert network.recv_line(early) == "MOVE d6"
+
+        late = connect(address)
+        board, black_to_move, moves = decode_snapshot(network.recv_line(late))
+        assert board == game.board and black_to_move
+        assert len(moves) == 2
+
+        play(game, broadcaster, "c3")
+        broadcaster.publish(game, "END 3 3")
+        for sock in (early, late):
+            assert network.recv_line(sock) == "MOVE c3"
+            assert network.recv_line(sock) == "END 3 3"
+        early.close()
+        late.close()
+    finally:
+        broadcaster.stop()
+
+
+def test_slow_spectator_is_resynced_then_dropped():
+    broadcaster = Broadcaster(queue_size=1, max_resyncs=1)
+    address = broadcaster.start()
+    game = Game()
+
+    def burst(squares):
+        # Running the fan-out on the loop without yielding in between
+        # overflows the one-line queue deterministically.
+        def run():
+            for square in squares:
+                game.apply_move(parse_move(square))
+                broadcaster._fan_out(f"MOVE {square}\n".encode(), encode_snapshot(game))
+
+        broadcaster._loop.call_soon_threadsafe(run)
+
+    try:
+        sock = connect(address)
+        network.recv_line(sock)
+        burst(["f5", "d6"])
+        board, black_to_move, _ = decode_snapshot(network.recv_line(sock))
+        assert board == game.board and black_to_move
+        assert broadcaster.resyncs == 1
+
+        burst(["c3", "d3"])
+        assert sock.recv(1) == b""
+        assert broadcaster.dropped == 1
+        sock.close()
+    finally:
+        broadcaster.stop()
+
+
+def test_spectator_stalled_in_drain_is_dropped_and_closed():
+    import time
+
+    broadcaster = Broadcaster(queue_size=1000, max_resyncs=0)
+    address = broadcaster.start()
+    game = Game()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect(address)
+    try:
+        network.recv_line(sock)
+        # Never read again: large lines fill the socket buffers until the
+        # handler blocks in ``drain()`` with the rest still queued.
+        big = "X" * (1 << 16)
+        for _ in range(200):
+            broadcaster.publish(game, big)
+        time.sleep(0.5)
+        (spectator,) = broadcaster._connections
+        assert not spectator.task.done()
+        for _ in range(1000):
+            broadcaster.publish(game, "PASS")
+        deadline = time.time() + 2
+        while broadcaster._connections and time.time() < deadline:
+            time.sleep(0.01)
+        assert broadcaster.dropped == 1
+        assert not broadcaster._connections
+        assert spectator.task.done()
+    finally:
+        sock.close()
+        broadcaster.stop()
@@ -0,0 +1,79 @@
+import random
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from othello.ai import choose_move
+from othello.board import BitBoard, set_move_cache
+from othello.cache import MoveCache
+from othello.game import Game
+
+
+def test_cache_evicts_least_recently_used():
+    cache = MoveCache(max_entries=2)
+    cache.put((1, 2), 10)
+    cache.put((3, 4), 20)
+    assert cache.get((1, 2)) == 10
+    cache.put((5, 6), 30)
+    assert len(cache) == 2
+    assert cache.get((3, 4)) is None
+    assert cache.get((1, 2)) == 10
+    assert cache.evictions == 1
+    assert cache.hits == 2 and cache.misses == 1
+
+
+def test_cache_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        MoveCache(max_entries=0)
+
+
+def test_cached_self_play_matches_uncached():
+    def play() -> list[BitBoard]:
+        random.seed(3)
+        game = Game()
+        boards = []
+        while True:
+            move = choose_move(game.board, game.black_to_move, level="hard")
+            if move == 0:
+                game.black_to_move = not game.black_to_move
+                if game.legal_moves() == 0:
+                    break
+                continue
+            game.apply_move(move)
+            boards.append(game.board)
+        return boards
+
+    expected = play()
+    cache = MoveCache()
+    previous = set_move_cache(cache)
+    try:
+        assert play() == expected
+    finally:
+        set_move_cache(previous)
+    assert cache.hits > 0
+    assert 0.0 < cache.hit_rate < 1.0
+
+
+def test_cache_shared_between_threads():
+    import threading
+
+    cache = MoveCache(max_entries=8)
+    errors = []
+
+    def worker(offset: int) -> None:
+        try:
+            for i in range(20000):
+                key = (offset, i % 16)
+                if cache.get(key) is None:
+                    cache.put(key, i)
+        except Exception as e:  # pragma: no cover - only on failure
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n % 2,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(cache) <= 8
@@ -0,0 +1,94 @@
+import sys, os
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.board import BitBoard
+from othello.engine import Engine
+
+
+def wait_for_ponder(engine: Engine, depth: int, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while engine.ponder_depth < depth and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_transposition_table_survives_between_moves():
+    engine = Engine(depth=4)
+    board = BitBoard.initial()
+    engine.choose_move(board, True)
+    assert engine.searcher.tt
+    first = engine.searcher.nodes
+    engine.choose_move(board, True)
+    assert engine.searcher.nodes - first < first // 2
+
+
+def test_ponder_hit_answers_without_searching():
+    engine = Engine(depth=3)
+    board = BitBoard.initial()
+    move = engine.choose_move(board, True)
+    board = board.apply_move(move, True)
+    predicted = engine.searcher.tt_move(board, False)
+    assert predicted
+    engine.ponder(board, False)
+    wait_for_ponder(engine, 3)
+    board = board.apply_move(predicted, False)
+    reply = engine.choose_move(board, True)
+    assert engine.ponder_hits == 1
+    assert engine.last_depth >= 3
+    assert reply & board.legal_moves(board.black, board.white)
+
+
+def test_ponder_miss_still_returns_legal_move():
+    engine = Engine(depth=3)
+    board = BitBoard.initial()
+    board = board.apply_move(engine.choose_move(board, True), True)
+    predicted = engine.searcher.tt_move(board, False)
+    engine.ponder(board, False)
+    legal = board.legal_moves(board.white, board.black)
+    other = (legal & ~predicted) & -(legal & ~predicted)
+    board = board.apply_move(other, False)
+    reply = engine.choose_move(board, True)
+    assert engine.ponder_misses == 1
+    assert reply & board.legal_moves(board.black, board.white)
+
+
+def test_cheap_levels_delegate_to_choose_move():
+    engine = Engine("hard")
+    board = BitBoard.initial()
+    engine.ponder(board, True)
+    assert engine.choose_move(board, True) & board.legal_moves(board.black, board.white)
+
+
+def test_timed_ponder_hit_answers_without_searching():
+    engine = Engine(time_limit=0.2)
+    board = BitBoard.initial()
+    move = engine.choose_move(board, True)
+    board = board.apply_move(move, True)
+    predicted = engine.searcher.tt_move(board, False)
+    assert predicted
+    engine.ponder(board, False)
+    wait_for_ponder(engine, engine.last_depth + 1)
+    board = board.apply_move(predicted, False)
+    start = time.perf_counter()
+    reply = engine.choose_move(board, True)
+    assert time.perf_counter() - start < 0.1
+    assert engine.ponder_hits == 1
+    assert reply & board.legal_moves(board.black, board.white)
+
+
+def test_timed_shallow_ponder_hit_keeps_deepening():
+    engine = Engine(time_limit=0.2)
+    board = BitBoard.initial()
+    board = board.apply_move(engine.choose_move(board, True), True)
+    predicted = engine.searcher.tt_move(board, False)
+    # Pretend the previous timed search reached further than pondering will.
+    engine._timed_depth = 60
+    engine.ponder(board, False)
+    wait_for_ponder(engine, 1)
+    board = board.apply_move(predicted, False)
+    nodes = engine.searcher.nodes
+    reply = engine.choose_move(board, True)
+    assert engine.ponder_hits == 1
+    assert engine.searcher.nodes > nodes
+    assert reply & board.legal_moves(board.black, board.white)
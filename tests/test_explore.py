@@ -0,0 +1,68 @@
+import sys, os
+from collections import Counter
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.board import BitBoard, parse_move
+from othello.explore import export, export_parallel, read_binary, walk
+
+
+def test_walk_matches_perft():
+    counts = Counter(node[0] for node in walk(depth=5))
+    assert [counts[d] for d in range(6)] == [1, 4, 12, 56, 244, 1396]
+
+
+def test_nodes_describe_positions():
+    nodes = list(walk(depth=2))
+    depth, black, white, black_to_move, move, legal = nodes[1]
+    board = BitBoard.initial().apply_move(move, True)
+    assert (depth, black, white, black_to_move) == (1, board.black, board.white, False)
+    assert legal == board.legal_moves(board.white, board.black).bit_count()
+
+
+def test_passes_count_as_a_ply():
+    board = BitBoard.from_ascii("\n".join(["WB......"] + ["........"] * 7))
+    nodes = list(walk(board, True, depth=5))
+    assert [(n[0], n[3], n[4], n[5]) for n in nodes] == [
+        (0, True, 0, 0),
+        (1, False, 0, 1),
+        (2, True, parse_move("c1"), 0),
+    ]
+
+
+def test_dedup_skips_transpositions():
+    full = Counter(node[0] for node in walk(depth=6))
+    nodes = list(walk(depth=6, dedup=1 << 16))
+    keys = [(n[1], n[2], n[3]) for n in nodes]
+    assert len(keys) == len(set(keys))
+    assert len(nodes) < sum(full.values())
+    bounded = list(walk(depth=6, dedup=16))
+    assert len(nodes) <= len(bounded) <= sum(full.values())
+
+
+def test_binary_and_csv_exports(tmp_path):
+    path = str(tmp_path / "tree.bin")
+    assert export(path, depth=4) == 317
+    assert list(read_binary(path)) == list(walk(depth=4))
+    csv_path = str(tmp_path / "tree.csv")
+    assert export(csv_path, depth=2, fmt="csv") == 17
+    with open(csv_path) as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "depth,black,white,to_move,move,legal"
+    assert lines[2].startswith("1,") and lines[2].endswith(",W,e6,3")
+    with pytest.raises(ValueError):
+        export(path, BitBoard.initial(6), depth=1)
+
+
+def test_parallel_parts_cover_the_tree(tmp_path):
+    path = str(tmp_path / "tree.bin")
+    parts = export_parallel(path, depth=4, processes=2)
+    assert len(parts) == 4
+    nodes = []
+    for part, count in parts:
+        part_nodes = list(read_binary(part))
+        assert len(part_nodes) == count
+        nodes.extend(part_nodes[1:])
+    assert sorted(nodes) == sorted(list(walk(depth=4))[1:])
@@ -0,0 +1,116 @@
+import random
+import sys, os
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.board import BitBoard, board_geometry, format_move, parse_move
+from othello.game import load_state, save_state
+
+
+def naive_legal_moves(board: BitBoard, player: int, opponent: int) -> int:
+    """Square-by-square reference implementation used to check bitboards."""
+    size = board.size
+    total = size * size
+
+    def bit(r: int, c: int) -> int:
+        return 1 << (total - 1 - (r * size + c))
+
+    moves = 0
+    for r in range(size):
+        for c in range(size):
+            if (player | opponent) & bit(r, c):
+                continue
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if dr == dc == 0:
+                        continue
+                    rr, cc, seen = r + dr, c + dc, 0
+                    while 0 <= rr < size and 0 <= cc < size and opponent & bit(rr, cc):
+                        rr, cc, seen = rr + dr, cc + dc, seen + 1
+                    if seen and 0 <= rr < size and 0 <= cc < size and player & bit(rr, cc):
+                        moves |= bit(r, c)
+    return moves
+
+
+def perft(board: BitBoard, black_to_move: bool, depth: int, passed: bool = False) -> int:
+    if depth == 0:
+        return 1
+    player = board.black if black_to_move else board.white
+    opponent = board.white if black_to_move else board.black
+    legal = board.legal_moves(player, opponent)
+    if not legal:
+        if passed:
+            return 1
+        return perft(board, not black_to_move, depth - 1, True)
+    nodes = 0
+    while legal:
+        move = legal & -legal
+        legal ^= move
+        nodes += perft(board.apply_move(move, black_to_move), not black_to_move, depth - 1)
+    return nodes
+
+
+def test_perft_standard_board():
+    board = BitBoard.initial()
+    assert [perft(board, True, d) for d in range(1, 6)] == [4, 12, 56, 244, 1396]
+
+
+@pytest.mark.parametrize("size", [4, 6, 8, 10, 16])
+def test_legal_moves_match_reference(size):
+    rng = random.Random(size)
+    for _ in range(50):
+        cells = [rng.choice("BW..") for _ in range(size * size)]
+        diagram = "\n".join(
+            "".join(cells[r * size:(r + 1) * size]) for r in range(size)
+        )
+        board = BitBoard.from_ascii(diagram)
+        for player, opponent in ((board.black, board.white), (board.white, board.black)):
+            assert board.legal_moves(player, opponent) == naive_legal_moves(
+                board, player, opponent
+            )
+
+
+def test_initial_6x6():
+    board = BitBoard.initial(6)
+    expected = BitBoard.from_ascii(
+        """
+......
+......
+..WB..
+..BW..
+......
+......
+"""
+    )
+    assert board == expected
+    assert board.legal_moves(board.black, board.white).bit_count() == 4
+
+
+def test_apply_move_keeps_size():
+    board = BitBoard.initial(10)
+    move = parse_move("e4", 10)
+    assert board.legal_moves(board.black, board.white) & move
+    assert board.apply_move(move, True).size == 10
+
+
+def test_parse_and_format_two_digit_rows():
+    move = parse_move("j10", 10)
+    assert move == 1
+    assert format_move(move, 10) == "j10"
+    assert format_move(parse_move("d3")) == "d3"
+    with pytest.raises(ValueError):
+        parse_move("i9", 8)
+
+
+@pytest.mark.parametrize("size", [3, 5, 18])
+def test_invalid_sizes_rejected(size):
+    with pytest.raises(ValueError):
+        board_geometry(size)
+
+
+def test_save_load_non_standard_size(tmp_path):
+    board = BitBoard.initial(6)
+    path = tmp_path / "game.sav"
+    save_state(board, False, path)
+    assert load_state(path) == (board, False)
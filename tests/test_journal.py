@@ -0,0 +1,130 @@
+import sys, os
+import random
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.board import BitBoard
+from othello.game import Game
+from othello.journal import RECORD_SIZE, Journal, recover
+
+from conftest import play_random
+
+
+def assert_same(a: Game, b: Game) -> None:
+    assert a.board == b.board
+    assert a.black_to_move == b.black_to_move
+    assert a.history == b.history
+    assert a.future == b.future
+
+
+def test_recover_replays_moves_undo_redo_and_pass(tmp_path):
+    path = str(tmp_path / "game")
+    game = Journal(path, sync_every=1, snapshot_every=5).attach(Game())
+    rng = random.Random(1)
+    play_random(game, 12, rng)
+    game.undo()
+    game.undo()
+    game.redo()
+    game.pass_turn()
+    game.pass_turn()
+    play_random(game, 3, rng)
+    game.undo()
+    # Simulate a crash: the journal is never closed.
+    assert_same(recover(path), game)
+
+
+def test_recovery_reads_only_the_journal_tail(tmp_path):
+    path = str(tmp_path / "game")
+    journal = Journal(path, sync_every=1, snapshot_every=8)
+    game = journal.attach(Game())
+    play_random(game, 20, random.Random(2))
+    for _ in range(200):
+        game.undo()
+        game.redo()
+    journal.close()
+    log_size = os.path.getsize(f"{path}.log")
+    assert log_size == RECORD_SIZE * 420
+    assert journal.snapshots > 1
+    assert_same(recover(path), game)
+
+
+def test_torn_record_is_ignored_and_journal_continues(tmp_path):
+    path = str(tmp_path / "game")
+    journal = Journal(path, sync_every=1)
+    game = journal.attach(Game())
+    play_random(game, 4, random.Random(3))
+    journal.close()
+    with open(f"{path}.log", "ab") as f:
+        f.write(b"\x01")
+    recovered = recover(path)
+    assert_same(recovered, game)
+
+    journal = Journal(path, sync_every=1)
+    journal.attach(recovered)
+    play_random(recovered, 4, random.Random(4))
+    journal.close()
+    assert_same(recover(path), recovered)
+
+
+def test_reset_is_snapshotted(tmp_path):
+    path = str(tmp_path / "game")
+    journal = Journal(path)
+    game = journal.attach(Game())
+    play_random(game, 6, random.Random(5))
+    board = BitBoard.initial(6)
+    game.reset(board, False)
+    journal.close()
+    recovered = recover(path)
+    assert recovered.board == board
+    assert recovered.black_to_move is False
+    assert recovered.history == [(board, False)]
+
+
+def test_unsynced_records_are_written_on_close(tmp_path):
+    path = str(tmp_path / "game")
+    journal = Journal(path, sync_every=100, snapshot_every=100)
+    game = journal.attach(Game())
+    play_random(game, 5, random.Random(6))
+    assert journal.syncs == 0
+    journal.close()
+    assert_same(recover(path), game)
+
+
+def test_discard_removes_journal_files(tmp_path):
+    from othello.journal import exists
+
+    path = str(tmp_path / "game")
+    journal = Journal(path)
+    game = journal.attach(Game())
+    game.apply_move(game.legal_moves() & -game.legal_moves())
+    assert exists(path)
+    journal.discard()
+    assert not exists(path)
+    assert not os.path.exists(journal.log_path)
+
+
+def test_finished_cli_game_does_not_resume(tmp_path, capsys):
+    from othello.cli import run_game
+    from othello.journal import exists
+
+    path = str(tmp_path / "game")
+    first = run_game(ai_vs_ai=True, size=4, seed=1, journal=path)
+    assert not exists(path)
+    second = run_game(ai_vs_ai=True, size=4, seed=1, journal=path)
+    assert second == first
+    assert "Resumed" not in capsys.readouterr().out
+
+
+def test_resumed_cli_game_keeps_journal_size(tmp_path, capsys):
+    from othello.cli import start_game
+
+    path = str(tmp_path / "game")
+    game = start_game(4, path)
+    game.apply_move(game.legal_moves() & -game.legal_moves())
+    game.journal.close()
+    resumed = start_game(8, path)
+    resumed.journal.close()
+    out = capsys.readouterr().out
+    assert resumed.board == game.board
+    assert "Resumed game from journal" in out
+    assert "ignoring size 8" in out
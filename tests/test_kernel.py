@@ -0,0 +1,102 @@
+import random
+import sys, os
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from array import array
+
+from othello import kernel
+from othello.board import BitBoard
+
+from conftest import sample_positions as random_games
+
+
+def sample_positions(count: int, seed: int = 0) -> list[tuple[int, int]]:
+    """Return positions from random games plus arbitrary random boards."""
+    positions = [
+        (board.black, board.white) if black else (board.white, board.black)
+        for board, black in random_games(count // 2, seed)
+    ]
+    rng = random.Random(seed)
+    while len(positions) < count:
+        cells = rng.getrandbits(64)
+        colours = rng.getrandbits(64)
+        positions.append((cells & colours, cells & ~colours))
+    return positions
+
+
+def reference(positions):
+    board = BitBoard(0, 0)
+    legal = [board.legal_moves(p, o) for p, o in positions]
+    moves = [m & -m if m else 0 for m in legal]
+    flips = [board.flips(m, p, o) for m, (p, o) in zip(moves, positions)]
+    return legal, moves, flips
+
+
+def test_pack_round_trip():
+    positions = sample_positions(10)
+    assert kernel.unpack(kernel.pack(positions)) == positions
+
+
+@pytest.mark.parametrize(
+    "use_numpy",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not kernel.HAVE_NUMPY, reason="NumPy not installed"),
+        ),
+    ],
+)
+def test_batch_matches_bitboard(use_numpy):
+    positions = sample_positions(400)
+    packed = kernel.pack(positions)
+    legal, moves, flips = reference(positions)
+    assert list(kernel.batch_legal_moves(packed, use_numpy)) == legal
+    move_array = array("Q", moves)
+    assert list(kernel.batch_flips(packed, move_array, use_numpy)) == flips
+    applied = kernel.unpack(kernel.batch_apply(packed, move_array, use_numpy))
+    expected = [
+        (o ^ f, p | m | f) for (p, o), m, f in zip(positions, moves, flips)
+    ]
+    assert applied == expected
+
+
+def test_batch_flips_length_mismatch():
+    packed = kernel.pack(sample_positions(4))
+    with pytest.raises(ValueError):
+        kernel.batch_flips(packed, array("Q", [0]))
+
+
+@pytest.mark.skipif(kernel.HAVE_NUMPY, reason="NumPy is installed")
+def test_forcing_numpy_without_it_fails():
+    with pytest.raises(RuntimeError):
+        kernel.batch_legal_moves(kernel.pack([(1, 2)]), use_numpy=True)
+
+
+@pytest.mark.parametrize(
+    "use_numpy",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(not kernel.HAVE_NUMPY, reason="NumPy not installed"),
+        ),
+    ],
+)
+def test_expand_and_score_match_reference(use_numpy):
+    from othello.evaluate import positional
+
+    positions = sample_positions(200)
+    packed = kernel.pack(positions)
+    legal = kernel.batch_legal_moves(packed, use_numpy)
+    index, candidates, moves = kernel.batch_expand(packed, legal, use_numpy)
+    expected = [
+        (i, 1 << b) for i, mask in enumerate(legal) for b in range(64) if mask >> b & 1
+    ]
+    assert list(zip(index, moves)) == expected
+    assert kernel.unpack(candidates) == [positions[i] for i, _ in expected]
+    values = array("Q", [p for p, _ in positions])
+    assert list(kernel.batch_popcount(values, use_numpy)) == [v.bit_count() for v in values]
+    assert list(kernel.batch_positional(values, use_numpy)) == [positional(v) for v in values]
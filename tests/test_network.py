@@ -11,3 +11,53 @@ def test_send_recv_line():
     assert network.recv_line(s2) == "hello"
     s1.close()
     s2.close()
+
+
+def play_network(monkeypatch, black: dict, white: dict):
+    """Play an AI-vs-AI network game over a socket pair; return the final board."""
+    import threading
+
+    from othello.cli import run_network_game
+
+    host_sock, join_sock = socket.socketpair()
+    monkeypatch.setattr(network, "host_game", lambda h, p: host_sock)
+    monkeypatch.setattr(network, "join_game", lambda h, p: join_sock)
+    boards = {}
+
+    def side(name: str, kwargs: dict) -> None:
+        boards[name] = run_network_game(ai_level="easy", **kwargs)
+
+    threads = [
+        threading.Thread(target=side, args=("black", {"host": "x:1", **black})),
+        threading.Thread(target=side, args=("white", {"connect": "x:1", **white})),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    host_sock.close()
+    join_sock.close()
+    assert boards["black"] == boards["white"]
+    return boards["black"]
+
+
+def test_seeded_network_ai_games_are_reproducible(monkeypatch):
+    first = play_network(monkeypatch, {"seed": 1}, {"seed": 2})
+    assert play_network(monkeypatch, {"seed": 1}, {"seed": 2}) == first
+
+
+def test_network_game_journal_is_removed_when_finished(monkeypatch, tmp_path):
+    from othello import journal
+
+    discarded = []
+    discard = journal.Journal.discard
+
+    def record(self) -> None:
+        discarded.append(self.path)
+        discard(self)
+
+    monkeypatch.setattr(journal.Journal, "discard", record)
+    black, white = str(tmp_path / "black"), str(tmp_path / "white")
+    play_network(monkeypatch, {"journal": black}, {"journal": white})
+    assert sorted(discarded) == [black, white]
+    assert not journal.exists(black) and not journal.exists(white)
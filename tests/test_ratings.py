@@ -0,0 +1,124 @@
+import sys, os
+import random
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.game import Game
+from othello.ratings import (
+    INITIAL_RATING,
+    GameResult,
+    RatingStore,
+    expected_score,
+    format_leaderboard,
+    glicko_update,
+)
+from othello.replay import format_record, game_record
+
+from conftest import self_play
+
+
+def test_glicko_update_moves_ratings_towards_result():
+    rating, rd = glicko_update(1500, 200, 1500, 200, 1.0)
+    assert rating > 1500
+    assert rd < 200
+    loser, _ = glicko_update(1500, 200, 1500, 200, 0.0)
+    assert loser == pytest.approx(3000 - rating)
+    assert expected_score(1700, 1500) > 0.5
+
+
+def test_record_game_updates_players_and_history():
+    with RatingStore() as store:
+        first = store.record_game("alice", "bob", 40, 24, "f5d6")
+        second = store.record_game("bob", "alice", 32, 32)
+        assert second == first + 1
+        alice = store.player("alice")
+        assert (alice.games, alice.wins, alice.losses, alice.draws) == (2, 1, 0, 1)
+        assert alice.rating > INITIAL_RATING > store.player("bob").rating
+        history = store.history("alice")
+        assert [h["game"] for h in history] == [second, first]
+        assert history[0]["color"] == "W"
+        assert history[0]["opponent"] == "bob"
+        assert history[1]["discs"] == (40, 24)
+        assert history[0]["rating"] == alice.rating
+        assert store.player("carol") is None
+
+
+def test_batched_insert_matches_single_inserts(tmp_path):
+    rng = random.Random(1)
+    names = [f"p{i}" for i in range(20)]
+    games = []
+    for _ in range(300):
+        black, white = rng.sample(names, 2)
+        b = rng.randrange(65)
+        games.append(GameResult(black, white, b, 64 - b))
+    with RatingStore() as one, RatingStore(str(tmp_path / "r.db")) as many:
+        for game in games:
+            one.record_game(game.black, game.white, game.black_discs, game.white_discs)
+        assert many.record_games(games, batch_size=64) == 300
+        for name in names:
+            assert many.player(name) == one.player(name)
+        top = many.top(5)
+        assert [p.rating for p in top] == sorted((p.rating for p in top), reverse=True)
+        assert top == one.top(5)
+        assert "p" in format_leaderboard(top)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_import_logs_scores_games_from_transcripts(processes):
+    lines = ["# played\tblack\twhite\tmoves", ""]
+    finals = []
+    for seed in range(6):
+        game = self_play(seed)
+        finals.append(game.board)
+        lines.append(f"{1000 + seed}\ta\tb\t{format_record(game_record(game))}")
+    with RatingStore() as store:
+        assert store.import_logs(lines, processes=processes, batch_size=4) == 6
+        history = store.history("a", limit=100)
+        assert len(history) == 6
+        for entry, board in zip(reversed(history), finals):
+            assert entry["discs"] == (board.black.bit_count(), board.white.bit_count())
+        assert history[-1]["played"] == 1000
+
+
+def test_same_player_on_both_sides_is_rejected_or_skipped():
+    with RatingStore() as store:
+        with pytest.raises(ValueError):
+            store.record_game("a", "a", 40, 24)
+        assert store.player("a") is None
+        moves = format_record(game_record(self_play(0)))
+        lines = [f"1\ta\tb\t{moves}", f"2\ta\ta\t{moves}", f"3\tb\ta\t{moves}"]
+        assert store.import_logs(lines, batch_size=10) == 2
+        assert store.skipped == 1
+        assert store.player("a").games == 2
+
+
+def test_cli_records_only_games_from_the_initial_position(tmp_path, capsys):
+    from othello.cli import record_result
+
+    path = str(tmp_path / "results.db")
+    game = self_play(1)
+    record_result(path, ("a", "b"), game)
+    loaded = Game()
+    loaded.reset(*game.history[5])
+    record_result(path, ("a", "b"), loaded)
+    assert "initial position" in capsys.readouterr().out
+    with RatingStore(path) as store:
+        assert store.player("a").games == 1
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_import_logs_skips_corrupt_lines(processes):
+    moves = format_record(game_record(self_play(0)))
+    lines = [
+        f"1\ta\tb\t{moves}",
+        "2\ta\tb\tf5a1",
+        "3\ta\tb",
+        f"later\ta\tb\t{moves}",
+        f"5\tb\ta\t{moves}",
+    ]
+    with RatingStore() as store:
+        assert store.import_logs(lines, processes=processes, batch_size=1) == 2
+        assert store.skipped == 3
+        assert store.player("a").games == 2
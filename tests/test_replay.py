@@ -0,0 +1,81 @@
+import sys, os
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.board import parse_move
+from othello.replay import (
+    ReplayStats,
+    collect_stats,
+    final_position,
+    format_record,
+    game_record,
+    parse_record,
+    replay,
+)
+
+from conftest import self_play
+
+
+def test_record_round_trip():
+    moves = parse_record("f5d6c3")
+    assert moves == [parse_move("f5"), parse_move("d6"), parse_move("c3")]
+    assert format_record(moves) == "f5d6c3"
+
+
+def test_replay_matches_game_history():
+    game = self_play(1)
+    moves = game_record(game)
+    boards = [position for position, *_ in replay(moves)]
+    assert boards == [board for board, _ in game.history[:-1]]
+
+
+def test_replay_rejects_illegal_move():
+    with pytest.raises(ValueError):
+        list(replay(parse_record("a1")))
+
+
+def test_stats_first_ply():
+    stats = ReplayStats()
+    stats.add_game(parse_record("f5d6c3"))
+    stats.add_game(parse_record("d3c3"))
+    first = stats.summary()[0]
+    assert first["positions"] == 2
+    assert first["mobility"] == 4
+    assert first["black_discs"] == first["white_discs"] == 2
+    assert stats.summary()[2]["positions"] == 1
+
+
+def test_passes_and_corners_are_counted():
+    passes = corners = 0
+    stats = ReplayStats()
+    for seed in range(40):
+        game = self_play(seed)
+        moves = game_record(game)
+        stats.add_game(moves)
+        corners += sum(1 for m in moves if m & 0x8100000000000081)
+        for (board, black), (_, next_black) in zip(game.history, game.history[1:]):
+            passes += black == next_black
+    assert passes > 0
+    assert sum(stats.passes) == passes
+    assert sum(stats.corner_captures) == corners
+
+
+def test_collect_stats_merges_chunks():
+    records = [game_record(self_play(seed)) for seed in range(5)]
+    single = collect_stats(records, chunk_size=100)
+    chunked = collect_stats(iter(records), chunk_size=2)
+    assert single == chunked
+    assert single.games == 5
+    assert single.positions[0] == 5
+
+
+def test_final_position_matches_game():
+    for seed in range(4):
+        game = self_play(seed)
+        moves = game_record(game)
+        assert final_position(moves) == (game.board, game.history[-1][1])
+        prefix = moves[:7]
+        assert final_position(prefix) == game.history[7]
+    with pytest.raises(ValueError):
+        final_position(parse_record("f5a1"))
@@ -0,0 +1,100 @@
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello.ai import choose_move
+from othello.board import BitBoard
+from othello.search import (
+    DEFAULT_PROBCUT,
+    INF,
+    Searcher,
+    fit_probcut,
+    phase_of,
+    probcut_pair,
+)
+
+from conftest import random_position
+
+
+def minimax(searcher: Searcher, player: int, opponent: int, depth: int, passed=False) -> int:
+    board = searcher._board
+    legal = board.legal_moves(player, opponent)
+    if not legal:
+        if passed:
+            return searcher.negamax(player, opponent, 0, -INF, INF, True)
+        return -minimax(searcher, opponent, player, depth, True)
+    if depth == 0:
+        return searcher.evaluate(player, opponent)
+    best = -INF
+    while legal:
+        move = legal & -legal
+        legal ^= move
+        flips = board.flips(move, player, opponent)
+        best = max(best, -minimax(searcher, opponent ^ flips, player | move | flips, depth - 1))
+    return best
+
+
+def test_alpha_beta_matches_minimax():
+    for seed in range(4):
+        board, black = random_position(seed, 20)
+        searcher = Searcher(probcut=False)
+        _, score = searcher.search(board, black, 3)
+        player = board.black if black else board.white
+        opponent = board.white if black else board.black
+        assert score == minimax(searcher, player, opponent, 3)
+
+
+def test_probcut_searches_fewer_nodes():
+    plain, selective = Searcher(probcut=False), Searcher(probcut=True)
+    for seed in range(3):
+        board, black = random_position(seed, 16)
+        plain.search(board, black, 5)
+        selective.search(board, black, 5)
+    assert selective.probcut_cuts > 0
+    assert selective.nodes < plain.nodes
+
+
+def test_probcut_disabled_per_phase():
+    thresholds = {"opening": None, "midgame": None, "endgame": None}
+    searcher = Searcher(probcut=True, thresholds=thresholds)
+    board, black = random_position(0, 16)
+    searcher.search(board, black, 5)
+    assert searcher.probcut_cuts == 0
+
+
+def test_probcut_only_at_fitted_depth_pairs():
+    board, black = random_position(0, 16)
+    unfitted = Searcher(probcut=True, params={(9, 18): DEFAULT_PROBCUT[probcut_pair(4)]})
+    unfitted.search(board, black, 5)
+    assert unfitted.probcut_cuts == 0
+    fitted = Searcher(probcut=True, params={probcut_pair(4): DEFAULT_PROBCUT[probcut_pair(4)]})
+    fitted.search(board, black, 5)
+    assert fitted.probcut_cuts > 0
+
+
+def test_fit_probcut_keys_models_by_depth_pair():
+    positions = [random_position(seed, 20) for seed in range(12)]
+    fitted = fit_probcut(positions, depths=(3, 4))
+    assert set(fitted) == {probcut_pair(3), probcut_pair(4)} == {(1, 3), (2, 4)}
+    assert all(params.sigma >= 0 for by_phase in fitted.values() for params in by_phase.values())
+
+
+def test_phase_of():
+    assert phase_of(60) == "opening"
+    assert phase_of(30) == "midgame"
+    assert phase_of(10) == "endgame"
+
+
+def test_best_move_respects_time_and_is_legal():
+    board, black = random_position(2, 24)
+    move, _, depth = Searcher().best_move(board, black, time_limit=0.05)
+    player = board.black if black else board.white
+    opponent = board.white if black else board.black
+    assert move & board.legal_moves(player, opponent)
+    assert depth >= 1
+
+
+def test_master_level_returns_legal_move():
+    board = BitBoard.initial()
+    move = choose_move(board, True, level="master")
+    assert move & board.legal_moves(board.black, board.white)
@@ -0,0 +1,125 @@
+import random
+import sys, os
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello import search
+from othello.ai import choose_move
+from othello.board import BitBoard
+from othello.replay import format_record, game_record, parse_record, replay
+from othello.search import DISC_SCORE, Searcher
+from othello.tablebase import (
+    Tablebase,
+    build,
+    canonical,
+    set_tablebase,
+    transform,
+    untransform,
+)
+
+EMPTIES = 6
+
+from conftest import self_play
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return [format_record(game_record(self_play(seed))) for seed in range(6)]
+
+
+@pytest.fixture(scope="module")
+def table(corpus, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("tb") / "endgame.tb")
+    stats = build(corpus, path, EMPTIES)
+    assert stats.games == len(corpus)
+    assert stats.positions > 0
+    assert stats.nodes > 0
+    table = Tablebase(path)
+    yield table
+    table.close()
+
+
+def solve(board: BitBoard, black_to_move: bool) -> int:
+    _, score = Searcher(probcut=False).search(board, black_to_move, board.empty().bit_count())
+    return score // DISC_SCORE
+
+
+def test_symmetries_round_trip_and_share_a_key():
+    rng = random.Random(0)
+    for _ in range(50):
+        player = rng.getrandbits(64)
+        opponent = rng.getrandbits(64) & ~player
+        key = canonical(player, opponent)[:2]
+        for symmetry in range(8):
+            moved = transform(player, symmetry)
+            assert untransform(moved, symmetry) == player
+            assert moved.bit_count() == player.bit_count()
+            assert canonical(moved, transform(opponent, symmetry))[:2] == key
+
+
+def test_lookups_match_exact_search(corpus, table):
+    checked = 0
+    for record in corpus:
+        for board, black, legal, _, _ in replay(parse_record(record)):
+            if board.empty().bit_count() > EMPTIES:
+                continue
+            score, move = table.lookup(board, black)
+            assert score == solve(board, black)
+            assert move & legal
+            assert -solve(board.apply_move(move, black), not black) == score
+            checked += 1
+    assert checked >= len(table)
+
+
+def test_mirrored_positions_are_found(corpus, table):
+    moves = parse_record(corpus[0])
+    board, black = next(
+        (b, black) for b, black, _, _, _ in replay(moves) if b.empty().bit_count() <= EMPTIES
+    )
+    score, move = table.lookup(board, black)
+    mirrored = BitBoard(transform(board.black, 5), transform(board.white, 5))
+    mirrored_score, mirrored_move = table.lookup(mirrored, black)
+    assert mirrored_score == score
+    player = mirrored.black if black else mirrored.white
+    opponent = mirrored.white if black else mirrored.black
+    assert mirrored_move & mirrored.legal_moves(player, opponent)
+    assert table.lookup(BitBoard.initial(), True) is None
+
+
+def test_master_plays_from_the_tablebase(corpus, table, monkeypatch):
+    board, black = next(
+        (b, black)
+        for b, black, _, _, _ in replay(parse_record(corpus[1]))
+        if b.empty().bit_count() <= EMPTIES
+    )
+
+    def no_search(*args, **kwargs):
+        raise AssertionError("searched a tablebase position")
+
+    monkeypatch.setattr(search.Searcher, "search", no_search)
+    set_tablebase(table)
+    try:
+        assert choose_move(board, black, level="master") == table.lookup(board, black)[1]
+    finally:
+        set_tablebase(None)
+
+
+def test_parallel_build_matches(corpus, table, tmp_path):
+    path = str(tmp_path / "parallel.tb")
+    build(corpus, path, EMPTIES, processes=2, chunk_size=4)
+    parallel = Tablebase(path)
+    assert len(parallel) == len(table)
+    for record in corpus:
+        for board, black, _, _, _ in replay(parse_record(record)):
+            if board.empty().bit_count() <= EMPTIES:
+                assert parallel.lookup(board, black)[0] == table.lookup(board, black)[0]
+    parallel.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "bogus.tb"
+    path.write_bytes(b"not a tablebase at all")
+    with pytest.raises(ValueError):
+        Tablebase(str(path))
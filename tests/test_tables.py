@@ -0,0 +1,65 @@
+import subprocess
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from othello import tables
+
+
+def test_table_built_once_and_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv(tables.CACHE_ENV, str(tmp_path))
+    tables.clear_loaded()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"a": (1, 2, 3)}
+
+    assert tables.load_table("demo", 1, build) == {"a": (1, 2, 3)}
+    assert os.path.exists(tables.table_path("demo", 1))
+    tables.clear_loaded()
+    assert tables.load_table("demo", 1, build) == {"a": (1, 2, 3)}
+    assert len(calls) == 1
+    tables.clear_loaded()
+
+
+def test_corrupt_table_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.setenv(tables.CACHE_ENV, str(tmp_path))
+    tables.clear_loaded()
+    with open(tables.table_path("demo", 2), "wb") as f:
+        f.write(b"\x00garbage")
+    assert tables.load_table("demo", 2, lambda: [4, 5]) == [4, 5]
+    tables.clear_loaded()
+
+
+def test_cli_import_does_not_load_ai_or_network():
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+    code = (
+        "import sys, othello.cli; "
+        "print(sorted(m for m in ('othello.ai', 'othello.network', 'socket') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": src},
+    ).stdout
+    assert out.strip() == "[]"
+
+
+def test_large_row_tables_use_disk_cache(tmp_path, monkeypatch):
+    from othello import evaluate
+
+    monkeypatch.setenv(tables.CACHE_ENV, str(tmp_path))
+    tables.clear_loaded()
+    evaluate._row_tables.cache_clear()
+    try:
+        rows = evaluate._row_tables(10)
+        path = tables.table_path("row-weights-10", evaluate.ROW_TABLE_VERSION)
+        assert os.path.exists(path)
+        assert rows == evaluate._build_row_tables(10)
+        assert not os.path.exists(tables.table_path("row-weights-8", evaluate.ROW_TABLE_VERSION))
+    finally:
+        tables.clear_loaded()
+        evaluate._row_tables.cache_clear()